@@ -4,7 +4,7 @@ Browser agent for SuperNova AI.
 
 from typing import Dict, Any, List, Optional
 from .base import BaseAgent
-from ..tools.browser import web_browser
+from ..tools.browser import get_web_browser
 
 class BrowserAgent(BaseAgent):
     """Browser agent that navigates websites and extracts information."""
@@ -24,7 +24,7 @@ class BrowserAgent(BaseAgent):
             A dictionary containing the browsing result
         """
         # Navigate to the URL
-        result = web_browser.navigate(url)
+        result = get_web_browser().navigate(url)
 
         if result["status"] == "error":
             return {
@@ -64,7 +64,7 @@ class BrowserAgent(BaseAgent):
             A dictionary containing the extracted information
         """
         # Navigate to the URL
-        result = web_browser.navigate(url)
+        result = get_web_browser().navigate(url)
 
         if result["status"] == "error":
             return {
@@ -102,7 +102,7 @@ class BrowserAgent(BaseAgent):
             A dictionary containing the interaction result
         """
         # Navigate to the URL
-        result = web_browser.navigate(url)
+        result = get_web_browser().navigate(url)
 
         if result["status"] == "error":
             return {
@@ -124,7 +124,7 @@ class BrowserAgent(BaseAgent):
             if step_type == "click":
                 # Click an element
                 selector = step.get("selector", "")
-                click_result = web_browser.click(selector)
+                click_result = get_web_browser().click(selector)
 
                 interaction_results.append({
                     "step": step,
@@ -138,7 +138,7 @@ class BrowserAgent(BaseAgent):
             elif step_type == "fill":
                 # Fill a form field
                 form_data = {step.get("selector", ""): step.get("value", "")}
-                fill_result = web_browser.fill_form(form_data)
+                fill_result = get_web_browser().fill_form(form_data)
 
                 interaction_results.append({
                     "step": step,
@@ -148,7 +148,7 @@ class BrowserAgent(BaseAgent):
             elif step_type == "submit":
                 # Submit a form
                 selector = step.get("selector", "")
-                submit_result = web_browser.submit_form(selector)
+                submit_result = get_web_browser().submit_form(selector)
 
                 interaction_results.append({
                     "step": step,
@@ -162,7 +162,7 @@ class BrowserAgent(BaseAgent):
             elif step_type == "extract":
                 # Extract content
                 selector = step.get("selector", "")
-                extract_result = web_browser.extract_content(selector)
+                extract_result = get_web_browser().extract_content(selector)
 
                 interaction_results.append({
                     "step": step,
@@ -170,10 +170,10 @@ class BrowserAgent(BaseAgent):
                 })
 
         # Take a screenshot of the final state
-        screenshot_result = web_browser.take_screenshot()
+        screenshot_result = get_web_browser().take_screenshot()
 
         # Get the final page content
-        final_result = web_browser.navigate(current_url)
+        final_result = get_web_browser().navigate(current_url)
         final_text_content = final_result.get("text_content", "") if final_result["status"] == "success" else ""
 
         # Ask the LLM to analyze the final state
@@ -8,6 +8,8 @@ SEARCH_CONFIG = {
     "search_depth": 2,  # How deep to search (1-3)
     "include_domains": [],  # Domains to include in search results
     "exclude_domains": [],  # Domains to exclude from search results
+    "cache_ttl": 300,  # Seconds identical searches are answered from memory (0 disables)
+    "cache_size": 256,  # Maximum number of cached searches
 }
 
 # Browser configuration
@@ -15,6 +17,23 @@ BROWSER_CONFIG = {
     "headless": True,  # Run browser in headless mode
     "timeout": 30,  # Timeout in seconds for browser operations
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "block_resources": True,  # Abort requests for resources not needed for text extraction
+    "blocked_resource_types": ["image", "font", "media"],  # Add "stylesheet" if innerText styling doesn't matter
+    "direct_fetch": True,  # Fetch JSON, text, XML, CSV and PDF URLs without rendering them in the browser
+    "extract_in_page": True,  # Pick main content and links in the page instead of parsing the full DOM in Python
+    "screenshot_type": "jpeg",  # "png" for lossless screenshots
+    "screenshot_quality": 70,  # JPEG quality (0-100)
+    "view_pause": 0,  # Seconds to pause after each page load in a visible browser
+    "cdp_endpoint": "",  # Connect to an existing Chromium over CDP instead of launching one (e.g. "http://localhost:9222")
+    "response_cache": True,  # Replay repeat requests from an on-disk cache (disables Chromium's own HTTP cache)
+    "response_cache_path": "output/browser_cache.sqlite",
+    "response_cache_max_entries": 5000,  # Least recently used responses are evicted beyond this
+    "response_cache_ttl": 3600,  # Longest a response is replayed, in seconds; Cache-Control max-age can shorten it
+    "response_cache_skip_types": ["document"],  # Resource types always fetched from the network (pages may be private)
+    "response_cache_methods": ["GET"],  # Add "POST" to also replay requests keyed by their body
+    "page_cache_ttl": 900,  # Seconds the Streamlit browser answers repeat browses of a URL from memory (0 disables)
+    "page_cache_size": 256,  # Maximum number of pages kept in that cache
+    "prefetch_results": 3,  # Top search results the Streamlit browser loads in the background (0 disables)
 }
 
 # Python REPL configuration
@@ -26,6 +45,9 @@ PYTHON_REPL_CONFIG = {
         "datetime", "json", "re", "os", "sys", "math", "random",
         "time", "collections", "itertools", "functools"
     ],
+    "use_subprocess": True,  # Run code in a long-lived worker process instead of in-process
+    "worker_max_executions": 200,  # Restart the worker after this many executions
+    "worker_max_rss_mb": 1024,  # Restart the worker above this resident memory (needs psutil)
 }
 
 # File operations configuration
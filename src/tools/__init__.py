@@ -5,9 +5,9 @@ Tools for SuperNova AI.
 from .search import web_search
 from .python_repl import python_repl
 from .file_operations import file_operations
-from .browser import web_browser
-from .opena_browser import opena_browser
+from .browser import get_web_browser
+from .opena_browser import opena_browser, async_opena_browser
 from .streamlit_browser import streamlit_browser
 from .sandbox import sandbox
 
-__all__ = ["web_search", "python_repl", "file_operations", "web_browser", "opena_browser", "streamlit_browser", "sandbox"]
+__all__ = ["web_search", "python_repl", "file_operations", "get_web_browser", "opena_browser", "async_opena_browser", "streamlit_browser", "sandbox"]
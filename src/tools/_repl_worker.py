@@ -0,0 +1,291 @@
+"""
+Worker process for the Python REPL tool.
+
+Run as a standalone script so starting a worker doesn't import the rest of the
+tools package. Reads length-prefixed JSON requests from stdin and writes
+length-prefixed JSON replies to stdout, each tagged with the request's ID.
+WorkerProcess is the parent side of the same protocol.
+
+Messages are JSON rather than pickle because code running in the worker can
+write to the reply pipe: a pickle from it would run arbitrary code in the
+parent when loaded, and the request IDs let the parent skip any frames it
+didn't ask for.
+"""
+
+import io
+import os
+import sys
+import ast
+import time
+import json
+import queue
+import struct
+import itertools
+import functools
+import threading
+import signal
+import traceback
+import subprocess
+from contextlib import redirect_stdout, redirect_stderr
+from types import CodeType
+from typing import Dict, Any, Optional, Tuple, BinaryIO, Callable
+
+# Message frame header: payload length in bytes
+_HEADER = struct.Struct("!I")
+
+# Private references, so executed code patching the json module can't break replies
+_json_dumps = json.dumps
+_json_loads = json.loads
+
+# Safe builtins made available to executed code as locals
+REPL_BUILTINS = {
+    "print": print,
+    "len": len,
+    "range": range,
+    "enumerate": enumerate,
+    "dict": dict,
+    "list": list,
+    "set": set,
+    "tuple": tuple,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "sum": sum,
+    "min": min,
+    "max": max,
+    "sorted": sorted,
+    "round": round,
+    "abs": abs,
+    "all": all,
+    "any": any,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+}
+
+@functools.lru_cache(maxsize=256)
+def compile_snippet(code: str) -> Tuple[Optional[CodeType], Optional[CodeType]]:
+    """
+    Compile code for execution, splitting off a trailing expression.
+
+    Args:
+        code: The Python code to compile
+
+    Returns:
+        A tuple of (code object for the leading statements or None,
+        code object for the trailing expression or None)
+    """
+    tree = ast.parse(code, "<repl>")
+    statements = tree.body
+
+    # A trailing expression is evaluated separately so its value becomes the result
+    eval_code = None
+    if statements and isinstance(statements[-1], ast.Expr):
+        eval_code = compile(ast.Expression(statements[-1].value), "<repl>", "eval")
+        statements = statements[:-1]
+
+    exec_code = None
+    if statements:
+        exec_code = compile(ast.Module(body=statements, type_ignores=[]), "<repl>", "exec")
+
+    return exec_code, eval_code
+
+def read_message(stream: BinaryIO) -> Any:
+    """
+    Read one framed JSON message.
+
+    Raises:
+        EOFError: If the stream is closed
+        ValueError: If the frame is not valid JSON
+    """
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise EOFError("REPL message stream closed")
+    (size,) = _HEADER.unpack(header)
+    payload = stream.read(size)
+    if len(payload) < size:
+        raise EOFError("REPL message stream closed")
+    return _json_loads(payload)
+
+def write_message(stream: BinaryIO, message: Any):
+    """Write one framed JSON message and flush it."""
+    payload = _json_dumps(message).encode("ascii")
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+def json_value(value: Any) -> Any:
+    """
+    Return value if it survives a JSON round trip unchanged, else its repr.
+
+    Tuples, sets, NaN and objects of other types come back as their repr
+    rather than as a different value.
+    """
+    try:
+        if _json_loads(_json_dumps(value)) == value:
+            return value
+    except (TypeError, ValueError, RecursionError):
+        pass
+    return repr(value)
+
+def serve(handle: Callable[[Any], Any]):
+    """
+    Answer requests from stdin until it is closed.
+
+    Args:
+        handle: Function turning a request body into a JSON-serializable reply
+    """
+    # Keep private copies of the protocol pipes, then point fds 0 and 1 elsewhere
+    # so code writing to them directly can't corrupt the message stream
+    requests_in = os.fdopen(os.dup(0), "rb")
+    replies_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+
+    while True:
+        try:
+            request = read_message(requests_in)
+        except EOFError:
+            return
+        write_message(replies_out, {"id": request["id"], "reply": handle(request["body"])})
+
+class WorkerProcess:
+    """Parent-side handle on a worker script that speaks the framed message protocol."""
+
+    def __init__(self, script: str, name: str):
+        """
+        Start the worker and a thread that queues its replies.
+
+        Args:
+            script: Path of the worker script to run
+            name: Name used for the reader thread
+        """
+        self.process = subprocess.Popen(
+            [sys.executable, script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # Its own process group, so processes the worker starts are killed with it
+            start_new_session=os.name == "posix",
+        )
+        self.executions = 0
+        self._request_ids = itertools.count()
+
+        # Replies are read on a thread so a timeout can be applied to the wait
+        self._replies = queue.Queue()
+        threading.Thread(target=self._read_replies, name=f"{name}-reader", daemon=True).start()
+
+    @property
+    def pid(self) -> int:
+        """Process ID of the worker."""
+        return self.process.pid
+
+    def alive(self) -> bool:
+        """Return whether the worker process is still running."""
+        return self.process.poll() is None
+
+    def request(self, message: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Send a message to the worker and wait for its reply.
+
+        Args:
+            message: JSON-serializable message to send
+            timeout: Seconds to wait for the reply, or None to wait indefinitely
+
+        Returns:
+            The worker's reply
+
+        Raises:
+            TimeoutError: If no reply arrives in time; the worker is left running
+            EOFError: If the worker exited or broke the protocol before replying
+        """
+        request_id = next(self._request_ids)
+        write_message(self.process.stdin, {"id": request_id, "body": message})
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            try:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                frame = self._replies.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"No reply from worker after {timeout} seconds")
+            if isinstance(frame, BaseException):
+                raise EOFError(f"Worker exited unexpectedly: {frame}")
+
+            # Frames written to the pipe by the executed code itself are skipped
+            if isinstance(frame, dict) and frame.get("id") == request_id and "reply" in frame:
+                self.executions += 1
+                return frame["reply"]
+
+    def kill(self):
+        """Kill the worker process, and any processes it started, and close its pipes."""
+        try:
+            if os.name == "posix":
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+            self.process.wait()
+        except Exception:
+            pass
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _read_replies(self):
+        """Queue replies until the worker's stdout closes, then queue the error."""
+        stream = self.process.stdout
+        while True:
+            try:
+                self._replies.put(read_message(stream))
+            except BaseException as e:
+                self._replies.put(e)
+                return
+
+def _run(code: str, namespace: Dict[str, Any], local_vars: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute one snippet and build its result dictionary."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exec_code, eval_code = compile_snippet(code)
+
+            # Run the statements once, then evaluate a trailing expression for the result
+            result = None
+            if exec_code is not None:
+                exec(exec_code, namespace, local_vars)
+            if eval_code is not None:
+                result = eval(eval_code, namespace, local_vars)
+
+        return {
+            "status": "success",
+            "error": "",
+            "output": stdout.getvalue(),
+            "result": result,
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": f"{type(e).__name__}: {str(e)}",
+            "output": stdout.getvalue(),
+            "traceback": traceback.format_exc(),
+            "result": None,
+        }
+
+def main():
+    """Serve execution requests until stdin is closed."""
+    namespace = {"__builtins__": __builtins__}
+    local_vars = dict(REPL_BUILTINS)
+
+    def handle(code: str) -> Dict[str, Any]:
+        reply = _run(code, namespace, local_vars)
+        reply["result"] = json_value(reply["result"])
+        return reply
+
+    serve(handle)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Worker process for sandbox Python execution.
+
+Run as a standalone script by the sandbox's worker pool. Each request is a
+dictionary with the code to run, the filename to report it under and the
+directory to put first on sys.path; the reply carries the return code, stdout
+and stderr, as if the code had been run with a new interpreter.
+
+Where fork() is available each job runs in a child forked from the warm
+worker, with file descriptors 1 and 2 pointing at temporary files, so output
+from subprocesses and C extensions is captured and nothing a script changes
+(modules, os.environ, threads) outlives it. Elsewhere jobs run in the worker
+itself, only Python-level output is captured, and module state persists
+between runs.
+"""
+
+import io
+import os
+import sys
+import random
+import tempfile
+import functools
+import linecache
+import threading
+import traceback
+from types import CodeType
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Dict, Any, Tuple
+
+from _repl_worker import serve
+
+# Modules most snippets import, loaded once so later jobs skip the import cost
+for _module in ("json", "math", "random", "re", "datetime", "collections", "itertools", "numpy", "numpy.random"):
+    try:
+        __import__(_module)
+    except ImportError:
+        pass
+
+class _CappedOutput(io.StringIO):
+    """StringIO that stops storing text once it holds a maximum number of characters."""
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+        self.truncated = False
+
+    def write(self, s: str) -> int:
+        room = self.limit - self.tell()
+        if len(s) > room:
+            self.truncated = True
+            super().write(s[:max(room, 0)])
+            return len(s)
+        return super().write(s)
+
+@functools.lru_cache(maxsize=256)
+def compile_script(code: str, filename: str) -> CodeType:
+    """Compile a script once; repeated snippets reuse the code object."""
+    return compile(code, filename, "exec")
+
+def _exec_script(code: str, filename: str, directory: str) -> int:
+    """
+    Execute code as __main__, reporting errors on sys.stderr like the interpreter.
+
+    Returns:
+        The script's return code
+    """
+    namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+    if os.path.isabs(filename):
+        namespace["__file__"] = filename
+    else:
+        # Unsaved source has no file to read lines from; let tracebacks show it anyway
+        linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+
+    # Match a fresh interpreter: the script's directory first on sys.path and its own argv
+    sys.path[0] = directory
+    sys.argv = [filename if "__file__" in namespace else "-c"]
+
+    try:
+        exec(compile_script(code, filename), namespace)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException as e:
+        # Drop this function's frame so the traceback starts in the script
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        return 1
+    return 0
+
+def _read_capped(stream, max_output: int) -> Tuple[str, bool]:
+    """Read up to max_output bytes from the start of a file, and whether more was written."""
+    stream.seek(0)
+    data = stream.read(max_output + 1)
+    return data[:max_output].decode("utf-8", errors="replace"), len(data) > max_output
+
+def _run_forked(code: str, filename: str, directory: str, max_output: int) -> Tuple[int, str, str, bool]:
+    """Run a script in a forked child with its stdout and stderr file descriptors captured."""
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            returncode = 1
+            try:
+                os.dup2(stdout.fileno(), 1)
+                os.dup2(stderr.fileno(), 2)
+                # Close everything else, including the worker's protocol pipes
+                os.closerange(3, os.sysconf("SC_OPEN_MAX"))
+                # Forked children would otherwise all draw the same random numbers
+                random.seed()
+                if "numpy" in sys.modules:
+                    sys.modules["numpy"].random.seed()
+
+                returncode = _exec_script(code, filename, directory)
+
+                # Like interpreter shutdown, wait for the script's non-daemon threads
+                for thread in threading.enumerate():
+                    if thread is not threading.current_thread() and not thread.daemon:
+                        thread.join()
+            finally:
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(returncode)
+
+        _, status = os.waitpid(pid, 0)
+        stdout_text, stdout_truncated = _read_capped(stdout, max_output)
+        stderr_text, stderr_truncated = _read_capped(stderr, max_output)
+
+    return os.waitstatus_to_exitcode(status), stdout_text, stderr_text, stdout_truncated or stderr_truncated
+
+def _run_in_process(code: str, filename: str, directory: str, max_output: int) -> Tuple[int, str, str, bool]:
+    """Run a script in the worker itself, capturing Python-level stdout and stderr."""
+    stdout = _CappedOutput(max_output)
+    stderr = _CappedOutput(max_output)
+
+    # Restore what the script may change that later jobs would notice first
+    cwd = os.getcwd()
+    saved_path, saved_argv = sys.path[:], sys.argv
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            returncode = _exec_script(code, filename, directory)
+    finally:
+        sys.path[:] = saved_path
+        sys.argv = saved_argv
+        os.chdir(cwd)
+
+    return returncode, stdout.getvalue(), stderr.getvalue(), stdout.truncated or stderr.truncated
+
+def run_script(code: str, filename: str, directory: str, max_output: int) -> Dict[str, Any]:
+    """
+    Run code as a __main__ script.
+
+    Args:
+        code: Python source to run
+        filename: Name used for __file__ and tracebacks; a path if the source was saved
+        directory: Directory put first on sys.path, like a script's own directory
+        max_output: Maximum bytes of stdout and of stderr kept
+
+    Returns:
+        A dictionary with the return code, stdout and stderr
+    """
+    run = _run_forked if hasattr(os, "fork") else _run_in_process
+    returncode, stdout, stderr, truncated = run(code, filename, directory, max_output)
+    if truncated:
+        stderr += f"\n[Output truncated at {max_output} bytes]\n"
+
+    return {
+        "returncode": returncode,
+        "stdout": stdout,
+        "stderr": stderr,
+    }
+
+def main():
+    """Serve execution requests until stdin is closed."""
+    serve(lambda job: run_script(job["code"], job["filename"], job["directory"], job["max_output"]))
+
+if __name__ == "__main__":
+    sys.exit(main())
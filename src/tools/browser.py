@@ -4,6 +4,8 @@ Browser tools for SuperNova AI.
 
 import os
 import time
+import atexit
+import threading
 import tempfile
 from typing import Dict, Any, List, Optional, Union
 from urllib.parse import urlparse
@@ -17,6 +19,7 @@ from ..config.tools import BROWSER_CONFIG
 # Try to import optional dependencies
 try:
     from playwright.sync_api import sync_playwright, Page, Browser
+    from playwright.sync_api import TimeoutError as PWTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -28,11 +31,61 @@ try:
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
     from webdriver_manager.chrome import ChromeDriverManager
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Expected failure modes, handled separately from unknown errors. Empty
+# tuples are valid in an except clause and simply never match.
+TIMEOUT_ERRORS = ()
+NOT_FOUND_ERRORS = ()
+if PLAYWRIGHT_AVAILABLE:
+    TIMEOUT_ERRORS += (PWTimeout,)
+if SELENIUM_AVAILABLE:
+    TIMEOUT_ERRORS += (TimeoutException,)
+    NOT_FOUND_ERRORS += (NoSuchElementException,)
+
+# DOM helpers installed once per page so call sites only pass a selector
+# instead of shipping a fresh script body to be parsed on every evaluate.
+PAGE_HELPERS_JS = """
+window.__sn = {
+    count: s => document.querySelectorAll(s).length,
+    outer: s => [...document.querySelectorAll(s)].map(e => e.outerHTML),
+    text: s => [...document.querySelectorAll(s)].map(e => e.innerText),
+    both: s => {
+        const e = [...document.querySelectorAll(s)];
+        return {c: e.length, o: e.map(x => x.outerHTML), t: e.map(x => x.innerText)};
+    },
+    submit: s => document.querySelector(s).submit(),
+};
+"""
+
+# One Playwright driver process shared by every WebBrowser in the process
+_PLAYWRIGHT = None
+_PW_LOCK = threading.Lock()
+
+def _get_playwright():
+    """Start the process-wide Playwright runtime on first use and return it."""
+    global _PLAYWRIGHT
+    if _PLAYWRIGHT is None:
+        with _PW_LOCK:
+            if _PLAYWRIGHT is None:
+                _PLAYWRIGHT = sync_playwright().start()
+                atexit.register(_stop_playwright)
+    return _PLAYWRIGHT
+
+def _stop_playwright():
+    """Stop the shared Playwright runtime if it was started."""
+    global _PLAYWRIGHT
+    if _PLAYWRIGHT is not None:
+        try:
+            _PLAYWRIGHT.stop()
+        except Exception as e:
+            print(f"Error stopping Playwright: {e}")
+        _PLAYWRIGHT = None
+
 class WebBrowser:
     """Web browser tool for browsing websites."""
 
@@ -42,6 +95,8 @@ class WebBrowser:
         self.headless = BROWSER_CONFIG.get("headless", True)
         self.timeout = BROWSER_CONFIG.get("timeout", 30)
         self.user_agent = BROWSER_CONFIG.get("user_agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+        self.block_resources = BROWSER_CONFIG.get("block_resources", True)
+        self.blocked_resource_types = frozenset(BROWSER_CONFIG.get("blocked_resource_types", ["image", "font", "media"]))
 
         # Initialize browser instance variables
         self.browser = None
@@ -55,9 +110,12 @@ class WebBrowser:
         """Initialize the browser if not already initialized."""
         if self.browser_type == "playwright" and not self.browser:
             try:
-                self.playwright = sync_playwright().start()
+                self.playwright = _get_playwright()
                 self.browser = self.playwright.chromium.launch(headless=self.headless)
                 self.page = self.browser.new_page(user_agent=self.user_agent)
+                self.page.add_init_script(PAGE_HELPERS_JS)
+                if self.block_resources:
+                    self.page.route("**/*", self._route_request)
                 self.page.set_default_timeout(self.timeout * 1000)  # Convert to milliseconds
                 return True
             except Exception as e:
@@ -90,12 +148,19 @@ class WebBrowser:
 
         return True
 
+    def _route_request(self, route):
+        """Abort requests for resource types that text extraction never uses."""
+        if route.request.resource_type in self.blocked_resource_types:
+            route.abort()
+        else:
+            route.continue_()
+
     def _close_browser(self):
         """Close the browser."""
         if self.browser_type == "playwright" and self.browser:
             try:
+                # The Playwright runtime is shared, so only the browser is closed
                 self.browser.close()
-                self.playwright.stop()
                 self.browser = None
                 self.page = None
                 self.playwright = None
@@ -230,34 +295,22 @@ class WebBrowser:
 
         try:
             if self.browser_type == "playwright":
-                # Check if selector exists
-                element_count = self.page.evaluate(f"document.querySelectorAll('{selector}').length")
+                # Count, HTML and text in a single round-trip
+                extracted = self.page.evaluate("s => window.__sn.both(s)", selector)
 
-                if element_count == 0:
+                if extracted["c"] == 0:
                     return {
                         "status": "error",
                         "error": f"Selector '{selector}' not found on page",
                         "content": "",
                     }
 
-                # Extract content
-                content = self.page.evaluate(f"""() => {{
-                    const elements = document.querySelectorAll('{selector}');
-                    return Array.from(elements).map(el => el.outerHTML);
-                }}""")
-
-                # Extract text content
-                text_content = self.page.evaluate(f"""() => {{
-                    const elements = document.querySelectorAll('{selector}');
-                    return Array.from(elements).map(el => el.innerText);
-                }}""")
-
                 return {
                     "status": "success",
                     "error": "",
-                    "content": content,
-                    "text_content": text_content,
-                    "count": element_count,
+                    "content": extracted["o"],
+                    "text_content": extracted["t"],
+                    "count": extracted["c"],
                 }
 
             elif self.browser_type == "selenium":
@@ -292,6 +345,21 @@ class WebBrowser:
                     "content": "",
                 }
 
+        except TIMEOUT_ERRORS as e:
+            return {
+                "status": "error",
+                "error": f"Timed out extracting content with selector '{selector}': {str(e)}",
+                "content": "",
+                "timeout": True,
+            }
+
+        except NOT_FOUND_ERRORS:
+            return {
+                "status": "error",
+                "error": f"Selector '{selector}' not found on page",
+                "content": "",
+            }
+
         except Exception as e:
             error_msg = f"Error extracting content with selector '{selector}': {str(e)}"
             print(error_msg)
@@ -320,16 +388,7 @@ class WebBrowser:
 
         try:
             if self.browser_type == "playwright":
-                # Check if selector exists
-                element_count = self.page.evaluate(f"document.querySelectorAll('{selector}').length")
-
-                if element_count == 0:
-                    return {
-                        "status": "error",
-                        "error": f"Selector '{selector}' not found on page",
-                    }
-
-                # Click the element
+                # Click the element; Playwright waits for it and raises on timeout
                 self.page.click(selector)
 
                 # Wait for navigation to complete
@@ -348,7 +407,7 @@ class WebBrowser:
                     element = WebDriverWait(self.driver, self.timeout).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                     )
-                except Exception:
+                except TIMEOUT_ERRORS:
                     return {
                         "status": "error",
                         "error": f"Selector '{selector}' not found or not clickable",
@@ -373,6 +432,19 @@ class WebBrowser:
                     "error": "No browser implementation available",
                 }
 
+        except TIMEOUT_ERRORS as e:
+            return {
+                "status": "error",
+                "error": f"Selector '{selector}' not found or not clickable: {str(e)}",
+                "timeout": True,
+            }
+
+        except NOT_FOUND_ERRORS:
+            return {
+                "status": "error",
+                "error": f"Selector '{selector}' not found on page",
+            }
+
         except Exception as e:
             error_msg = f"Error clicking element with selector '{selector}': {str(e)}"
             print(error_msg)
@@ -405,7 +477,7 @@ class WebBrowser:
                 if self.browser_type == "playwright":
                     try:
                         # Check if selector exists
-                        element_count = self.page.evaluate(f"document.querySelectorAll('{selector}').length")
+                        element_count = self.page.evaluate("s => window.__sn.count(s)", selector)
 
                         if element_count == 0:
                             results[selector] = {
@@ -484,7 +556,7 @@ class WebBrowser:
         try:
             if self.browser_type == "playwright":
                 # Check if selector exists
-                element_count = self.page.evaluate(f"document.querySelectorAll('{form_selector}').length")
+                element_count = self.page.evaluate("s => window.__sn.count(s)", form_selector)
 
                 if element_count == 0:
                     return {
@@ -493,7 +565,7 @@ class WebBrowser:
                     }
 
                 # Submit the form
-                self.page.evaluate(f"document.querySelector('{form_selector}').submit()")
+                self.page.evaluate("s => window.__sn.submit(s)", form_selector)
 
                 # Wait for navigation to complete
                 self.page.wait_for_load_state("networkidle")
@@ -511,7 +583,7 @@ class WebBrowser:
                     form = WebDriverWait(self.driver, self.timeout).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, form_selector))
                     )
-                except Exception:
+                except TIMEOUT_ERRORS:
                     return {
                         "status": "error",
                         "error": f"Form selector '{form_selector}' not found",
@@ -536,6 +608,19 @@ class WebBrowser:
                     "error": "No browser implementation available",
                 }
 
+        except TIMEOUT_ERRORS as e:
+            return {
+                "status": "error",
+                "error": f"Timed out submitting form with selector '{form_selector}': {str(e)}",
+                "timeout": True,
+            }
+
+        except NOT_FOUND_ERRORS:
+            return {
+                "status": "error",
+                "error": f"Form selector '{form_selector}' not found on page",
+            }
+
         except Exception as e:
             error_msg = f"Error submitting form with selector '{form_selector}': {str(e)}"
             print(error_msg)
@@ -635,5 +720,15 @@ class WebBrowser:
         """Close the browser."""
         self._close_browser()
 
-# Create a singleton instance
-web_browser = WebBrowser()
+# Shared instance, created on first use rather than at import time
+_instance: Optional[WebBrowser] = None
+_lock = threading.Lock()
+
+def get_web_browser() -> WebBrowser:
+    """Return the shared WebBrowser instance, creating it on first call."""
+    global _instance
+    if _instance is None:
+        with _lock:
+            if _instance is None:
+                _instance = WebBrowser()
+    return _instance
@@ -4,45 +4,397 @@ Data visualization tools for SuperNova AI.
 
 import os
 import io
-import base64
+import csv
+import json
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List, Union
+import numpy as np
 import pandas as pd
 from ..config.env import DEBUG
 
-# Check for visualization libraries
+# Check for visualization libraries without importing them; pyplot and
+# plotly are only loaded the first time a chart is actually rendered.
+MATPLOTLIB_AVAILABLE = (importlib.util.find_spec("matplotlib") is not None
+                        and importlib.util.find_spec("seaborn") is not None)
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+
+plt = None
+sns = None
+px = None
+pio = None
+
+# Whether the installed plotly needs figures' typed arrays encoded by hand;
+# set by _get_plotly. plotly.js reads base64 typed arrays from 2.28 (bundled
+# with plotly 5.19), and plotly 6 already emits them itself.
+_ENCODE_TYPED_ARRAYS = False
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 try:
-    import matplotlib.pyplot as plt
-    import seaborn as sns
-    MATPLOTLIB_AVAILABLE = True
+    import numba
+    NUMBA_AVAILABLE = True
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
 try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PLOTLY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Matplotlib styling applied once, so charts don't restyle every artist per call
+_CHART_RC_PARAMS = {
+    "figure.facecolor": "#343541",
+    "axes.facecolor": "#444654",
+    "axes.edgecolor": "#8e8ea0",
+    "axes.labelcolor": "#ececf1",
+    "axes.titlecolor": "#ececf1",
+    "axes.grid": True,
+    "grid.linestyle": "--",
+    "grid.alpha": 0.7,
+    "xtick.color": "#ececf1",
+    "ytick.color": "#ececf1",
+    "legend.frameon": True,
+    "legend.facecolor": "#343541",
+    "legend.edgecolor": "#8e8ea0",
+    "legend.labelcolor": "#ececf1",
+}
+
+def _get_matplotlib():
+    """Import pyplot (on the non-interactive Agg backend) and seaborn on first use."""
+    global plt, sns
+    if plt is None:
+        import matplotlib
+        matplotlib.use("Agg", force=True)
+        import matplotlib.pyplot as _plt
+        import seaborn as _sns
+
+        # Set default style for matplotlib, then the chart colors on top of it
+        _plt.style.use('dark_background')
+        _sns.set_style("darkgrid")
+        _plt.rcParams.update(_CHART_RC_PARAMS)
+        sns = _sns
+        plt = _plt
+    return plt, sns
+
+def _get_plotly():
+    """Import plotly express and plotly.io on first use."""
+    global px, pio, _ENCODE_TYPED_ARRAYS
+    if px is None:
+        import plotly
+        import plotly.express as _px
+        import plotly.io as _pio
+
+        version = tuple(int(part) for part in plotly.__version__.split(".")[:2] if part.isdigit())
+        _ENCODE_TYPED_ARRAYS = (5, 19) <= version < (6, 0)
+
+        # Serialize figures with orjson when available; it handles numpy arrays and
+        # NaN/Inf natively instead of converting everything to Python lists first.
+        if ORJSON_AVAILABLE:
+            _pio.json.config.default_engine = "orjson"
+        pio = _pio
+        px = _px
+    return px, pio
+
+# numpy dtypes plotly.js can decode from base64, by dtype.kind and itemsize
+_TYPED_ARRAY_KINDS = {"f": (4, 8), "i": (1, 2, 4), "u": (1, 2, 4)}
+
+def _encode_typed_arrays(node: Any) -> Any:
+    """
+    Replace numeric numpy arrays in a figure dict with plotly.js typed-array objects.
+
+    Arrays of other dtypes are left for the JSON encoder.
+    """
+    if isinstance(node, dict):
+        return {key: _encode_typed_arrays(value) for key, value in node.items()}
+    if isinstance(node, (list, tuple)):
+        return [_encode_typed_arrays(value) for value in node]
+    if isinstance(node, np.ndarray) and node.ndim == 1:
+        array = node
+        if array.dtype.kind in "iu" and array.dtype.itemsize == 8 and array.size:
+            # plotly.js has no 64-bit integer arrays; narrow when the values fit
+            narrowed = pd.to_numeric(array, downcast="integer" if array.dtype.kind == "i" else "unsigned")
+            if narrowed.dtype.itemsize < 8:
+                array = narrowed
+        if array.dtype.itemsize in _TYPED_ARRAY_KINDS.get(array.dtype.kind, ()):
+            array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+            return {
+                "dtype": array.dtype.str[1:],
+                "bdata": base64.b64encode(array.tobytes()).decode("ascii"),
+            }
+    return node
+
+def _read_csv(csv_data: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Parse a CSV string into a DataFrame, using Arrow's reader when available.
+
+    Args:
+        csv_data: CSV string
+        columns: Only parse these columns, if they are all present in the header
+
+    Returns:
+        Parsed DataFrame
+    """
+    if columns:
+        # Peek at the header row only; fall back to a full parse if anything is missing
+        header = next(csv.reader(io.StringIO(csv_data)), [])
+        if not set(columns).issubset(header):
+            columns = None
+
+    if PYARROW_AVAILABLE:
+        table = pacsv.read_csv(
+            pa.BufferReader(csv_data.encode("utf-8")),
+            read_options=pacsv.ReadOptions(block_size=1 << 20),
+            parse_options=pacsv.ParseOptions(),
+            convert_options=pacsv.ConvertOptions(include_columns=columns),
+        )
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    return pd.read_csv(io.StringIO(csv_data), usecols=columns, low_memory=False, cache_dates=True)
+
+# Column count above which NaN-aware correlation uses the numba kernel
+NUMBA_CORR_MIN_COLUMNS = 32
+
+if NUMBA_AVAILABLE:
+    # fastmath is left off because it lets the compiler assume no NaNs,
+    # which would drop the isnan checks this kernel depends on.
+    @numba.njit(parallel=True)
+    def _nancorr_kernel(mat: np.ndarray) -> np.ndarray:
+        """Pairwise Pearson correlation over rows where both columns are non-NaN."""
+        n, k = mat.shape
+        out = np.empty((k, k))
+        for i in numba.prange(k):
+            for j in range(i, k):
+                count = 0
+                sum_x = 0.0
+                sum_y = 0.0
+                for r in range(n):
+                    a = mat[r, i]
+                    b = mat[r, j]
+                    if not (np.isnan(a) or np.isnan(b)):
+                        count += 1
+                        sum_x += a
+                        sum_y += b
+                if count < 2:
+                    out[i, j] = np.nan
+                    out[j, i] = np.nan
+                    continue
+                mean_x = sum_x / count
+                mean_y = sum_y / count
+                sxx = 0.0
+                syy = 0.0
+                sxy = 0.0
+                for r in range(n):
+                    a = mat[r, i]
+                    b = mat[r, j]
+                    if not (np.isnan(a) or np.isnan(b)):
+                        dx = a - mean_x
+                        dy = b - mean_y
+                        sxx += dx * dx
+                        syy += dy * dy
+                        sxy += dx * dy
+                denom = np.sqrt(sxx * syy)
+                value = sxy / denom if denom > 0 else np.nan
+                if value > 1.0:
+                    value = 1.0
+                elif value < -1.0:
+                    value = -1.0
+                out[i, j] = value
+                out[j, i] = value
+        return out
+
+# Point count that scatter/line charts are reduced to before sending to the browser
+DOWNSAMPLE_TARGET = 5000
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Select point indices with Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        x: Sorted x values
+        y: y values aligned with x
+        threshold: Number of points to keep
+
+    Returns:
+        Indices of the points to keep, in ascending order
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Bucket edges for the interior points; first and last are always kept
+    every = (n - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+def _maybe_downsample(data: pd.DataFrame, x_column: Optional[str], y_column: Optional[str],
+                      target: int = DOWNSAMPLE_TARGET) -> pd.DataFrame:
+    """
+    Reduce a large numeric x/y DataFrame to roughly target points with LTTB.
+
+    Data that is small, non-numeric or contains missing values is returned unchanged.
+    """
+    if len(data) <= target or x_column is None or y_column is None:
+        return data
+    if not (pd.api.types.is_numeric_dtype(data[x_column]) and pd.api.types.is_numeric_dtype(data[y_column])):
+        return data
+
+    ordered = data.sort_values(x_column, kind="stable")
+    x = ordered[x_column].to_numpy(dtype=np.float64)
+    y = ordered[y_column].to_numpy(dtype=np.float64)
+    if np.isnan(x).any() or np.isnan(y).any():
+        return data
+
+    return ordered.iloc[_lttb_indices(x, y, target)]
+
+def _narrow(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast numeric columns to the smallest dtype that holds their values.
+
+    Narrower arrays make the serialized Plotly figure proportionally smaller.
+    """
+    narrowed = {}
+    for column in data.columns:
+        series = data[column]
+        if pd.api.types.is_float_dtype(series):
+            narrowed[column] = pd.to_numeric(series, downcast="float")
+        elif pd.api.types.is_integer_dtype(series):
+            narrowed[column] = pd.to_numeric(series, downcast="integer")
+
+    if not narrowed:
+        return data
+
+    data = data.copy(deep=False)
+    for column, series in narrowed.items():
+        data[column] = series
+    return data
+
+def _output_name(library: str, chart_type: str, file_tag: Optional[str], extension: str) -> str:
+    """Build a chart's output file name, tagged when the chart is cached."""
+    if file_tag:
+        return f"{library}_{chart_type}_{file_tag}.{extension}"
+    return f"{library}_{chart_type}.{extension}"
+
+# Cell count above which heatmap pivots are built directly with numpy
+PIVOT_FAST_PATH_CELLS = 100_000
+
+def _pivot(data: pd.DataFrame, index: str, columns: str, values: str) -> pd.DataFrame:
+    """
+    Pivot data into a heatmap grid.
+
+    Large grids are filled by scattering values into a NaN-initialized array
+    through factorized keys, instead of going through DataFrame.pivot. Both
+    paths raise ValueError for duplicate (index, column) pairs.
+    """
+    if data[index].nunique() * data[columns].nunique() <= PIVOT_FAST_PATH_CELLS:
+        return data.pivot(index=index, columns=columns, values=values)
+
+    row_codes, row_labels = pd.factorize(data[index], sort=True)
+    col_codes, col_labels = pd.factorize(data[columns], sort=True)
+    valid = (row_codes >= 0) & (col_codes >= 0)
+
+    # A scatter would silently keep the last of several values for a cell
+    cells = row_codes[valid].astype(np.int64) * len(col_labels) + col_codes[valid]
+    if np.unique(cells).size < cells.size:
+        raise ValueError("Index contains duplicate entries, cannot reshape")
+
+    grid = np.full((len(row_labels), len(col_labels)), np.nan)
+    grid[row_codes[valid], col_codes[valid]] = data[values].to_numpy(dtype=np.float64)[valid]
+    return pd.DataFrame(grid,
+                        index=pd.Index(row_labels, name=index),
+                        columns=pd.Index(col_labels, name=columns))
+
+def _correlation_matrix(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute the correlation matrix of the numeric columns of a DataFrame.
+
+    Args:
+        data: DataFrame to correlate
+
+    Returns:
+        Correlation matrix indexed by the numeric column names
+    """
+    numeric = data.select_dtypes(include=np.number)
+    values = numeric.to_numpy(dtype=np.float64, copy=False)
+
+    if not np.isnan(values).any():
+        # No missing values: a single BLAS-backed call covers every pair
+        corr = np.corrcoef(values, rowvar=False)
+    elif NUMBA_AVAILABLE and values.shape[1] >= NUMBA_CORR_MIN_COLUMNS:
+        corr = _nancorr_kernel(np.ascontiguousarray(values))
+    else:
+        return numeric.corr()
+
+    return pd.DataFrame(np.atleast_2d(corr), index=numeric.columns, columns=numeric.columns)
 
 class DataVisualizer:
     """Data visualization tool for creating charts and graphs."""
 
+    # Maximum number of rendered charts kept in memory
+    CACHE_SIZE = 64
+
+    # Send numeric trace data to plotly.js as base64 typed arrays
+    TYPED_ARRAYS = True
+
     def __init__(self):
         """Initialize the data visualization tool."""
         self.output_dir = os.path.join(os.getcwd(), "output", "visualizations")
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        
+        # Matplotlib figure reused across charts; pyplot state isn't thread-safe
+        self._fig = None
+        self._mpl_lock = threading.Lock()
+        
+        # Chart builders keyed by lowercased chart type
+        self._plotly_dispatch = {
+            "bar": self._plotly_bar,
+            "line": self._plotly_line,
+            "scatter": self._plotly_scatter,
+            "pie": self._plotly_pie,
+            "heatmap": self._plotly_heatmap,
+        }
+        self._mpl_dispatch = {
+            "bar": self._mpl_bar,
+            "line": self._mpl_line,
+            "scatter": self._mpl_scatter,
+            "pie": self._mpl_pie,
+            "heatmap": self._mpl_heatmap,
+        }
         
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Set default style for matplotlib
-        if MATPLOTLIB_AVAILABLE:
-            plt.style.use('dark_background')
-            sns.set_style("darkgrid")
 
     def create_visualization(self, data: Union[str, pd.DataFrame], chart_type: str, 
                             x_column: Optional[str] = None, y_column: Optional[str] = None,
                             color_column: Optional[str] = None, title: Optional[str] = None,
-                            interactive: bool = True) -> Dict[str, Any]:
+                            interactive: bool = True, save_html: bool = True) -> Dict[str, Any]:
         """
         Create a data visualization.
 
@@ -54,14 +406,37 @@ class DataVisualizer:
             color_column: Column to use for color
             title: Chart title
             interactive: Whether to create an interactive chart
+            save_html: Whether to write an HTML file for interactive charts
 
         Returns:
             Dictionary containing visualization information
         """
+        # Return the previous result if the same chart was already rendered
+        cache_key = self._cache_key(data, chart_type, x_column, y_column, color_column, title,
+                                    interactive, save_html)
+        if cache_key is not None and cache_key in self._cache:
+            cached = self._cache[cache_key]
+            # The file is only reused while it is still there
+            if cached["path"] is None or os.path.exists(cached["path"]):
+                self._cache.move_to_end(cache_key)
+                return cached
+            del self._cache[cache_key]
+
+        # Cached charts get a file of their own, so a later chart of the same type
+        # can't overwrite the file a cached result points to
+        file_tag = None
+        if cache_key is not None:
+            file_tag = hashlib.blake2b(repr(cache_key).encode("utf-8"), digest_size=8).hexdigest()
+
         # Convert data to DataFrame if it's a string
         if isinstance(data, str):
             try:
-                data = pd.read_csv(io.StringIO(data))
+                # Only the named columns are plotted when three distinct ones are given;
+                # parsing fewer would change which heatmap the column count selects
+                columns = None
+                if x_column and y_column and color_column and len({x_column, y_column, color_column}) == 3:
+                    columns = [x_column, y_column, color_column]
+                data = _read_csv(data, columns)
             except Exception as e:
                 if DEBUG:
                     print(f"Error parsing CSV data: {e}")
@@ -76,28 +451,57 @@ class DataVisualizer:
         
         # Print debug information
         if DEBUG:
-            print(f"Creating {chart_type} chart")
-            print(f"Data shape: {data.shape}")
-            print(f"Columns: {data.columns.tolist()}")
-            print(f"X column: {x_column}")
-            print(f"Y column: {y_column}")
-            print(f"Color column: {color_column}")
-            print(f"Title: {title}")
-            print(f"Interactive: {interactive}")
-            print(f"Matplotlib available: {MATPLOTLIB_AVAILABLE}")
-            print(f"Plotly available: {PLOTLY_AVAILABLE}")
+            print(f"Creating {chart_type} chart: shape={data.shape} columns={data.columns.tolist()} "
+                  f"x={x_column} y={y_column} color={color_column} title={title} "
+                  f"interactive={interactive} matplotlib={MATPLOTLIB_AVAILABLE} plotly={PLOTLY_AVAILABLE}")
         
         # Use appropriate visualization library
         if interactive and PLOTLY_AVAILABLE:
-            return self._create_plotly_chart(data, chart_type, x_column, y_column, color_column, title)
+            result = self._create_plotly_chart(data, chart_type, x_column, y_column, color_column, title,
+                                               save_html, file_tag)
         elif MATPLOTLIB_AVAILABLE:
-            return self._create_matplotlib_chart(data, chart_type, x_column, y_column, color_column, title)
+            result = self._create_matplotlib_chart(data, chart_type, x_column, y_column, color_column, title,
+                                                   file_tag)
         else:
             return {"error": "No visualization libraries available"}
 
+        # Only successful renders are cached
+        if cache_key is not None and "error" not in result:
+            self._cache[cache_key] = result
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def _cache_key(self, data: Union[str, pd.DataFrame], chart_type: str,
+                   x_column: Optional[str], y_column: Optional[str],
+                   color_column: Optional[str], title: Optional[str],
+                   interactive: bool, save_html: bool) -> Optional[tuple]:
+        """
+        Build a cache key from a digest of the data and the chart parameters.
+
+        Returns:
+            The cache key, or None if the data cannot be hashed
+        """
+        try:
+            if isinstance(data, str):
+                data_bytes = data.encode("utf-8")
+            elif isinstance(data, pd.DataFrame):
+                data_bytes = (pd.util.hash_pandas_object(data, index=True).values.tobytes()
+                              + repr(data.columns.tolist()).encode("utf-8"))
+            else:
+                return None
+        except Exception:
+            # Unhashable cell values (lists, dicts); render without caching
+            return None
+
+        digest = hashlib.blake2b(data_bytes, digest_size=16).digest()
+        return (digest, chart_type, x_column, y_column, color_column, title, interactive, save_html)
+
     def _create_plotly_chart(self, data: pd.DataFrame, chart_type: str, 
                            x_column: Optional[str], y_column: Optional[str],
-                           color_column: Optional[str], title: Optional[str]) -> Dict[str, Any]:
+                           color_column: Optional[str], title: Optional[str],
+                           save_html: bool = True, file_tag: Optional[str] = None) -> Dict[str, Any]:
         """
         Create an interactive chart using Plotly.
         
@@ -108,10 +512,14 @@ class DataVisualizer:
             y_column: Column to use for y-axis
             color_column: Column to use for color
             title: Chart title
+            save_html: Whether to write the chart to an HTML file
+            file_tag: Suffix making the output file name unique to this chart
             
         Returns:
             Dictionary containing visualization information
         """
+        _get_plotly()
+        
         try:
             # Set default columns if not provided
             if x_column is None:
@@ -120,62 +528,61 @@ class DataVisualizer:
             if y_column is None and len(data.columns) > 1:
                 y_column = data.columns[1]
             
-            # Create figure based on chart type
-            fig = None
-            
-            if chart_type.lower() == "bar":
-                fig = px.bar(data, x=x_column, y=y_column, color=color_column, 
-                            title=title, template="plotly_dark")
+            ctype = chart_type.lower()
+            handler = self._plotly_dispatch.get(ctype)
+            if handler is None:
+                return {"error": f"Unsupported chart type: {chart_type}"}
             
-            elif chart_type.lower() == "line":
-                fig = px.line(data, x=x_column, y=y_column, color=color_column, 
-                             title=title, template="plotly_dark")
+            # Downsample large ungrouped scatter/line data; LTTB keeps the visual shape
+            original_rows = len(data)
+            if ctype in ("scatter", "line") and color_column is None:
+                data = _maybe_downsample(data, x_column, y_column)
             
-            elif chart_type.lower() == "scatter":
-                fig = px.scatter(data, x=x_column, y=y_column, color=color_column, 
-                                title=title, template="plotly_dark")
+            # Send the narrowest numeric dtypes to the encoder
+            data = _narrow(data)
             
-            elif chart_type.lower() == "pie":
-                fig = px.pie(data, names=x_column, values=y_column, 
-                            title=title, template="plotly_dark")
+            # Create figure based on chart type
+            fig = handler(data, x_column, y_column, color_column, title)
             
-            elif chart_type.lower() == "heatmap":
-                # For heatmap, pivot the data if necessary
-                if len(data.columns) >= 3 and x_column and y_column and color_column:
-                    pivot_data = data.pivot(index=y_column, columns=x_column, values=color_column)
-                    fig = px.imshow(pivot_data, title=title, template="plotly_dark")
-                else:
-                    # Use correlation matrix if not enough columns specified
-                    corr_matrix = data.corr()
-                    fig = px.imshow(corr_matrix, title=title or "Correlation Matrix", 
-                                   template="plotly_dark")
-            
-            else:
-                return {"error": f"Unsupported chart type: {chart_type}"}
+            # Inputs are built by this class, so skip per-property validation
+            fig._validate = False
             
             # Update layout
             fig.update_layout(
                 paper_bgcolor="#343541",
                 plot_bgcolor="#444654",
-                font=dict(color="#ececf1")
+                font=dict(color="#ececf1"),
+                overwrite=True
             )
             
-            # Save as HTML
-            output_path = os.path.join(self.output_dir, f"plotly_{chart_type}.html")
-            fig.write_html(output_path)
+            # Encode numeric arrays as base64 typed arrays when plotly doesn't do it itself
+            if self.TYPED_ARRAYS and _ENCODE_TYPED_ARRAYS:
+                fig_dict = fig.to_plotly_json()
+                fig_dict["data"] = _encode_typed_arrays(fig_dict["data"])
+                fig = fig_dict
             
             # Convert to JSON for embedding
-            chart_json = fig.to_json()
+            chart_json = pio.to_json(fig, validate=False)
             
-            return {
+            # Save as HTML, loading plotly.js from the CDN instead of inlining ~4 MB
+            output_path = None
+            if save_html:
+                output_path = os.path.join(self.output_dir, _output_name("plotly", chart_type, file_tag, "html"))
+                pio.write_html(fig, output_path, include_plotlyjs="cdn", full_html=True,
+                               validate=False, config={"responsive": True})
+            
+            result = {
                 "type": chart_type,
                 "library": "plotly",
                 "path": output_path,
                 "title": title,
-                "data_shape": data.shape,
+                "data_shape": (original_rows, data.shape[1]),
                 "json": chart_json,
                 "interactive": True
             }
+            if len(data) < original_rows:
+                result["downsampled_from"] = original_rows
+            return result
         
         except Exception as e:
             if DEBUG:
@@ -183,13 +590,15 @@ class DataVisualizer:
             
             # Fall back to matplotlib
             if MATPLOTLIB_AVAILABLE:
-                return self._create_matplotlib_chart(data, chart_type, x_column, y_column, color_column, title)
+                return self._create_matplotlib_chart(data, chart_type, x_column, y_column, color_column, title,
+                                                     file_tag)
             else:
                 return {"error": f"Failed to create Plotly chart: {str(e)}"}
 
     def _create_matplotlib_chart(self, data: pd.DataFrame, chart_type: str, 
                                x_column: Optional[str], y_column: Optional[str],
-                               color_column: Optional[str], title: Optional[str]) -> Dict[str, Any]:
+                               color_column: Optional[str], title: Optional[str],
+                               file_tag: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a static chart using Matplotlib.
         
@@ -200,114 +609,158 @@ class DataVisualizer:
             y_column: Column to use for y-axis
             color_column: Column to use for color
             title: Chart title
+            file_tag: Suffix making the output file name unique to this chart
             
         Returns:
             Dictionary containing visualization information
         """
-        try:
-            # Set default columns if not provided
-            if x_column is None:
-                x_column = data.columns[0]
-            
-            if y_column is None and len(data.columns) > 1:
-                y_column = data.columns[1]
-            
-            # Create figure and axes
-            plt.figure(figsize=(10, 6), facecolor="#343541")
-            ax = plt.gca()
-            ax.set_facecolor("#444654")
-            
-            # Create chart based on type
-            if chart_type.lower() == "bar":
-                if color_column and color_column in data.columns:
-                    # Group by color column
-                    grouped = data.groupby(color_column)
-                    for name, group in grouped:
-                        group.plot(kind="bar", x=x_column, y=y_column, ax=ax, label=name)
-                else:
-                    data.plot(kind="bar", x=x_column, y=y_column, ax=ax)
-            
-            elif chart_type.lower() == "line":
-                if color_column and color_column in data.columns:
-                    # Group by color column
-                    grouped = data.groupby(color_column)
-                    for name, group in grouped:
-                        group.plot(kind="line", x=x_column, y=y_column, ax=ax, label=name)
-                else:
-                    data.plot(kind="line", x=x_column, y=y_column, ax=ax)
-            
-            elif chart_type.lower() == "scatter":
-                if color_column and color_column in data.columns:
-                    # Use seaborn for better scatter plots with categories
-                    sns.scatterplot(data=data, x=x_column, y=y_column, hue=color_column, ax=ax)
-                else:
-                    data.plot(kind="scatter", x=x_column, y=y_column, ax=ax)
-            
-            elif chart_type.lower() == "pie":
+        _get_matplotlib()
+        
+        with self._mpl_lock:
+            try:
+                # Set default columns if not provided
+                if x_column is None:
+                    x_column = data.columns[0]
+                
+                if y_column is None and len(data.columns) > 1:
+                    y_column = data.columns[1]
+                
+                ctype = chart_type.lower()
+                handler = self._mpl_dispatch.get(ctype)
+                if handler is None:
+                    return {"error": f"Unsupported chart type: {chart_type}"}
+                
+                # Reuse the figure, starting from a fresh set of axes
+                fig = self._get_figure()
+                fig.clf()
+                ax = fig.add_subplot(111)
+                
+                # Create chart based on type
+                handler(ax, data, x_column, y_column, color_column)
+                
+                # Set title and labels; colors come from _CHART_RC_PARAMS
+                ax.set_title(title or f"{chart_type.capitalize()} Chart")
+                ax.set_xlabel(x_column)
                 if y_column:
-                    data.plot(kind="pie", y=y_column, labels=data[x_column], ax=ax)
-                else:
-                    # If no y_column specified, use value counts of x_column
-                    data[x_column].value_counts().plot(kind="pie", ax=ax)
-            
-            elif chart_type.lower() == "heatmap":
-                # For heatmap, use correlation matrix if not enough columns specified
-                if len(data.columns) >= 3 and x_column and y_column and color_column:
-                    pivot_data = data.pivot(index=y_column, columns=x_column, values=color_column)
-                    sns.heatmap(pivot_data, annot=True, cmap="viridis", ax=ax)
-                else:
-                    # Use correlation matrix
-                    corr_matrix = data.corr()
-                    sns.heatmap(corr_matrix, annot=True, cmap="viridis", ax=ax)
-            
-            else:
-                return {"error": f"Unsupported chart type: {chart_type}"}
-            
-            # Set title and style
-            plt.title(title or f"{chart_type.capitalize()} Chart", color="#ececf1")
-            plt.xlabel(x_column, color="#ececf1")
-            if y_column:
-                plt.ylabel(y_column, color="#ececf1")
-            
-            # Style the chart
-            plt.grid(True, linestyle="--", alpha=0.7)
-            plt.tick_params(colors="#ececf1")
-            for spine in ax.spines.values():
-                spine.set_color("#8e8ea0")
-            
-            if ax.legend_:
-                ax.legend_.set_frame_on(True)
-                ax.legend_.get_frame().set_facecolor("#343541")
-                ax.legend_.get_frame().set_edgecolor("#8e8ea0")
-                for text in ax.legend_.get_texts():
-                    text.set_color("#ececf1")
-            
-            # Save the figure
-            output_path = os.path.join(self.output_dir, f"matplotlib_{chart_type}.png")
-            plt.tight_layout()
-            plt.savefig(output_path, facecolor="#343541", edgecolor="none")
-            
-            # Convert to base64 for embedding
-            with open(output_path, "rb") as img_file:
-                img_data = base64.b64encode(img_file.read()).decode("utf-8")
-            
-            # Close the figure to free memory
-            plt.close()
-            
-            return {
-                "type": chart_type,
-                "library": "matplotlib",
-                "path": output_path,
-                "title": title,
-                "data_shape": data.shape,
-                "base64": img_data,
-                "interactive": False
-            }
+                    ax.set_ylabel(y_column)
+                
+                # Render the figure once in memory
+                fig.tight_layout()
+                buf = io.BytesIO()
+                fig.savefig(buf, format="png", facecolor="#343541", edgecolor="none")
+                raw = buf.getvalue()
+                
+                # Save the figure
+                output_path = os.path.join(self.output_dir, _output_name("matplotlib", chart_type, file_tag, "png"))
+                with open(output_path, "wb") as img_file:
+                    img_file.write(raw)
+                
+                # Convert to base64 for embedding
+                img_data = base64.b64encode(raw).decode("ascii")
+                
+                # Drop the plotted artists so the data can be freed
+                fig.clf()
+                
+                return {
+                    "type": chart_type,
+                    "library": "matplotlib",
+                    "path": output_path,
+                    "title": title,
+                    "data_shape": data.shape,
+                    "base64": img_data,
+                    "interactive": False
+                }
         
-        except Exception as e:
-            if DEBUG:
-                print(f"Error creating Matplotlib chart: {e}")
-            return {"error": f"Failed to create Matplotlib chart: {str(e)}"}
+            except Exception as e:
+                if DEBUG:
+                    print(f"Error creating Matplotlib chart: {e}")
+                return {"error": f"Failed to create Matplotlib chart: {str(e)}"}
+
+    # Plotly chart builders; px is loaded by _get_plotly before dispatch
+
+    def _plotly_bar(self, data, x_column, y_column, color_column, title):
+        """Build a Plotly bar chart."""
+        return px.bar(data, x=x_column, y=y_column, color=color_column, 
+                      title=title, template="plotly_dark")
+
+    def _plotly_line(self, data, x_column, y_column, color_column, title):
+        """Build a Plotly line chart."""
+        return px.line(data, x=x_column, y=y_column, color=color_column, 
+                       title=title, template="plotly_dark")
+
+    def _plotly_scatter(self, data, x_column, y_column, color_column, title):
+        """Build a Plotly scatter plot."""
+        return px.scatter(data, x=x_column, y=y_column, color=color_column, 
+                          title=title, template="plotly_dark")
+
+    def _plotly_pie(self, data, x_column, y_column, color_column, title):
+        """Build a Plotly pie chart."""
+        return px.pie(data, names=x_column, values=y_column, 
+                      title=title, template="plotly_dark")
+
+    def _plotly_heatmap(self, data, x_column, y_column, color_column, title):
+        """Build a Plotly heatmap from a pivot or correlation matrix."""
+        # For heatmap, pivot the data if necessary
+        if len(data.columns) >= 3 and x_column and y_column and color_column:
+            pivot_data = _pivot(data, y_column, x_column, color_column)
+            return px.imshow(pivot_data, title=title, template="plotly_dark")
+        
+        # Use correlation matrix if not enough columns specified
+        corr_matrix = _correlation_matrix(data)
+        return px.imshow(corr_matrix, title=title or "Correlation Matrix", 
+                         template="plotly_dark")
+
+    # Matplotlib chart builders; sns is loaded by _get_matplotlib before dispatch
+
+    def _mpl_bar(self, ax, data, x_column, y_column, color_column):
+        """Draw a bar chart on the given axes."""
+        if color_column and color_column in data.columns:
+            # Draw all groups in one call; errorbar=None skips bootstrapping
+            sns.barplot(data=data, x=x_column, y=y_column, hue=color_column, errorbar=None, ax=ax)
+        else:
+            data.plot(kind="bar", x=x_column, y=y_column, ax=ax)
+
+    def _mpl_line(self, ax, data, x_column, y_column, color_column):
+        """Draw a line chart on the given axes."""
+        if color_column and color_column in data.columns:
+            # Draw all groups in one call; errorbar=None skips bootstrapping
+            sns.lineplot(data=data, x=x_column, y=y_column, hue=color_column, errorbar=None, ax=ax)
+        else:
+            data.plot(kind="line", x=x_column, y=y_column, ax=ax)
+
+    def _mpl_scatter(self, ax, data, x_column, y_column, color_column):
+        """Draw a scatter plot on the given axes."""
+        if color_column and color_column in data.columns:
+            # Use seaborn for better scatter plots with categories
+            sns.scatterplot(data=data, x=x_column, y=y_column, hue=color_column, ax=ax)
+        else:
+            data.plot(kind="scatter", x=x_column, y=y_column, ax=ax)
+
+    def _mpl_pie(self, ax, data, x_column, y_column, color_column):
+        """Draw a pie chart on the given axes."""
+        if y_column:
+            data.plot(kind="pie", y=y_column, labels=data[x_column], ax=ax)
+        else:
+            # If no y_column specified, use value counts of x_column
+            data[x_column].value_counts().plot(kind="pie", ax=ax)
+
+    def _mpl_heatmap(self, ax, data, x_column, y_column, color_column):
+        """Draw a heatmap from a pivot or correlation matrix on the given axes."""
+        # For heatmap, use correlation matrix if not enough columns specified
+        if len(data.columns) >= 3 and x_column and y_column and color_column:
+            pivot_data = _pivot(data, y_column, x_column, color_column)
+            sns.heatmap(pivot_data, annot=True, cmap="viridis", ax=ax)
+        else:
+            # Use correlation matrix
+            corr_matrix = _correlation_matrix(data)
+            sns.heatmap(corr_matrix, annot=True, cmap="viridis", ax=ax)
+
+    def _get_figure(self):
+        """Return the shared matplotlib Figure, creating it on first use."""
+        if self._fig is None:
+            from matplotlib.figure import Figure
+            self._fig = Figure(figsize=(10, 6), facecolor="#343541")
+        return self._fig
 
     def parse_csv(self, csv_data: str) -> Dict[str, Any]:
         """
@@ -321,16 +774,22 @@ class DataVisualizer:
         """
         try:
             # Parse CSV
-            df = pd.read_csv(io.StringIO(csv_data))
+            df = _read_csv(csv_data)
             
-            # Generate summary
+            # Generate summary; per-column statistics stay as numpy arrays
+            # aligned with "columns" rather than nested Python dicts
+            describe = df.describe()
             summary = {
                 "shape": df.shape,
                 "columns": df.columns.tolist(),
-                "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
+                "dtypes": df.dtypes.astype(str).to_dict(),
                 "head": df.head(5).to_dict(orient="records"),
-                "describe": df.describe().to_dict(),
-                "missing": df.isnull().sum().to_dict()
+                "describe": {
+                    "index": describe.index.tolist(),
+                    "columns": describe.columns.tolist(),
+                    "values": describe.to_numpy(),
+                },
+                "missing": df.isnull().to_numpy().sum(axis=0)
             }
             
             return {
@@ -347,5 +806,26 @@ class DataVisualizer:
                 "error": f"Failed to parse CSV data: {str(e)}"
             }
 
+    def summary_to_json(self, summary: Dict[str, Any]) -> str:
+        """
+        Serialize a parse_csv summary to JSON.
+        
+        Args:
+            summary: Summary dictionary returned by parse_csv
+            
+        Returns:
+            JSON string
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(summary, default=_json_default,
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return json.dumps(summary, default=_json_default)
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy and pandas values that the JSON encoders don't handle natively."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
 # Create a singleton instance
 data_visualizer = DataVisualizer()
@@ -3,20 +3,94 @@ File operations tools for SuperNova AI.
 """
 
 import os
+import stat
 import json
 import csv
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Tuple
 import shutil
 
 from ..config.tools import FILE_CONFIG
 
+# Check for async file I/O support
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# Chunk size for binary reads and writes
+_BUFSZ = 1 << 20
+
+# Maximum number of files open at once in batch operations
+_BATCH_CONCURRENCY = 32
+
+# Working directory cached per process so relative paths don't cost a getcwd() call
+_cwd_cache = (os.getpid(), os.getcwd())
+
+def _cwd() -> str:
+    """Return the cached working directory, refreshing it after a fork."""
+    global _cwd_cache
+    pid = os.getpid()
+    if _cwd_cache[0] != pid:
+        _cwd_cache = (pid, os.getcwd())
+    return _cwd_cache[1]
+
+def _read_bytes(file_path: str, file_size: int) -> bytearray:
+    """Read a file into a preallocated buffer in _BUFSZ chunks, returning the buffer itself."""
+    buf = bytearray(file_size)
+    view = memoryview(buf)
+    offset = 0
+    with open(file_path, "rb") as f:
+        while offset < file_size:
+            n = f.readinto(view[offset:offset + _BUFSZ])
+            if not n:
+                break
+            offset += n
+    view.release()
+    # Trim in place if the file shrank since it was stat'ed; no copy either way
+    if offset < file_size:
+        del buf[offset:]
+    return buf
+
+def _write_bytes(file_path: str, data: bytes):
+    """Write bytes to a file in _BUFSZ chunks."""
+    view = memoryview(data)
+    with open(file_path, "wb") as f:
+        for offset in range(0, len(view), _BUFSZ):
+            f.write(view[offset:offset + _BUFSZ])
+
+def _decode_text(raw: bytes) -> str:
+    """Decode UTF-8 file contents, matching text-mode universal newline handling."""
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+def _encode_text(content: str) -> bytes:
+    """Encode text for writing, matching text-mode newline translation."""
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode("utf-8")
+
+def _run_sync(coro):
+    """Run a coroutine to completion, even when called from inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 class FileOperations:
     """File operations tool for managing files."""
 
     def __init__(self):
         """Initialize the file operations tool."""
-        self.allowed_extensions = set(FILE_CONFIG["allowed_extensions"])
+        self.allowed_extensions = frozenset(ext.lower() for ext in FILE_CONFIG["allowed_extensions"])
+        self._allowed_extensions_str = ", ".join(sorted(self.allowed_extensions))
         self.max_file_size = FILE_CONFIG["max_file_size"]
         self.output_dir = FILE_CONFIG["output_dir"]
 
@@ -36,35 +110,12 @@ class FileOperations:
         try:
             file_path = self._normalize_path(file_path)
 
-            # Check if file exists
-            if not os.path.exists(file_path):
-                return {
-                    "status": "error",
-                    "error": f"File not found: {file_path}",
-                    "content": None,
-                }
-
-            # Check file extension
-            _, ext = os.path.splitext(file_path)
-            if ext not in self.allowed_extensions:
-                return {
-                    "status": "error",
-                    "error": f"File extension not allowed: {ext}. Allowed extensions: {', '.join(self.allowed_extensions)}",
-                    "content": None,
-                }
-
-            # Check file size
-            file_size = os.path.getsize(file_path)
-            if file_size > self.max_file_size:
-                return {
-                    "status": "error",
-                    "error": f"File too large: {file_size} bytes. Maximum allowed: {self.max_file_size} bytes",
-                    "content": None,
-                }
+            error, file_size = self._check_readable(file_path)
+            if error:
+                return error
 
-            # Read file
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Read file into a preallocated buffer and decode once
+            content = _decode_text(_read_bytes(file_path, file_size))
 
             return {
                 "status": "success",
@@ -94,20 +145,15 @@ class FileOperations:
         try:
             file_path = self._normalize_path(file_path)
 
-            # Check file extension
-            _, ext = os.path.splitext(file_path)
-            if ext not in self.allowed_extensions:
-                return {
-                    "status": "error",
-                    "error": f"File extension not allowed: {ext}. Allowed extensions: {', '.join(self.allowed_extensions)}",
-                }
+            error = self._check_writable(file_path)
+            if error:
+                return error
 
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-            # Write file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Encode once and write in fixed-size chunks
+            _write_bytes(file_path, _encode_text(content))
 
             return {
                 "status": "success",
@@ -142,19 +188,19 @@ class FileOperations:
                     "files": [],
                 }
 
-            # List files
+            # List files; DirEntry caches type info from the directory read
             files = []
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                item_stat = os.stat(item_path)
-
-                files.append({
-                    "name": item,
-                    "path": item_path,
-                    "size": item_stat.st_size,
-                    "is_dir": os.path.isdir(item_path),
-                    "modified": item_stat.st_mtime,
-                })
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    item_stat = entry.stat()
+
+                    files.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": item_stat.st_size,
+                        "is_dir": entry.is_dir(),
+                        "modified": item_stat.st_mtime,
+                    })
 
             return {
                 "status": "success",
@@ -206,6 +252,160 @@ class FileOperations:
                 "error": f"Error deleting file: {str(e)}",
             }
 
+    def read_files(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read several files concurrently.
+
+        Args:
+            file_paths: Paths of the files to read
+
+        Returns:
+            A list of read_file-style results, in the same order as file_paths
+        """
+        return _run_sync(self._gather(self._read_one, [(path,) for path in file_paths]))
+
+    def write_files(self, files: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Write several files concurrently.
+
+        Args:
+            files: Dictionary mapping file paths to content
+
+        Returns:
+            A list of write_file-style results, in the same order as files
+        """
+        return _run_sync(self._gather(self._write_one, list(files.items())))
+
+    async def _gather(self, func, args_list: List[tuple]) -> List[Dict[str, Any]]:
+        """Run func over args_list concurrently, bounded by _BATCH_CONCURRENCY open files."""
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        return await asyncio.gather(*(func(semaphore, *args) for args in args_list))
+
+    async def _read_one(self, semaphore: asyncio.Semaphore, file_path: str) -> Dict[str, Any]:
+        """Read one file for read_files, after the same checks as read_file."""
+        try:
+            file_path = self._normalize_path(file_path)
+            error, file_size = self._check_readable(file_path)
+            if error:
+                return error
+
+            async with semaphore:
+                if AIOFILES_AVAILABLE:
+                    async with aiofiles.open(file_path, "rb") as f:
+                        raw = await f.read()
+                else:
+                    raw = await asyncio.to_thread(_read_bytes, file_path, file_size)
+
+            return {
+                "status": "success",
+                "error": "",
+                "content": _decode_text(raw),
+                "size": file_size,
+                "path": file_path,
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Error reading file: {str(e)}",
+                "content": None,
+            }
+
+    async def _write_one(self, semaphore: asyncio.Semaphore, file_path: str, content: str) -> Dict[str, Any]:
+        """Write one file for write_files, after the same checks as write_file."""
+        try:
+            file_path = self._normalize_path(file_path)
+            error = self._check_writable(file_path)
+            if error:
+                return error
+
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            data = _encode_text(content)
+
+            async with semaphore:
+                if AIOFILES_AVAILABLE:
+                    async with aiofiles.open(file_path, "wb") as f:
+                        await f.write(data)
+                else:
+                    await asyncio.to_thread(_write_bytes, file_path, data)
+
+            return {
+                "status": "success",
+                "error": "",
+                "path": file_path,
+                "size": len(content),
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Error writing file: {str(e)}",
+            }
+
+    def _check_readable(self, file_path: str) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Check that a normalized path is a readable file of an allowed type and size.
+
+        Args:
+            file_path: Normalized file path
+
+        Returns:
+            A tuple of (error result or None, file size)
+        """
+        # Check if file exists
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            return {
+                "status": "error",
+                "error": f"File not found: {file_path}",
+                "content": None,
+            }, 0
+
+        # Directories have no extension to check
+        if stat.S_ISDIR(file_stat.st_mode):
+            return {
+                "status": "error",
+                "error": f"Path is a directory: {file_path}",
+                "content": None,
+            }, 0
+
+        # Check file extension
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in self.allowed_extensions:
+            return {
+                "status": "error",
+                "error": f"File extension not allowed: {ext}. Allowed extensions: {self._allowed_extensions_str}",
+                "content": None,
+            }, 0
+
+        # Check file size
+        file_size = file_stat.st_size
+        if file_size > self.max_file_size:
+            return {
+                "status": "error",
+                "error": f"File too large: {file_size} bytes. Maximum allowed: {self.max_file_size} bytes",
+                "content": None,
+            }, 0
+
+        return None, file_size
+
+    def _check_writable(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Check that a normalized path has an allowed extension.
+
+        Args:
+            file_path: Normalized file path
+
+        Returns:
+            An error result, or None if the path can be written
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in self.allowed_extensions:
+            return {
+                "status": "error",
+                "error": f"File extension not allowed: {ext}. Allowed extensions: {self._allowed_extensions_str}",
+            }
+        return None
+
     def _normalize_path(self, path: str) -> str:
         """
         Normalize a file path.
@@ -217,10 +417,7 @@ class FileOperations:
             Normalized file path
         """
         # Convert to absolute path if not already
-        if not os.path.isabs(path):
-            path = os.path.abspath(path)
-
-        return path
+        return os.path.normpath(path if os.path.isabs(path) else os.path.join(_cwd(), path))
 
 # Create a singleton instance
 file_operations = FileOperations()
@@ -3,39 +3,142 @@ Image generation tools for SuperNova AI.
 """
 
 import os
+import json
+import atexit
 import base64
-import requests
-from typing import Optional, Dict, Any, List
+import shutil
+import asyncio
+import hashlib
+import uuid
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Set
 from ..config.env import DEBUG
 
-# Check for Stable Diffusion API availability
+# Check for async HTTP client availability (used for the Stability and OpenAI REST APIs)
 try:
-    import stability_sdk
-    from stability_sdk import client
-    STABILITY_AVAILABLE = True
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
 except ImportError:
-    STABILITY_AVAILABLE = False
+    AIOHTTP_AVAILABLE = False
 
-# Check for OpenAI DALL-E availability
+# Check for the OpenAI SDK (async client used for DALL-E when installed)
 try:
-    import openai
+    from openai import AsyncOpenAI, APIConnectionError, APIStatusError
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Check for tenacity (retries transient API failures)
+try:
+    from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+    TENACITY_AVAILABLE = True
+except ImportError:
+    TENACITY_AVAILABLE = False
+
+# REST endpoints
+STABILITY_API_URL = "https://api.stability.ai/v1/generation/{engine_id}/text-to-image"
+OPENAI_IMAGES_URL = "https://api.openai.com/v1/images/generations"
+
+# Prompt suffix for each style
+_STYLE_SUFFIX = {
+    "oil painting": ", oil painting style",
+    "watercolor": ", watercolor painting style",
+    "sketch": ", pencil sketch style",
+    "digital art": ", digital art style, highly detailed",
+    "anime": ", anime style, highly detailed",
+}
+
+# Stability engine for styles that don't use the default engine
+_STABILITY_ENGINE = {"anime": "stable-diffusion-anime-1", "cartoon": "stable-diffusion-anime-1"}
+_STABILITY_DEFAULT_ENGINE = "stable-diffusion-xl-1024-v1-0"
+
+# Connection pool settings for the shared HTTP session
+SESSION_CONNECTION_LIMIT = 32
+SESSION_KEEPALIVE_TIMEOUT = 60
+
+# Retry policy for transient API failures
+RETRY_ATTEMPTS = 4
+RETRY_MAX_WAIT = 30
+
+def _is_transient(exc: BaseException) -> bool:
+    """Return True for failures worth retrying: rate limits, 5xx responses and network errors."""
+    if AIOHTTP_AVAILABLE and isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    if OPENAI_AVAILABLE and isinstance(exc, APIStatusError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    if OPENAI_AVAILABLE and isinstance(exc, APIConnectionError):
+        return True
+    if AIOHTTP_AVAILABLE and isinstance(exc, aiohttp.ClientError):
+        return True
+    return isinstance(exc, asyncio.TimeoutError)
+
+if TENACITY_AVAILABLE:
+    _retry_transient = retry(
+        wait=wait_exponential_jitter(initial=1, max=RETRY_MAX_WAIT),
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        retry=retry_if_exception(_is_transient),
+        reraise=True,
+    )
+else:
+    def _retry_transient(func):
+        return func
+
+# Write buffer for saved images, large enough to hold a typical PNG in one write
+_IMAGE_BUFSZ = 1 << 20
+
+# Maximum number of threads writing images from one response
+MAX_WRITE_WORKERS = 8
+
+# Chunk size for streaming image downloads
+_DOWNLOAD_CHUNK = 64 * 1024
+
+def _save_image(img_path: str, data: bytes):
+    """Write image bytes to disk through a _IMAGE_BUFSZ buffer without copying them."""
+    with open(img_path, "wb", buffering=_IMAGE_BUFSZ) as f:
+        f.write(memoryview(data))
+
+def _save_b64_image(img_path: str, payload: str):
+    """Decode a base64 image payload and write it to disk."""
+    _save_image(img_path, base64.b64decode(payload))
+
 class ImageGenerator:
     """Image generation tool using available APIs."""
 
+    # Directories already created in this process, shared across instances
+    _created_dirs: Set[str] = set()
+
     def __init__(self):
         """Initialize the image generation tool."""
         self.stability_api_key = os.getenv("STABILITY_API_KEY", "")
         self.openai_api_key = os.getenv("OPENAI_API_KEY", "")
         self.output_dir = os.path.join(os.getcwd(), "output", "images")
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(self.output_dir, exist_ok=True)
 
-    def generate_image(self, prompt: str, style: str = "photorealistic", 
+        self.cache_dir = os.getenv("IMAGE_CACHE_DIR", os.path.join(self.output_dir, "cache"))
+
+        # Create output and cache directories if they don't exist
+        for directory in (self.output_dir, self.cache_dir):
+            if directory not in ImageGenerator._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                ImageGenerator._created_dirs.add(directory)
+
+        # Requests run on a private event loop thread so one HTTP session can be
+        # reused across calls, whichever thread or event loop the caller is on
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._session = None
+
+        # Async OpenAI client, reused across DALL-E requests; its built-in retries
+        # are disabled when tenacity retries the call instead
+        self._aoai = None
+        if OPENAI_AVAILABLE and self.openai_api_key:
+            self._aoai = AsyncOpenAI(api_key=self.openai_api_key, max_retries=0 if TENACITY_AVAILABLE else 2)
+
+        # Warm the aspect ratio cache with the default ratio
+        ImageGenerator._parse_aspect_ratio("1:1")
+
+    def generate_image(self, prompt: str, style: str = "photorealistic",
                       aspect_ratio: str = "1:1", num_images: int = 1) -> List[Dict[str, Any]]:
         """
         Generate images based on a text prompt.
@@ -49,56 +152,186 @@ class ImageGenerator:
         Returns:
             A list of dictionaries containing image information
         """
+        return self._run(self._generate_image_async(prompt, style, aspect_ratio, num_images))
+
+    async def generate_images_batch(self, prompts: List[str], style: str = "photorealistic",
+                                    aspect_ratio: str = "1:1", num_images: int = 1) -> List[List[Dict[str, Any]]]:
+        """
+        Generate images for several prompts concurrently.
+
+        Args:
+            prompts: Text descriptions of the desired images
+            style: Style of the images
+            aspect_ratio: Aspect ratio of the images
+            num_images: Number of images to generate per prompt
+
+        Returns:
+            One list of image information dictionaries per prompt, in prompt order
+        """
+        async def batch():
+            return await asyncio.gather(*(
+                self._generate_image_async(prompt, style, aspect_ratio, num_images) for prompt in prompts
+            ))
+
+        future = asyncio.run_coroutine_threadsafe(batch(), self._get_loop())
+        return await asyncio.wrap_future(future)
+
+    async def _generate_image_async(self, prompt: str, style: str, aspect_ratio: str,
+                                    num_images: int) -> List[Dict[str, Any]]:
+        """Dispatch one generation request to the preferred available backend."""
         # Parse aspect ratio
         width, height = self._parse_aspect_ratio(aspect_ratio)
-        
+
+        # Pick the backend first so its engine can key the cache
+        if self.stability_api_key and AIOHTTP_AVAILABLE:
+            # If Stability API key is available, use Stability
+            engine = self._stability_engine(style)
+        elif self.openai_api_key and AIOHTTP_AVAILABLE:
+            # If OpenAI API key is available, use DALL-E
+            engine = "dall-e-3"
+        else:
+            # Otherwise, use a simulated image generation
+            engine = "simulated"
+
         # Print debug information
         if DEBUG:
-            print(f"Generating image with prompt: {prompt}")
-            print(f"Style: {style}")
-            print(f"Aspect ratio: {aspect_ratio} ({width}x{height})")
-            print(f"Number of images: {num_images}")
-            print(f"Stability API key available: {bool(self.stability_api_key)}")
-            print(f"OpenAI API key available: {bool(self.openai_api_key)}")
-            print(f"Stability SDK available: {STABILITY_AVAILABLE}")
-            print(f"OpenAI available: {OPENAI_AVAILABLE}")
-        
-        # Try different image generation methods in order of preference
-        if self.stability_api_key and STABILITY_AVAILABLE:
-            # If Stability API key is available and package is installed, use Stability
-            if DEBUG:
-                print("Using Stability AI for image generation")
-            return self._stability_generate(prompt, style, width, height, num_images)
-        elif self.openai_api_key and OPENAI_AVAILABLE:
-            # If OpenAI API key is available and package is installed, use DALL-E
-            if DEBUG:
-                print("Using OpenAI DALL-E for image generation")
-            return self._dalle_generate(prompt, style, width, height, num_images)
+            print(f"Generating {num_images} image(s) with {engine}: prompt={prompt!r}, style={style!r}, "
+                  f"aspect ratio {aspect_ratio} ({width}x{height}); "
+                  f"Stability key: {bool(self.stability_api_key)}, OpenAI key: {bool(self.openai_api_key)}, "
+                  f"aiohttp: {AIOHTTP_AVAILABLE}, OpenAI SDK: {OPENAI_AVAILABLE}")
+
+        if engine == "simulated":
+            return self._simulated_generate(prompt, style, width, height, num_images)
+
+        # Serve images generated before for the same request from the cache
+        key = self._cache_key(prompt, style, width, height, engine)
+        cache_paths = [os.path.join(self.cache_dir, f"{key}_{i}.png") for i in range(num_images)]
+        results = [None] * num_images
+        missing = []
+        for i, cache_path in enumerate(cache_paths):
+            if os.path.exists(cache_path):
+                results[i] = {
+                    "path": cache_path,
+                    "prompt": prompt,
+                    "style": style,
+                    "width": width,
+                    "height": height,
+                    "engine": engine,
+                    "cached": True
+                }
+            else:
+                missing.append(i)
+
+        if DEBUG:
+            print(f"Image cache: {num_images - len(missing)} hit(s), {len(missing)} miss(es)")
+
+        if not missing:
+            return results
+
+        # Only request the images the cache could not supply
+        if engine == "dall-e-3":
+            generated = await self._dalle_generate(prompt, style, width, height, len(missing))
         else:
-            # Otherwise, use a simulated image generation
+            generated = await self._stability_generate(prompt, style, width, height, len(missing))
+
+        for i, result in zip(missing, generated):
+            # Results from a fallback backend belong to another engine's key
+            if result["engine"] == engine and result["path"]:
+                self._cache_store(result["path"], cache_paths[i])
+            results[i] = result
+
+        return results
+
+    def _cache_key(self, prompt: str, style: str, width: int, height: int, engine: str) -> str:
+        """
+        Build the content-addressed cache key for a generation request.
+
+        Args:
+            prompt: Text description of the desired image
+            style: Style of the image
+            width: Image width
+            height: Image height
+            engine: Engine that generates the image
+
+        Returns:
+            Hex digest identifying the request
+        """
+        request = {"prompt": prompt, "style": style, "width": width, "height": height, "engine": engine}
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _cache_store(self, img_path: str, cache_path: str):
+        """Copy a generated image into the cache, replacing the entry atomically."""
+        # Copy rather than hard link so later edits to the output file can't alter the cache
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            shutil.copyfile(img_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
             if DEBUG:
-                print("Using simulated image generation")
-            return self._simulated_generate(prompt, style, width, height, num_images)
+                print(f"Error caching image {img_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _stability_engine(self, style: str) -> str:
+        """Map a style to the Stability engine that renders it."""
+        return _STABILITY_ENGINE.get(style.lower(), _STABILITY_DEFAULT_ENGINE)
 
-    def _parse_aspect_ratio(self, aspect_ratio: str) -> tuple:
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use."""
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="image-generation", daemon=True).start()
+                    self._loop = loop
+        return self._loop
+
+    def _run(self, coro):
+        """Run a coroutine on the background event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None:
+            atexit.register(self._close_session)
+        if self._session is None or self._session.closed:
+            # Keep connections alive between generations to skip repeat TLS handshakes
+            connector = aiohttp.TCPConnector(limit=SESSION_CONNECTION_LIMIT,
+                                             keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def _close_session(self):
+        """Close the shared HTTP session at interpreter exit."""
+        if self._session is not None and not self._session.closed:
+            try:
+                self._run(self._session.close())
+            except Exception as e:
+                if DEBUG:
+                    print(f"Error closing image generation session: {e}")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_aspect_ratio(aspect_ratio: str) -> tuple:
         """
-        Parse aspect ratio string into width and height.
-        
+        Parse aspect ratio string into width and height. Results are cached
+        since only a handful of distinct ratios are used in practice.
+
         Args:
             aspect_ratio: Aspect ratio string (e.g., "1:1", "16:9")
-            
+
         Returns:
             Tuple of (width, height)
         """
         # Default to 512x512
         default_size = (512, 512)
-        
+
         try:
             # Parse the aspect ratio
             if ":" in aspect_ratio:
                 w_str, h_str = aspect_ratio.split(":")
                 w, h = int(w_str), int(h_str)
-                
+
                 # Calculate dimensions while maintaining a reasonable size
                 base_size = 512
                 if w > h:
@@ -107,7 +340,7 @@ class ImageGenerator:
                 else:
                     height = base_size
                     width = int(base_size * w / h)
-                
+
                 return (width, height)
             else:
                 # Handle specific size formats like "512x512"
@@ -117,117 +350,93 @@ class ImageGenerator:
         except (ValueError, ZeroDivisionError):
             if DEBUG:
                 print(f"Invalid aspect ratio: {aspect_ratio}. Using default size.")
-        
+
         return default_size
 
-    def _stability_generate(self, prompt: str, style: str, width: int, height: int, num_images: int) -> List[Dict[str, Any]]:
+    async def _stability_generate(self, prompt: str, style: str, width: int, height: int, num_images: int) -> List[Dict[str, Any]]:
         """
-        Generate images using Stability AI API.
-        
+        Generate images using the Stability AI REST API.
+
         Args:
             prompt: Text description of the desired image
             style: Style of the image
             width: Image width
             height: Image height
             num_images: Number of images to generate
-            
+
         Returns:
             A list of dictionaries containing image information
         """
         try:
-            # Initialize the Stability API client
-            stability_api = client.StabilityInference(
-                key=self.stability_api_key,
-                verbose=DEBUG
-            )
-            
             # Map style to engine
-            engine_id = "stable-diffusion-xl-1024-v1-0"
-            if style.lower() == "photorealistic":
-                engine_id = "stable-diffusion-xl-1024-v1-0"
-            elif style.lower() in ["anime", "cartoon"]:
-                engine_id = "stable-diffusion-anime-1"
-            
+            engine_id = self._stability_engine(style)
+
             # Prepare style prompt
-            style_prompt = ""
-            if style.lower() == "oil painting":
-                style_prompt = ", oil painting style"
-            elif style.lower() == "watercolor":
-                style_prompt = ", watercolor painting style"
-            elif style.lower() == "sketch":
-                style_prompt = ", pencil sketch style"
-            elif style.lower() == "digital art":
-                style_prompt = ", digital art style, highly detailed"
-            
+            style_prompt = _STYLE_SUFFIX.get(style.lower(), "")
+
             # Generate images
-            answers = stability_api.generate(
-                prompt=f"{prompt}{style_prompt}",
-                height=height,
-                width=width,
-                samples=num_images,
-                steps=50
-            )
-            
-            # Process and save the generated images
-            results = []
-            for i, answer in enumerate(answers):
-                # Save the image
-                img_path = os.path.join(self.output_dir, f"stability_gen_{i}.png")
-                with open(img_path, "wb") as f:
-                    f.write(answer.artifacts[0].binary)
-                
+            payload = await self._post_stability(engine_id, {
+                "text_prompts": [{"text": f"{prompt}{style_prompt}"}],
+                "height": height,
+                "width": width,
+                "samples": num_images,
+                "steps": 50,
+            })
+
+            # Save the generated images in parallel; the writes are I/O-bound
+            artifacts = payload["artifacts"]
+            # Unique per-request names keep concurrent requests from overwriting each other
+            output_prefix = os.path.join(self.output_dir, f"stability_gen_{uuid.uuid4().hex[:8]}_")
+            img_paths = [f"{output_prefix}{i}.png" for i in range(len(artifacts))]
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=max(1, min(len(artifacts), MAX_WRITE_WORKERS))) as executor:
+                await asyncio.gather(*(
+                    loop.run_in_executor(executor, _save_b64_image, img_path, artifact["base64"])
+                    for img_path, artifact in zip(img_paths, artifacts)
+                ))
+
+            # Process the generated images
+            results = [None] * len(img_paths)
+            for i, img_path in enumerate(img_paths):
                 # Add to results
-                results.append({
+                results[i] = {
                     "path": img_path,
                     "prompt": prompt,
                     "style": style,
                     "width": width,
                     "height": height,
                     "engine": engine_id
-                })
-            
+                }
+
             return results
-        
+
         except Exception as e:
             if DEBUG:
                 print(f"Error using Stability AI API: {e}")
             # Fall back to DALL-E if available
-            if self.openai_api_key and OPENAI_AVAILABLE:
-                return self._dalle_generate(prompt, style, width, height, num_images)
+            if self.openai_api_key:
+                return await self._dalle_generate(prompt, style, width, height, num_images)
             else:
                 return self._simulated_generate(prompt, style, width, height, num_images)
 
-    def _dalle_generate(self, prompt: str, style: str, width: int, height: int, num_images: int) -> List[Dict[str, Any]]:
+    async def _dalle_generate(self, prompt: str, style: str, width: int, height: int, num_images: int) -> List[Dict[str, Any]]:
         """
-        Generate images using OpenAI DALL-E.
-        
+        Generate images using the OpenAI DALL-E REST API.
+
         Args:
             prompt: Text description of the desired image
             style: Style of the image
             width: Image width
             height: Image height
             num_images: Number of images to generate
-            
+
         Returns:
             A list of dictionaries containing image information
         """
         try:
-            # Set OpenAI API key
-            openai.api_key = self.openai_api_key
-            
             # Prepare style prompt
-            style_prompt = ""
-            if style.lower() == "oil painting":
-                style_prompt = ", oil painting style"
-            elif style.lower() == "watercolor":
-                style_prompt = ", watercolor painting style"
-            elif style.lower() == "sketch":
-                style_prompt = ", pencil sketch style"
-            elif style.lower() == "digital art":
-                style_prompt = ", digital art style, highly detailed"
-            elif style.lower() == "anime":
-                style_prompt = ", anime style, highly detailed"
-            
+            style_prompt = _STYLE_SUFFIX.get(style.lower(), "")
+
             # Adjust size for DALL-E (must be one of the supported sizes)
             dalle_size = "1024x1024"  # Default
             if width == height:
@@ -236,72 +445,119 @@ class ImageGenerator:
                 dalle_size = "1792x1024"
             else:
                 dalle_size = "1024x1792"
-            
-            # Generate images
-            response = openai.Image.create(
-                model="dall-e-3",
-                prompt=f"{prompt}{style_prompt}",
-                size=dalle_size,
-                n=min(num_images, 1),  # DALL-E 3 only supports 1 image at a time
-                response_format="b64_json"
-            )
-            
-            # Process and save the generated images
-            results = []
-            for i, image_data in enumerate(response["data"]):
-                # Decode the base64 image
-                image_bytes = base64.b64decode(image_data["b64_json"])
-                
-                # Save the image
-                img_path = os.path.join(self.output_dir, f"dalle_gen_{i}.png")
-                with open(img_path, "wb") as f:
-                    f.write(image_bytes)
-                
+
+            session = await self._get_session()
+
+            # Unique per-request names keep concurrent requests from overwriting each other
+            output_prefix = os.path.join(self.output_dir, f"dalle_gen_{uuid.uuid4().hex[:8]}_")
+
+            async def generate_one(i: int) -> str:
+                image_data = await self._post_dalle(f"{prompt}{style_prompt}", dalle_size)
+
+                img_path = f"{output_prefix}{i}.png"
+                if image_data.get("url"):
+                    # Stream the PNG from its URL straight into the output file
+                    async with session.get(image_data["url"]) as image_response:
+                        image_response.raise_for_status()
+                        with open(img_path, "wb", buffering=_IMAGE_BUFSZ) as f:
+                            async for chunk in image_response.content.iter_chunked(_DOWNLOAD_CHUNK):
+                                f.write(chunk)
+                else:
+                    # Fall back to an inline base64 payload, saved off the event loop
+                    await asyncio.to_thread(_save_b64_image, img_path, image_data["b64_json"])
+                return img_path
+
+            # Generate and download images, one concurrent request per image
+            img_paths = await asyncio.gather(*(generate_one(i) for i in range(num_images)))
+
+            # Collect the saved images
+            results = [None] * len(img_paths)
+            for i, img_path in enumerate(img_paths):
                 # Add to results
-                results.append({
+                results[i] = {
                     "path": img_path,
                     "prompt": prompt,
                     "style": style,
                     "width": width,
                     "height": height,
                     "engine": "dall-e-3"
-                })
-            
+                }
+
             return results
-        
+
         except Exception as e:
             if DEBUG:
                 print(f"Error using OpenAI DALL-E: {e}")
             return self._simulated_generate(prompt, style, width, height, num_images)
 
+    @_retry_transient
+    async def _post_stability(self, engine_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a Stability text-to-image request, retrying transient failures."""
+        session = await self._get_session()
+        async with session.post(
+            STABILITY_API_URL.format(engine_id=engine_id),
+            json=body,
+            headers={
+                "Authorization": f"Bearer {self.stability_api_key}",
+                "Accept": "application/json",
+            },
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    @_retry_transient
+    async def _post_dalle(self, full_prompt: str, dalle_size: str) -> Dict[str, Any]:
+        """Request one DALL-E image, retrying transient failures."""
+        if self._aoai is not None:
+            response = await self._aoai.images.generate(
+                model="dall-e-3",
+                prompt=full_prompt,
+                size=dalle_size,
+                n=1,  # DALL-E 3 only supports 1 image per request
+                response_format="url",
+            )
+            return {"url": response.data[0].url, "b64_json": response.data[0].b64_json}
+
+        session = await self._get_session()
+        async with session.post(
+            OPENAI_IMAGES_URL,
+            json={
+                "model": "dall-e-3",
+                "prompt": full_prompt,
+                "size": dalle_size,
+                "n": 1,  # DALL-E 3 only supports 1 image per request
+                "response_format": "url",
+            },
+            headers={"Authorization": f"Bearer {self.openai_api_key}"},
+        ) as response:
+            response.raise_for_status()
+            return (await response.json())["data"][0]
+
     def _simulated_generate(self, prompt: str, style: str, width: int, height: int, num_images: int) -> List[Dict[str, Any]]:
         """
         Simulate image generation when APIs are not available.
-        
+
         Args:
             prompt: Text description of the desired image
             style: Style of the image
             width: Image width
             height: Image height
             num_images: Number of images to generate
-            
+
         Returns:
             A list of dictionaries containing image information
         """
-        # Create placeholder image information
-        results = []
-        for i in range(num_images):
-            results.append({
-                "path": None,
-                "prompt": prompt,
-                "style": style,
-                "width": width,
-                "height": height,
-                "engine": "simulated",
-                "message": "Image generation is simulated. No actual image was created."
-            })
-        
-        return results
+        # Create placeholder image information, copying one base entry per image
+        base = {
+            "path": None,
+            "prompt": prompt,
+            "style": style,
+            "width": width,
+            "height": height,
+            "engine": "simulated",
+            "message": "Image generation is simulated. No actual image was created."
+        }
+        return [dict(base) for _ in range(num_images)]
 
 # Create a singleton instance
 image_generator = ImageGenerator()
@@ -4,31 +4,406 @@ Enhanced browser tools for SuperNova AI.
 
 import os
 import time
-import tempfile
 import json
 import re
+import copy
 import base64
-from typing import Dict, Any, List, Optional, Union
-from urllib.parse import urlparse, urljoin, quote_plus
+import sqlite3
+import hashlib
+import heapq
+import asyncio
+import atexit
+import functools
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlparse, urlsplit, urljoin, quote_plus, parse_qsl, urlencode
 from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
 import html2text
 
 from ..config.env import ToolConfig, DEBUG
 from ..config.tools import BROWSER_CONFIG
 from .search import web_search
+from .browser import _get_playwright
 
 # Try to import optional dependencies
 try:
-    from playwright.sync_api import sync_playwright, Page, Browser
+    import playwright.sync_api
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+try:
+    from playwright.async_api import async_playwright
+    ASYNC_PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    ASYNC_PLAYWRIGHT_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from markdownify import MarkdownConverter
+    MARKDOWNIFY_AVAILABLE = True
+except ImportError:
+    MARKDOWNIFY_AVAILABLE = False
+
+if MARKDOWNIFY_AVAILABLE:
+    class _MarkdownConverter(MarkdownConverter):
+        """Markdown converter that drops script and style contents."""
+
+        def convert_script(self, *args, **kwargs):
+            return ""
+
+        convert_style = convert_script
+
+# HTML parser for BeautifulSoup; lxml is several times faster than html.parser
+SOUP_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Content types fetched directly instead of rendered in the browser
+DIRECT_CONTENT_TYPES = ("application/json", "text/plain", "application/xml", "text/xml", "text/csv", "application/pdf")
+
+# HTTP session shared by direct fetches so connections are reused
+_http_session = requests.Session()
+
+@functools.lru_cache(maxsize=256)
+def _head_content_type(url: str, user_agent: str) -> str:
+    """Return the lowercased Content-Type a URL serves, following redirects; failures are not cached."""
+    response = _http_session.head(url, allow_redirects=True, timeout=5, headers={"User-Agent": user_agent})
+    return response.headers.get("Content-Type", "").lower()
+
+# Maximum number of pages AsyncOpenaBrowser renders at once
+MAX_CONCURRENT_PAGES = 8
+
+# Event loop shared by AsyncOpenaBrowser; Playwright's async objects are bound to it
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use."""
+    global _async_loop
+    if _async_loop is None:
+        with _async_loop_lock:
+            if _async_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="opena-browser", daemon=True).start()
+                _async_loop = loop
+    return _async_loop
+
+def _run_async(coro):
+    """Run a coroutine on the background event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result()
+
+async def _on_async_loop(coro):
+    """Await a coroutine on the background event loop from any event loop."""
+    loop = _get_async_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+# Strainers that limit parsing to the tags an extraction pass needs
+_LINK_STRAINER = SoupStrainer("a", href=True)
+_MAIN_STRAINER = SoupStrainer(["main", "article", "body"])
+
+def _make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML (optionally only the tags matching parse_only) with the fastest available parser."""
+    try:
+        return BeautifulSoup(html, SOUP_PARSER, parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser", parse_only=parse_only)
+
+# Anchors that never lead to another page, and prefixes of already absolute URLs
+_SKIP_LINK_PREFIXES = ("javascript:", "#", "mailto:", "tel:")
+_ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+
+class _LinkCollector:
+    """Collects the unique, resolved links of one page."""
+
+    def __init__(self, base_url: str):
+        """
+        Initialize the collector.
+
+        Args:
+            base_url: Base URL for resolving relative links
+        """
+        base = urlsplit(base_url)
+        self.base_url = base_url
+        self.origin = f"{base.scheme}://{base.netloc}"
+        self.links = []
+        self.seen = set()
+
+    def add(self, href: str, text: str):
+        """
+        Add a link from an anchor's href and text, skipping non-navigating and repeated links.
+
+        Args:
+            href: Raw href attribute
+            text: Anchor text
+        """
+        # Skip empty links, javascript links, and anchors
+        if not href or href.startswith(_SKIP_LINK_PREFIXES):
+            return
+
+        # Resolve relative URLs; root-relative paths only need the origin prepended
+        if not href.startswith(_ABSOLUTE_URL_PREFIXES):
+            if href.startswith("/") and not href.startswith("//") and "/." not in href:
+                href = self.origin + href
+            else:
+                href = urljoin(self.base_url, href)
+
+        # Pages often repeat the same link (navigation, footers); keep the first
+        if href in self.seen:
+            return
+        self.seen.add(href)
+
+        # Fall back to the URL when the anchor has no text
+        self.links.append({
+            "url": href,
+            "text": text.strip() or href,
+        })
+
+# Runs in the page to pick the main content and links; mirrors _find_main_tag and _LinkCollector
+PAGE_EXTRACT_JS = """
+() => {
+    // One querySelectorAll walk; candidates come back in document order, so keep
+    // the first of the best rank
+    const selectors = ["main", "#main", "#content", "#main-content", ".main", ".content", ".main-content", "article"];
+    let main = null, bestRank = selectors.length;
+    for (const el of document.querySelectorAll(selectors.join(", "))) {
+        const rank = selectors.findIndex(selector => el.matches(selector));
+        if (rank < bestRank) {
+            main = el;
+            bestRank = rank;
+            if (rank === 0) break;
+        }
+    }
+    let mainHtml;
+    if (main) {
+        mainHtml = main.outerHTML;
+    } else if (document.body) {
+        const body = document.body.cloneNode(true);
+        body.querySelectorAll("script, style, nav, footer, header").forEach(el => el.remove());
+        mainHtml = body.outerHTML;
+    } else {
+        mainHtml = document.documentElement.outerHTML;
+    }
+    const links = [];
+    const seen = new Set();
+    for (const a of document.querySelectorAll("a[href]")) {
+        const href = a.getAttribute("href");
+        if (!href || /^(javascript:|#|mailto:|tel:)/.test(href) || seen.has(a.href)) continue;
+        seen.add(a.href);
+        links.push({url: a.href, text: a.textContent.trim() || a.href});
+    }
+    return {title: document.title, url: location.href, mainHtml, links};
+}
+"""
+
+# Main content candidates, ranked after <main> (rank 0) in order of preference
+_MAIN_ID_RANK = {"main": 1, "content": 2, "main-content": 3}
+_MAIN_CLASS_RANK = {"main": 4, "content": 5, "main-content": 6}
+_ARTICLE_RANK = 7
+
+# Every main content candidate in one lxml traversal, returned in document order
+_MAIN_XPATH = (
+    "//main | //*[@id='main' or @id='content' or @id='main-content'] | "
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' main ') or "
+    "contains(concat(' ', normalize-space(@class), ' '), ' content ') or "
+    "contains(concat(' ', normalize-space(@class), ' '), ' main-content ')] | //article"
+)
+
+# Word tokenizer and filler words ignored when matching information requests
+_WORD_RE = re.compile(r"\b\w+\b")
+_STOPWORDS = frozenset({"what", "when", "where", "which", "about", "information"})
+
+# Elements that signal extractable page content is attached
+CONTENT_SELECTOR = "main, article, #content, body"
+CONTENT_WAIT_TIMEOUT = 3000  # milliseconds
+
+# Analytics and ad hosts whose requests never affect extracted content
+_TRACKER_RE = re.compile(r"(doubleclick\.net|google-analytics\.com|googletagmanager\.com|hotjar\.com|segment\.(com|io))")
+
+# Query parameters that change between otherwise identical requests
+_VOLATILE_PARAMS = frozenset({"ts", "timestamp", "nonce", "cb", "_"})
+
+# Response headers left out of stored responses: the encoding headers no longer
+# apply once the body is stored decoded, and cookies must not be replayed
+_UNCACHED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "set-cookie"})
+
+# Cache-Control directives that forbid storing a response in a shared on-disk cache
+_NO_STORE_DIRECTIVES = frozenset({"no-store", "no-cache", "private"})
+
+# Cache hits whose last_used timestamps are buffered before being written in one batch
+_TOUCH_BATCH_SIZE = 64
+
+def _request_signature(method: str, url: str, post_data: Optional[bytes]) -> str:
+    """
+    Build a cache signature for a request, ignoring volatile query parameters.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        post_data: Request body, if any
+
+    Returns:
+        Hex digest identifying the request
+    """
+    parsed = urlparse(url)
+    query = sorted((k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k not in _VOLATILE_PARAMS)
+    normalized = parsed._replace(query=urlencode(query), fragment="").geturl()
+    body_hash = hashlib.sha256(post_data or b"").hexdigest()
+    return hashlib.sha256(f"{method} {normalized} {body_hash}".encode("utf-8")).hexdigest()
+
+def _cacheable_request(request) -> bool:
+    """Check whether a request may be answered from or stored in the response cache."""
+    if request.method not in BROWSER_CONFIG.get("response_cache_methods", ["GET"]):
+        return False
+    return request.resource_type not in BROWSER_CONFIG.get("response_cache_skip_types", ["document"])
+
+def _response_ttl(status: int, headers: Dict[str, str]) -> Optional[float]:
+    """
+    Work out how long a response may be cached, honouring its Cache-Control header.
+
+    Args:
+        status: HTTP status code
+        headers: Response headers
+
+    Returns:
+        Lifetime in seconds, or None if the response must not be stored
+    """
+    if status != 200:
+        return None
+
+    ttl = BROWSER_CONFIG.get("response_cache_ttl", 3600)
+    cache_control = next((v for k, v in headers.items() if k.lower() == "cache-control"), "")
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in _NO_STORE_DIRECTIVES:
+            return None
+        if name == "max-age":
+            try:
+                ttl = min(ttl, int(value.strip().strip('"')))
+            except ValueError:
+                return None
+
+    return ttl if ttl > 0 else None
+
+def _stored_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Return the response headers worth storing with a cached body."""
+    return {k: v for k, v in headers.items() if k.lower() not in _UNCACHED_HEADERS}
+
+class _ResponseCache:
+    """On-disk SQLite cache of browser responses with expiry and least-recently-used eviction."""
+
+    def __init__(self, path: str, max_entries: int):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite file
+            max_entries: Number of responses kept before the least recently used are evicted
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+        # Caches written before entries expired have no expiry to honour; start them over
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(responses)")]
+        if columns and "expires" not in columns:
+            self._conn.execute("DROP TABLE responses")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "signature TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB, last_used REAL, expires REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+
+        # Hits waiting to have their last_used timestamp written
+        self._touched: Dict[str, float] = {}
+
+    def get(self, signature: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a signature, or None on a miss or once it has expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body FROM responses WHERE signature = ? AND expires > ?", (signature, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[signature] = now
+            if len(self._touched) >= _TOUCH_BATCH_SIZE:
+                self._flush_touched()
+        return {"status": row[0], "headers": json.loads(row[1]), "body": row[2]}
+
+    def put(self, signature: str, status: int, headers: Dict[str, str], body: bytes, ttl: float):
+        """Store a response for ttl seconds and evict expired and least recently used entries."""
+        now = time.time()
+        with self._lock:
+            # Write pending hits first so eviction sees how recently entries were used
+            self._flush_touched(commit=False)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (signature, status, json.dumps(headers), body, now, now + ttl),
+            )
+            self._conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE signature IN ("
+                "SELECT signature FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def flush(self):
+        """Write buffered last_used timestamps to disk."""
+        with self._lock:
+            self._flush_touched()
+
+    def _flush_touched(self, commit: bool = True):
+        """Write buffered last_used timestamps in one statement; the caller holds the lock."""
+        if not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        self._conn.executemany(
+            "UPDATE responses SET last_used = ? WHERE signature = ?",
+            [(used, signature) for signature, used in touched.items()],
+        )
+        if commit:
+            self._conn.commit()
+
+_response_cache: Optional[_ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+def _get_response_cache() -> _ResponseCache:
+    """Open the process-wide response cache on first use and return it."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = _ResponseCache(
+                    BROWSER_CONFIG.get("response_cache_path", os.path.join("output", "browser_cache.sqlite")),
+                    BROWSER_CONFIG.get("response_cache_max_entries", 5000),
+                )
+                atexit.register(_response_cache.flush)
+    return _response_cache
+
 class OpenaBrowser:
     """Enhanced browser tool for SuperNova AI."""
 
+    # One Chromium process shared by every instance; launched on first use
+    _shared_browser = None
+    _browser_lock = threading.Lock()
+
     def __init__(self):
         """Initialize the SuperNova browser tool."""
         # Always set headless to False to make the browser visible
@@ -38,15 +413,22 @@ class OpenaBrowser:
 
         # Initialize browser instance variables
         self.browser = None
+        self.context = None
         self.page = None
-        self.playwright = None
 
-        # Initialize HTML to text converter
-        self.html_converter = html2text.HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.ignore_images = True
-        self.html_converter.ignore_tables = False
-        self.html_converter.body_width = 0  # No wrapping
+        # Set while a browse bypasses the response cache
+        self._fresh = False
+
+        # Initialize HTML to markdown converter; markdownify works on the parsed
+        # tree, html2text has to parse the HTML again
+        if MARKDOWNIFY_AVAILABLE:
+            self.markdown_converter = _MarkdownConverter(heading_style="ATX", strip=["img"])
+        else:
+            self.html_converter = html2text.HTML2Text()
+            self.html_converter.ignore_links = False
+            self.html_converter.ignore_images = True
+            self.html_converter.ignore_tables = False
+            self.html_converter.body_width = 0  # No wrapping
 
         # Initialize session history
         self.session_history = []
@@ -61,31 +443,31 @@ class OpenaBrowser:
             print("Playwright is not available. Please install it with 'pip install playwright' and 'playwright install'.")
             return False
 
-        if not self.browser:
+        if not self.page:
             try:
-                print("Launching Chromium browser with Playwright...")
-                self.playwright = sync_playwright().start()
-
-                # Launch Chromium with visible browser window
-                self.browser = self.playwright.chromium.launch(
-                    headless=self.headless,  # This should be False from our init
-                    args=['--start-maximized']  # Start with maximized window
-                )
-
-                print(f"Browser launched successfully. Headless mode: {self.headless}")
+                self.browser = self._get_shared_browser()
 
-                # Create a new page with custom viewport and user agent
-                self.page = self.browser.new_page(
+                # Each tool instance browses in its own context (cookies, cache) and tab
+                self.context = self.browser.new_context(
                     user_agent=self.user_agent,
                     viewport={"width": 1280, "height": 800}  # Set a reasonable viewport size
                 )
+                self.page = self.context.new_page()
 
                 self.page.set_default_timeout(self.timeout * 1000)  # Convert to milliseconds
 
                 # Set up event listeners
                 self.page.on("response", self._handle_response)
 
-                print("Browser initialization complete. Ready for browsing.")
+                # Serve repeat requests from the on-disk response cache
+                if BROWSER_CONFIG.get("response_cache", True):
+                    self.page.route("**/*", self._route_request)
+
+                # Abort tracker requests; registered last so it runs before the cache route
+                self.page.route(_TRACKER_RE, lambda route: route.abort())
+
+                if DEBUG:
+                    print("Browser initialization complete. Ready for browsing.")
                 return True
             except Exception as e:
                 print(f"Error initializing Playwright browser: {e}")
@@ -93,6 +475,84 @@ class OpenaBrowser:
 
         return True
 
+    def _get_shared_browser(self):
+        """Return the Chromium instance shared by every tool instance, launching it on first use."""
+        with OpenaBrowser._browser_lock:
+            browser = OpenaBrowser._shared_browser
+            if browser is None or not browser.is_connected():
+                playwright = _get_playwright()
+                cdp_endpoint = BROWSER_CONFIG.get("cdp_endpoint")
+                if cdp_endpoint:
+                    # Attach to a Chromium already shared with other workers
+                    if DEBUG:
+                        print(f"Connecting to Chromium browser at {cdp_endpoint}...")
+                    browser = playwright.chromium.connect_over_cdp(cdp_endpoint)
+                else:
+                    # Launch Chromium with visible browser window
+                    browser = playwright.chromium.launch(
+                        headless=self.headless,  # This should be False from our init
+                        args=['--start-maximized']  # Start with maximized window
+                    )
+
+                    if DEBUG:
+                        print(f"Chromium browser launched. Headless mode: {self.headless}")
+                OpenaBrowser._shared_browser = browser
+            return browser
+
+    def _route_request(self, route, request):
+        """Fulfil requests from the response cache, recording responses on a miss."""
+        try:
+            if not _cacheable_request(request):
+                route.continue_()
+                return
+
+            cache = _get_response_cache()
+            signature = _request_signature(request.method, request.url, request.post_data_buffer)
+
+            if not self._fresh:
+                cached = cache.get(signature)
+                if cached is not None:
+                    route.fulfill(status=cached["status"], headers=cached["headers"], body=cached["body"])
+                    return
+
+            response = route.fetch()
+            body = response.body()
+            ttl = _response_ttl(response.status, response.headers)
+            if ttl is not None:
+                cache.put(signature, response.status, _stored_headers(response.headers), body, ttl)
+            route.fulfill(response=response, body=body)
+        except Exception as e:
+            if DEBUG:
+                print(f"Response cache error for {request.url}: {e}")
+            try:
+                route.continue_()
+            except Exception:
+                pass
+
+    def _wait_for_content(self):
+        """Wait until the DOM is parsed and extractable content is attached."""
+        # networkidle can stall for many seconds on tracking beacons that don't affect content
+        self.page.wait_for_load_state("domcontentloaded")
+        try:
+            self.page.wait_for_selector(CONTENT_SELECTOR, state="attached", timeout=CONTENT_WAIT_TIMEOUT)
+        except Exception as e:
+            if DEBUG:
+                print(f"Content selector not found, extracting anyway: {e}")
+
+    def _to_markdown(self, tag: Tag) -> str:
+        """
+        Convert a parsed element to markdown.
+
+        Args:
+            tag: Element to convert
+
+        Returns:
+            Markdown text
+        """
+        if MARKDOWNIFY_AVAILABLE:
+            return self.markdown_converter.convert_soup(tag).strip()
+        return self.html_converter.handle(str(tag))
+
     def _handle_response(self, response):
         """Handle response events from the browser."""
         if response.status >= 400:
@@ -100,16 +560,16 @@ class OpenaBrowser:
                 print(f"Error response: {response.status} {response.url}")
 
     def _close_browser(self):
-        """Close the browser."""
-        if self.browser:
+        """Close this instance's browser context; the shared browser keeps running."""
+        if self.context:
             try:
-                self.browser.close()
-                self.playwright.stop()
-                self.browser = None
-                self.page = None
-                self.playwright = None
+                self.context.close()
             except Exception as e:
                 print(f"Error closing browser: {e}")
+            finally:
+                self.browser = None
+                self.context = None
+                self.page = None
 
     def search(self, query: str, num_results: int = 5) -> Dict[str, Any]:
         """
@@ -141,12 +601,13 @@ class OpenaBrowser:
             "results": processed_results,
         }
 
-    def browse(self, url: str) -> Dict[str, Any]:
+    def browse(self, url: str, fresh: bool = False) -> Dict[str, Any]:
         """
         Browse a webpage and extract its content.
 
         Args:
             url: URL to browse
+            fresh: Fetch every request from the network instead of the response cache
 
         Returns:
             A dictionary containing the page content and metadata
@@ -155,10 +616,75 @@ class OpenaBrowser:
         if not url.startswith(("http://", "https://")):
             url = "https://" + url
 
-        print(f"Browsing URL: {url}")
+        # Data and documents (JSON APIs, text, PDFs) need no rendering; fetch them directly
+        if BROWSER_CONFIG.get("direct_fetch", True):
+            direct_result = self._fetch_direct(url)
+            if direct_result is not None:
+                return direct_result
+
+        # Use the browser for HTML pages for a visible browsing experience
+        self._fresh = fresh
+        try:
+            return self._browse_with_browser(url)
+        finally:
+            self._fresh = False
+
+    def _fetch_direct(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a URL without the browser when it serves data rather than an HTML page.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            A dictionary containing the content and metadata, or None if the URL needs the browser
+        """
+        try:
+            content_type = _head_content_type(url, self.user_agent)
+        except requests.RequestException as e:
+            if DEBUG:
+                print(f"HEAD request failed for {url}, using the browser: {e}")
+            return None
+
+        if not content_type.startswith(DIRECT_CONTENT_TYPES):
+            return None
+
+        try:
+            response = _http_session.get(url, headers={"User-Agent": self.user_agent}, timeout=self.timeout)
+            response.raise_for_status()
+
+            data = None
+            if content_type.startswith("application/json"):
+                content = json.dumps(response.json(), indent=2, ensure_ascii=False)
+            elif content_type.startswith("application/pdf"):
+                data = base64.b64encode(response.content).decode("ascii")
+                content = f"PDF document ({len(response.content)} bytes)"
+            else:
+                content = response.text
+
+            if DEBUG:
+                print(f"Fetched {url} directly ({content_type})")
+            return {
+                "status": "success",
+                "url": response.url,
+                "title": os.path.basename(urlparse(response.url).path) or response.url,
+                "content": content,
+                "html": "",
+                "links": [],
+                "screenshot": None,
+                "method": "direct",
+                "content_type": content_type,
+                "data": data,
+            }
+        except Exception as e:
+            error_msg = f"Error fetching {url}: {str(e)}"
+            print(error_msg)
 
-        # Always use the browser for a visible browsing experience
-        return self._browse_with_browser(url)
+            return {
+                "status": "error",
+                "error": error_msg,
+                "url": url,
+            }
 
     def _browse_with_browser(self, url: str) -> Dict[str, Any]:
         """
@@ -180,42 +706,21 @@ class OpenaBrowser:
             }
 
         try:
-            print(f"Navigating to {url} with Chromium browser...")
             # Navigate to the URL
             self.page.goto(url)
 
-            print("Waiting for page to load completely...")
             # Wait for page to load
-            self.page.wait_for_load_state("networkidle")
-
-            # Get page info
-            title = self.page.title()
-            current_url = self.page.url
-            print(f"Page loaded: {title} ({current_url})")
-
-            # Pause to allow user to see the page (3 seconds)
-            print("Pausing for 3 seconds to allow viewing the page...")
-            time.sleep(3)
-
-            # Extract HTML content
-            print("Extracting page content...")
-            html_content = self.page.content()
-
-            # Parse the HTML
-            soup = BeautifulSoup(html_content, "html.parser")
+            self._wait_for_content()
 
-            # Extract main content
-            main_content = self._extract_main_content(soup)
+            # Optionally pause so a watching user can see the page
+            view_pause = BROWSER_CONFIG.get("view_pause", 0)
+            if not self.headless and view_pause > 0:
+                time.sleep(view_pause)
 
-            # Convert HTML to markdown
-            markdown_content = self.html_converter.handle(main_content)
-
-            # Extract links
-            links = self._extract_links(soup, current_url)
-            print(f"Extracted {len(links)} links from the page")
+            # Extract page info, main content and links
+            title, current_url, main_content, markdown_content, links = self._extract_page()
 
             # Take screenshot
-            print("Taking screenshot...")
             screenshot = self._take_screenshot()
 
             # Add to session history
@@ -227,7 +732,9 @@ class OpenaBrowser:
             self.session_history.append(page_info)
             self.current_page_info = page_info
 
-            print("Browsing complete. Returning page content.")
+            if DEBUG:
+                print(f"Browsed {url}: {title} ({current_url}), {len(links)} links, "
+                      f"{len(markdown_content)} characters of content")
             return {
                 "status": "success",
                 "url": current_url,
@@ -249,32 +756,122 @@ class OpenaBrowser:
                 "url": url,
             }
 
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
+    def _extract_page(self) -> Tuple[str, str, str, str, List[Dict[str, str]]]:
+        """
+        Extract the title, main content and links of the current page.
+
+        Returns:
+            A tuple of (title, URL, main content HTML, main content markdown, links)
+        """
+        if BROWSER_CONFIG.get("extract_in_page", True):
+            # Select the main content and links inside the page so only they cross
+            # the CDP connection, instead of serializing the whole DOM
+            data = self.page.evaluate(PAGE_EXTRACT_JS)
+            title, current_url, main_content, links = data["title"], data["url"], data["mainHtml"], data["links"]
+            main_tag = _make_soup(main_content)
+        else:
+            title = self.page.title()
+            current_url = self.page.url
+            html_content = self.page.content()
+            main_content, links = self._extract_main_and_links(html_content, current_url)
+            main_tag = _make_soup(main_content)
+
+        return title, current_url, main_content, self._to_markdown(main_tag), links
+
+    def _extract_main_and_links(self, html: str, base_url: str) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Extract the main content HTML and the links of a page, parsing it once with lxml.
+
+        Args:
+            html: Raw HTML of the page
+            base_url: Base URL for resolving relative links
+
+        Returns:
+            A tuple of (main content HTML, links)
+        """
+        tree = None
+        if LXML_AVAILABLE:
+            try:
+                tree = lxml.html.fromstring(html)
+            except (lxml.etree.ParserError, ValueError):
+                pass
+
+        if tree is None:
+            main_content = str(self._find_main_tag(_make_soup(html, _MAIN_STRAINER)))
+            return main_content, self._extract_links_bs(html, base_url)
+
+        return self._find_main_element(tree), self._links_from_tree(tree, base_url)
+
+    def _find_main_element(self, tree) -> str:
+        """
+        Find the main content of a page parsed with lxml, ranked like _find_main_tag.
+
+        Args:
+            tree: Root element of the parsed page
+
+        Returns:
+            HTML string of the main content, the cleaned body, or the whole document
         """
-        Extract the main content from a webpage.
+        # The XPath collects every candidate in a single traversal; choosing the
+        # first of the best rank keeps the preference order of the selectors
+        best_rank, best_element = _ARTICLE_RANK + 1, None
+        for element in tree.xpath(_MAIN_XPATH):
+            if element.tag == "main":
+                best_element = element
+                break
+
+            rank = _MAIN_ID_RANK.get(element.get("id"), best_rank)
+            for cls in (element.get("class") or "").split():
+                rank = min(rank, _MAIN_CLASS_RANK.get(cls, rank))
+            if element.tag == "article":
+                rank = min(rank, _ARTICLE_RANK)
+
+            if rank < best_rank:
+                best_rank, best_element = rank, element
+
+        if best_element is None:
+            # If no main content found, use the body without scripts, styles and page chrome
+            body = tree.find("body") if tree.tag == "html" else None
+            if body is None:
+                return lxml.html.tostring(tree, encoding="unicode")
+            best_element = copy.deepcopy(body)
+            for element in best_element.xpath(".//script | .//style | .//nav | .//footer | .//header"):
+                element.drop_tree()
+
+        return lxml.html.tostring(best_element, encoding="unicode", with_tail=False)
+
+    def _find_main_tag(self, soup: BeautifulSoup) -> Tag:
+        """
+        Find the element holding the main content of a webpage.
 
         Args:
             soup: BeautifulSoup object
 
         Returns:
-            HTML string of the main content
-        """
-        # Try to find the main content
-        main_tags = [
-            soup.find("main"),
-            soup.find(id="main"),
-            soup.find(id="content"),
-            soup.find(id="main-content"),
-            soup.find(class_="main"),
-            soup.find(class_="content"),
-            soup.find(class_="main-content"),
-            soup.find("article"),
-        ]
-
-        # Use the first valid main tag found
-        for tag in main_tags:
-            if tag:
-                return str(tag)
+            The main content element, the cleaned body, or the whole document
+        """
+        # Find the main content in one pass, keeping the first tag of the best
+        # rank seen: <main>, then #main/#content/#main-content, then the same
+        # classes, then <article>
+        best_rank, best_tag = _ARTICLE_RANK + 1, None
+        for tag in soup.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            if tag.name == "main":
+                best_tag = tag
+                break
+
+            rank = _MAIN_ID_RANK.get(tag.get("id"), best_rank)
+            for cls in tag.get("class") or ():
+                rank = min(rank, _MAIN_CLASS_RANK.get(cls, rank))
+            if tag.name == "article":
+                rank = min(rank, _ARTICLE_RANK)
+
+            if rank < best_rank:
+                best_rank, best_tag = rank, tag
+
+        if best_tag is not None:
+            return best_tag
 
         # If no main content found, use the body
         body = soup.find("body")
@@ -282,10 +879,10 @@ class OpenaBrowser:
             # Remove script and style tags
             for script in body(["script", "style", "nav", "footer", "header"]):
                 script.decompose()
-            return str(body)
+            return body
 
         # If no body found, use the whole HTML
-        return str(soup)
+        return soup
 
     def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
         """
@@ -298,31 +895,43 @@ class OpenaBrowser:
         Returns:
             List of dictionaries containing link information
         """
-        links = []
+        links = _LinkCollector(base_url)
 
         # Find all links
         for a in soup.find_all("a", href=True):
-            href = a["href"]
+            links.add(a["href"], a.get_text())
 
-            # Skip empty links, javascript links, and anchors
-            if not href or href.startswith(("javascript:", "#", "mailto:", "tel:")):
-                continue
+        return links.links
 
-            # Resolve relative URLs
-            if not href.startswith(("http://", "https://")):
-                href = urljoin(base_url, href)
+    def _extract_links_bs(self, html: str, base_url: str) -> List[Dict[str, str]]:
+        """
+        Extract links from a webpage, parsing only its anchors.
 
-            # Extract text
-            text = a.get_text().strip()
-            if not text:
-                text = href
+        Args:
+            html: Raw HTML of the page
+            base_url: Base URL for resolving relative links
 
-            links.append({
-                "url": href,
-                "text": text,
-            })
+        Returns:
+            List of dictionaries containing link information
+        """
+        return self._extract_links(_make_soup(html, _LINK_STRAINER), base_url)
+
+    def _links_from_tree(self, tree, base_url: str) -> List[Dict[str, str]]:
+        """
+        Extract links from a page parsed with lxml.
+
+        Args:
+            tree: Root element of the parsed page
+            base_url: Base URL for resolving relative links
 
-        return links
+        Returns:
+            List of dictionaries containing link information
+        """
+        links = _LinkCollector(base_url)
+        for a in tree.xpath("//a[@href]"):
+            links.add(a.get("href"), a.text_content())
+
+        return links.links
 
     def click(self, link_text: str) -> Dict[str, Any]:
         """
@@ -349,26 +958,10 @@ class OpenaBrowser:
             link.click()
 
             # Wait for navigation to complete
-            self.page.wait_for_load_state("networkidle")
-
-            # Get page info
-            title = self.page.title()
-            current_url = self.page.url
-
-            # Extract HTML content
-            html_content = self.page.content()
-
-            # Parse the HTML
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Extract main content
-            main_content = self._extract_main_content(soup)
-
-            # Convert HTML to markdown
-            markdown_content = self.html_converter.handle(main_content)
+            self._wait_for_content()
 
-            # Extract links
-            links = self._extract_links(soup, current_url)
+            # Extract page info, main content and links
+            title, current_url, main_content, markdown_content, links = self._extract_page()
 
             # Take screenshot
             screenshot = self._take_screenshot()
@@ -420,26 +1013,10 @@ class OpenaBrowser:
             self.page.go_back()
 
             # Wait for navigation to complete
-            self.page.wait_for_load_state("networkidle")
+            self._wait_for_content()
 
-            # Get page info
-            title = self.page.title()
-            current_url = self.page.url
-
-            # Extract HTML content
-            html_content = self.page.content()
-
-            # Parse the HTML
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Extract main content
-            main_content = self._extract_main_content(soup)
-
-            # Convert HTML to markdown
-            markdown_content = self.html_converter.handle(main_content)
-
-            # Extract links
-            links = self._extract_links(soup, current_url)
+            # Extract page info, main content and links
+            title, current_url, main_content, markdown_content, links = self._extract_page()
 
             # Take screenshot
             screenshot = self._take_screenshot()
@@ -467,6 +1044,21 @@ class OpenaBrowser:
                 "error": error_msg,
             }
 
+    def browse_many(self, urls: List[str], fresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Browse several webpages concurrently, each in its own headless tab.
+
+        Pages browsed this way are not added to this instance's session history.
+
+        Args:
+            urls: URLs to browse
+            fresh: Fetch every request from the network instead of the response cache
+
+        Returns:
+            A list of browse results, in the same order as urls
+        """
+        return _run_async(async_opena_browser.browse_many(urls, fresh))
+
     def search_and_browse(self, query: str) -> Dict[str, Any]:
         """
         Search for a query and browse the top result.
@@ -564,27 +1156,23 @@ class OpenaBrowser:
         # based on keyword matching
 
         # Extract keywords from the information request
-        keywords = re.findall(r'\b\w+\b', information_request.lower())
-        keywords = [k for k in keywords if len(k) > 3 and k not in ["what", "when", "where", "which", "about", "information"]]
+        keywords = {k for k in _WORD_RE.findall(information_request.lower()) if len(k) > 3 and k not in _STOPWORDS}
 
         # Split content into paragraphs
         paragraphs = content.split("\n\n")
 
-        # Score each paragraph based on keyword matches
+        # Score each paragraph by the number of keywords among its words
         scored_paragraphs = []
         for p in paragraphs:
             if len(p.strip()) < 10:  # Skip very short paragraphs
                 continue
 
-            score = sum(1 for k in keywords if k in p.lower())
+            score = len(keywords.intersection(_WORD_RE.findall(p.lower())))
             if score > 0:
                 scored_paragraphs.append((score, p))
 
-        # Sort by score (highest first)
-        scored_paragraphs.sort(reverse=True)
-
-        # Take the top 5 paragraphs
-        top_paragraphs = [p for _, p in scored_paragraphs[:5]]
+        # Take the top 5 paragraphs (highest score first)
+        top_paragraphs = [p for _, p in heapq.nlargest(5, scored_paragraphs)]
 
         if not top_paragraphs:
             return "Could not find specific information related to your request."
@@ -603,22 +1191,15 @@ class OpenaBrowser:
             return None
 
         try:
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp_path = tmp.name
-
-            # Take screenshot
-            self.page.screenshot(path=tmp_path)
-
-            # Read the file and convert to base64
-            with open(tmp_path, "rb") as f:
-                screenshot_data = f.read()
-
-            # Remove the temporary file
-            os.unlink(tmp_path)
+            # Take the screenshot in memory; JPEG is far smaller than PNG for page previews
+            screenshot_type = BROWSER_CONFIG.get("screenshot_type", "jpeg")
+            options = {"type": screenshot_type, "full_page": False}
+            if screenshot_type == "jpeg":
+                options["quality"] = BROWSER_CONFIG.get("screenshot_quality", 70)
+            screenshot_data = self.page.screenshot(**options)
 
             # Convert to base64
-            return base64.b64encode(screenshot_data).decode("utf-8")
+            return base64.b64encode(screenshot_data).decode("ascii")
         except Exception as e:
             print(f"Error taking screenshot: {e}")
             return None
@@ -627,5 +1208,353 @@ class OpenaBrowser:
         """Close the browser."""
         self._close_browser()
 
-# Create a singleton instance
+class AsyncOpenaBrowser:
+    """Asynchronous browser that renders each request in its own context and tab."""
+
+    def __init__(self):
+        """Initialize the asynchronous browser tool."""
+        self.headless = BROWSER_CONFIG.get("headless", True)
+        self.timeout = BROWSER_CONFIG.get("timeout", 30)
+        self.user_agent = BROWSER_CONFIG.get("user_agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+        # Playwright runtime, browser and HTTP session; created on the background loop
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = None
+        self._page_slots = None
+        self._session = None
+
+        # Content types of URLs already checked for a direct fetch
+        self._content_types = {}
+
+        # Parsing and markdown conversion are shared with the synchronous browser
+        self._extractor = OpenaBrowser()
+
+        atexit.register(self._shutdown)
+
+    async def browse(self, url: str, fresh: bool = False) -> Dict[str, Any]:
+        """
+        Browse a webpage and extract its content.
+
+        Args:
+            url: URL to browse
+            fresh: Fetch every request from the network instead of the response cache
+
+        Returns:
+            A dictionary containing the page content and metadata
+        """
+        return await _on_async_loop(self._browse(url, fresh))
+
+    async def browse_many(self, urls: List[str], fresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Browse several webpages concurrently.
+
+        Args:
+            urls: URLs to browse
+            fresh: Fetch every request from the network instead of the response cache
+
+        Returns:
+            A list of browse results, in the same order as urls
+        """
+        async def browse_all():
+            return await asyncio.gather(*(self._browse(url, fresh) for url in urls))
+
+        return await _on_async_loop(browse_all())
+
+    async def close(self):
+        """Close the browser, the Playwright runtime and the HTTP session."""
+        await _on_async_loop(self._close())
+
+    async def _browse(self, url: str, fresh: bool) -> Dict[str, Any]:
+        """Browse one URL on the background loop."""
+        # Validate URL
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+
+        # Data and documents need no rendering; fetch them directly
+        if BROWSER_CONFIG.get("direct_fetch", True) and AIOHTTP_AVAILABLE:
+            direct_result = await self._fetch_direct(url)
+            if direct_result is not None:
+                return direct_result
+
+        return await self._browse_with_browser(url, fresh)
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # Reuse connections across calls to skip repeat TCP and TLS handshakes
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _head_content_type(self, url: str) -> str:
+        """Return the lowercased Content-Type a URL serves, following redirects; failures are not cached."""
+        content_type = self._content_types.get(url)
+        if content_type is None:
+            session = await self._get_session()
+            async with session.head(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                content_type = response.headers.get("Content-Type", "").lower()
+            if len(self._content_types) >= 256:
+                self._content_types.clear()
+            self._content_types[url] = content_type
+        return content_type
+
+    async def _fetch_direct(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a URL without the browser when it serves data rather than an HTML page.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            A dictionary containing the content and metadata, or None if the URL needs the browser
+        """
+        try:
+            content_type = await self._head_content_type(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if DEBUG:
+                print(f"HEAD request failed for {url}, using the browser: {e}")
+            return None
+
+        if not content_type.startswith(DIRECT_CONTENT_TYPES):
+            return None
+
+        try:
+            session = await self._get_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                body = await response.read()
+                final_url = str(response.url)
+
+                data = None
+                if content_type.startswith("application/json"):
+                    content = json.dumps(json.loads(body), indent=2, ensure_ascii=False)
+                elif content_type.startswith("application/pdf"):
+                    data = base64.b64encode(body).decode("ascii")
+                    content = f"PDF document ({len(body)} bytes)"
+                else:
+                    content = body.decode(response.get_encoding(), errors="replace")
+
+            if DEBUG:
+                print(f"Fetched {url} directly ({content_type})")
+            return {
+                "status": "success",
+                "url": final_url,
+                "title": os.path.basename(urlparse(final_url).path) or final_url,
+                "content": content,
+                "html": "",
+                "links": [],
+                "screenshot": None,
+                "method": "direct",
+                "content_type": content_type,
+                "data": data,
+            }
+        except Exception as e:
+            error_msg = f"Error fetching {url}: {str(e)}"
+            print(error_msg)
+
+            return {
+                "status": "error",
+                "error": error_msg,
+                "url": url,
+            }
+
+    async def _get_browser(self):
+        """Return the browser, starting Playwright and launching Chromium on first use."""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+            self._page_slots = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                cdp_endpoint = BROWSER_CONFIG.get("cdp_endpoint")
+                if cdp_endpoint:
+                    self._browser = await self._playwright.chromium.connect_over_cdp(cdp_endpoint)
+                else:
+                    self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                if DEBUG:
+                    print(f"Async Chromium browser ready. Headless mode: {self.headless}")
+            return self._browser
+
+    async def _route_request(self, route, request, fresh: bool):
+        """Fulfil requests from the response cache, recording responses on a miss."""
+        try:
+            if not _cacheable_request(request):
+                await route.continue_()
+                return
+
+            cache = _get_response_cache()
+            signature = _request_signature(request.method, request.url, request.post_data_buffer)
+
+            if not fresh:
+                cached = await asyncio.to_thread(cache.get, signature)
+                if cached is not None:
+                    await route.fulfill(status=cached["status"], headers=cached["headers"], body=cached["body"])
+                    return
+
+            response = await route.fetch()
+            body = await response.body()
+            ttl = _response_ttl(response.status, response.headers)
+            if ttl is not None:
+                await asyncio.to_thread(
+                    cache.put, signature, response.status, _stored_headers(response.headers), body, ttl
+                )
+            await route.fulfill(response=response, body=body)
+        except Exception as e:
+            if DEBUG:
+                print(f"Response cache error for {request.url}: {e}")
+            try:
+                await route.continue_()
+            except Exception:
+                pass
+
+    async def _browse_with_browser(self, url: str, fresh: bool) -> Dict[str, Any]:
+        """
+        Browse a webpage in a new browser context and tab.
+
+        Args:
+            url: URL to browse
+            fresh: Fetch every request from the network instead of the response cache
+
+        Returns:
+            A dictionary containing the page content and metadata
+        """
+        if not ASYNC_PLAYWRIGHT_AVAILABLE:
+            print("Playwright is not available. Please install it with 'pip install playwright' and 'playwright install'.")
+            return {
+                "status": "error",
+                "error": "Failed to initialize browser",
+                "url": url,
+            }
+
+        context = None
+        try:
+            browser = await self._get_browser()
+
+            async with self._page_slots:
+                context = await browser.new_context(
+                    user_agent=self.user_agent,
+                    viewport={"width": 1280, "height": 800}
+                )
+                page = await context.new_page()
+                page.set_default_timeout(self.timeout * 1000)
+
+                if BROWSER_CONFIG.get("response_cache", True):
+                    await page.route("**/*", lambda route, request: self._route_request(route, request, fresh))
+                await page.route(_TRACKER_RE, lambda route: route.abort())
+
+                await page.goto(url, wait_until="domcontentloaded")
+                try:
+                    await page.wait_for_selector(CONTENT_SELECTOR, state="attached", timeout=CONTENT_WAIT_TIMEOUT)
+                except Exception as e:
+                    if DEBUG:
+                        print(f"Content selector not found, extracting anyway: {e}")
+
+                # Extraction and the screenshot don't depend on each other; run them together
+                data, screenshot = await asyncio.gather(
+                    self._extract_page(page),
+                    self._take_screenshot(page),
+                )
+
+            title, current_url, main_content, main_tag, links = data
+            markdown_content = self._extractor._to_markdown(main_tag)
+
+            if DEBUG:
+                print(f"Browsed {url}: {title} ({current_url}), {len(links)} links, "
+                      f"{len(markdown_content)} characters of content")
+            return {
+                "status": "success",
+                "url": current_url,
+                "title": title,
+                "content": markdown_content,
+                "html": main_content,
+                "links": links,
+                "screenshot": screenshot,
+                "method": "browser",
+            }
+        except Exception as e:
+            error_msg = f"Error browsing {url}: {str(e)}"
+            print(error_msg)
+
+            return {
+                "status": "error",
+                "error": error_msg,
+                "url": url,
+            }
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+    async def _extract_page(self, page) -> Tuple[str, str, str, Tag, List[Dict[str, str]]]:
+        """
+        Extract the title, main content and links of a page.
+
+        Returns:
+            A tuple of (title, URL, main content HTML, main content element, links)
+        """
+        if BROWSER_CONFIG.get("extract_in_page", True):
+            data = await page.evaluate(PAGE_EXTRACT_JS)
+            return data["title"], data["url"], data["mainHtml"], _make_soup(data["mainHtml"]), data["links"]
+
+        title, html_content = await asyncio.gather(page.title(), page.content())
+        current_url = page.url
+        main_content, links = self._extractor._extract_main_and_links(html_content, current_url)
+        return title, current_url, main_content, _make_soup(main_content), links
+
+    async def _take_screenshot(self, page) -> Optional[str]:
+        """
+        Take a screenshot of a page.
+
+        Returns:
+            Base64-encoded screenshot or None if failed
+        """
+        try:
+            screenshot_type = BROWSER_CONFIG.get("screenshot_type", "jpeg")
+            options = {"type": screenshot_type, "full_page": False}
+            if screenshot_type == "jpeg":
+                options["quality"] = BROWSER_CONFIG.get("screenshot_quality", 70)
+            screenshot_data = await page.screenshot(**options)
+            return base64.b64encode(screenshot_data).decode("ascii")
+        except Exception as e:
+            print(f"Error taking screenshot: {e}")
+            return None
+
+    async def _close(self):
+        """Close the browser, Playwright runtime and HTTP session on the background loop."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"Error closing browser: {e}")
+            self._browser = None
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                print(f"Error stopping Playwright: {e}")
+            self._playwright = None
+
+    def _shutdown(self):
+        """Close everything at interpreter exit if the background loop was started."""
+        if _async_loop is not None and (self._session is not None or self._playwright is not None):
+            try:
+                _run_async(self._close())
+            except Exception as e:
+                if DEBUG:
+                    print(f"Error closing async browser: {e}")
+
+# Create singleton instances
 opena_browser = OpenaBrowser()
+async_opena_browser = AsyncOpenaBrowser()
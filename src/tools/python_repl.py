@@ -2,52 +2,110 @@
 Python REPL tool for SuperNova AI.
 """
 
-import sys
 import io
+import os
+import atexit
+import ctypes
+import signal
+import threading
 import traceback
 from contextlib import redirect_stdout, redirect_stderr
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import ast
-import time
+import functools
 
 from ..config.tools import PYTHON_REPL_CONFIG
+from ._repl_worker import REPL_BUILTINS, WorkerProcess, compile_snippet
+
+# Check for process memory inspection support
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Number of distinct snippets whose validation is cached
+CODE_CACHE_SIZE = 256
+
+# Worker script, started by path so it doesn't import the tools package
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_repl_worker.py")
+
+class _ExecutionTimeout(TimeoutError):
+    """Raised inside executing code when it exceeds its time limit."""
+
+def _run_with_timeout(func, timeout: float):
+    """
+    Run a function, interrupting it with _ExecutionTimeout after timeout seconds.
+
+    Args:
+        func: Function to run
+        timeout: Time limit in seconds; 0 or less disables the limit
+
+    Returns:
+        The function's return value
+    """
+    if timeout <= 0:
+        return func()
+
+    # SIGALRM interrupts the running code directly, but only in the main thread on POSIX
+    if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+        def on_alarm(signum, frame):
+            raise _ExecutionTimeout()
+
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            return func()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    # Elsewhere run in a worker thread and raise the timeout inside it asynchronously
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = func()
+        except BaseException as e:
+            outcome["error"] = e
+
+    worker = threading.Thread(target=target, name="python-repl", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(worker.ident), ctypes.py_object(_ExecutionTimeout))
+        raise _ExecutionTimeout()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
 
 class PythonREPL:
     """Python REPL for executing code."""
 
     def __init__(self):
         """Initialize the Python REPL."""
-        self.locals = {}
+        self.locals = dict(REPL_BUILTINS)
         self.timeout = PYTHON_REPL_CONFIG["timeout"]
         self.max_iterations = PYTHON_REPL_CONFIG["max_iterations"]
         self.allowed_modules = set(PYTHON_REPL_CONFIG["allowed_modules"])
+        self.use_subprocess = PYTHON_REPL_CONFIG.get("use_subprocess", True)
+        self.worker_max_executions = PYTHON_REPL_CONFIG.get("worker_max_executions", 200)
+        self.worker_max_rss_mb = PYTHON_REPL_CONFIG.get("worker_max_rss_mb", 1024)
+
+        # Per-instance cache of import validation, keyed by source
+        self._validated = functools.lru_cache(maxsize=CODE_CACHE_SIZE)(self._validate_imports)
 
-        # Add safe builtins to locals
-        self.locals.update({
-            "print": print,
-            "len": len,
-            "range": range,
-            "enumerate": enumerate,
-            "dict": dict,
-            "list": list,
-            "set": set,
-            "tuple": tuple,
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "sum": sum,
-            "min": min,
-            "max": max,
-            "sorted": sorted,
-            "round": round,
-            "abs": abs,
-            "all": all,
-            "any": any,
-            "zip": zip,
-            "map": map,
-            "filter": filter,
-        })
+        # Long-lived worker process
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+        # Pre-warm a worker so the first execution doesn't pay interpreter startup
+        if self.use_subprocess:
+            try:
+                self._start_worker()
+            except Exception:
+                self.use_subprocess = False
+            atexit.register(self._stop_worker)
 
     def execute(self, code: str, timeout: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -63,54 +121,41 @@ class PythonREPL:
         if timeout is None:
             timeout = self.timeout
 
-        # Check for unsafe imports
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        module_name = name.name.split('.')[0]
-                        if module_name not in self.allowed_modules:
-                            return {
-                                "status": "error",
-                                "error": f"Import of module '{module_name}' is not allowed. Allowed modules: {', '.join(self.allowed_modules)}",
-                                "output": "",
-                                "result": None,
-                            }
-                elif isinstance(node, ast.ImportFrom):
-                    module_name = node.module.split('.')[0] if node.module else ""
-                    if module_name not in self.allowed_modules:
-                        return {
-                            "status": "error",
-                            "error": f"Import of module '{module_name}' is not allowed. Allowed modules: {', '.join(self.allowed_modules)}",
-                            "output": "",
-                            "result": None,
-                        }
-        except SyntaxError as e:
+        # Check for unsafe imports (cached per snippet)
+        valid, error = self._validated(code)
+        if not valid:
             return {
                 "status": "error",
-                "error": f"Syntax error: {str(e)}",
+                "error": error,
                 "output": "",
                 "result": None,
             }
 
+        if self.use_subprocess:
+            return self._execute_in_worker(code, timeout)
+
+        # Compiled code objects are cached too, so repeated snippets skip compilation
+        exec_code, eval_code = compile_snippet(code)
+
         # Capture stdout and stderr
         stdout = io.StringIO()
         stderr = io.StringIO()
 
         # Execute the code
-        result = None
-        start_time = time.time()
+        namespace = {"__builtins__": __builtins__}
+
+        def run():
+            # Run the statements once, then evaluate a trailing expression for the result
+            if exec_code is not None:
+                exec(exec_code, namespace, self.locals)
+            if eval_code is not None:
+                return eval(eval_code, namespace, self.locals)
+            return None
 
         try:
             with redirect_stdout(stdout), redirect_stderr(stderr):
                 # Execute the code with timeout
-                if timeout > 0:
-                    # Simple timeout mechanism
-                    sys.settrace(lambda *args, **kwargs: None)
-                    result = eval(code, {"__builtins__": __builtins__}, self.locals)
-                else:
-                    result = eval(code, {"__builtins__": __builtins__}, self.locals)
+                result = _run_with_timeout(run, timeout)
 
             return {
                 "status": "success",
@@ -118,45 +163,134 @@ class PythonREPL:
                 "output": stdout.getvalue(),
                 "result": result,
             }
+        except _ExecutionTimeout:
+            return {
+                "status": "timeout",
+                "error": f"Execution timed out after {timeout} seconds",
+                "output": stdout.getvalue(),
+                "result": None,
+            }
         except Exception as e:
-            # If eval fails, try exec
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            tb = traceback.format_exc()
+
+            return {
+                "status": "error",
+                "error": error_msg,
+                "output": stdout.getvalue(),
+                "traceback": tb,
+                "result": None,
+            }
+
+    def _execute_in_worker(self, code: str, timeout: float) -> Dict[str, Any]:
+        """
+        Execute code in the worker process, killing it if it exceeds the timeout.
+
+        Args:
+            code: The validated Python code to execute
+            timeout: Time limit in seconds; 0 or less disables the limit
+
+        Returns:
+            A dictionary containing the execution result
+        """
+        with self._worker_lock:
             try:
-                with redirect_stdout(stdout), redirect_stderr(stderr):
-                    # Execute the code with timeout
-                    if timeout > 0:
-                        # Simple timeout mechanism
-                        sys.settrace(lambda *args, **kwargs: None)
-                        exec(code, {"__builtins__": __builtins__}, self.locals)
-                    else:
-                        exec(code, {"__builtins__": __builtins__}, self.locals)
+                if self._worker is None or not self._worker.alive():
+                    self._start_worker()
 
+                reply = self._worker.request(code, timeout if timeout > 0 else None)
+            except TimeoutError:
+                # The worker is stuck; kill it and start fresh on the next call
+                self._stop_worker()
                 return {
-                    "status": "success",
-                    "error": "",
-                    "output": stdout.getvalue(),
+                    "status": "timeout",
+                    "error": f"Execution timed out after {timeout} seconds; the REPL was restarted and its variables cleared",
+                    "output": "",
                     "result": None,
                 }
-            except Exception as e:
-                error_msg = f"{type(e).__name__}: {str(e)}"
-                tb = traceback.format_exc()
-
+            except EOFError as e:
+                self._stop_worker()
                 return {
                     "status": "error",
-                    "error": error_msg,
-                    "output": stdout.getvalue(),
-                    "traceback": tb,
+                    "error": f"REPL worker exited unexpectedly: {str(e)}",
+                    "output": "",
                     "result": None,
                 }
-        finally:
-            # Check if timeout exceeded
-            elapsed_time = time.time() - start_time
-            if elapsed_time >= timeout:
+            except Exception as e:
+                self._stop_worker()
                 return {
-                    "status": "timeout",
-                    "error": f"Execution timed out after {timeout} seconds",
-                    "output": stdout.getvalue(),
+                    "status": "error",
+                    "error": f"{type(e).__name__}: {str(e)}",
+                    "output": "",
                     "result": None,
                 }
 
+            # Say so when the worker is replaced, since its variables go with it
+            reason = self._recycle_worker()
+            if reason:
+                reply["notice"] = f"The REPL worker was restarted after {reason}; variables defined so far have been cleared."
+            return reply
+
+    def _start_worker(self):
+        """Start a worker process."""
+        self._worker = WorkerProcess(_WORKER_SCRIPT, "python-repl")
+
+    def _stop_worker(self):
+        """Kill the worker process, if one is running."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.kill()
+
+    def _recycle_worker(self) -> Optional[str]:
+        """
+        Replace the worker once it has run too many snippets or grown too large.
+
+        Returns:
+            Why the worker was replaced, or None if it was kept
+        """
+        reason = None
+        if self._worker.executions >= self.worker_max_executions:
+            reason = f"{self._worker.executions} executions"
+        elif PSUTIL_AVAILABLE:
+            try:
+                rss = psutil.Process(self._worker.pid).memory_info().rss
+                if rss > self.worker_max_rss_mb * 1024 * 1024:
+                    reason = f"reaching {rss // (1024 * 1024)} MB of memory"
+            except Exception:
+                reason = "its memory use could not be checked"
+
+        if reason:
+            self._stop_worker()
+            self._start_worker()
+        return reason
+
+    def _validate_imports(self, code: str) -> Tuple[bool, str]:
+        """
+        Check code for syntax errors and imports of disallowed modules.
+
+        Args:
+            code: The Python code to check
+
+        Returns:
+            A tuple of (valid, error message)
+        """
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            return False, f"Syntax error: {str(e)}"
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                module_names = [name.name.split('.')[0] for name in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                module_names = [node.module.split('.')[0] if node.module else ""]
+            else:
+                continue
+            for module_name in module_names:
+                if module_name not in self.allowed_modules:
+                    return False, f"Import of module '{module_name}' is not allowed. Allowed modules: {', '.join(self.allowed_modules)}"
+
+        return True, ""
+
 # Create a singleton instance
 python_repl = PythonREPL()
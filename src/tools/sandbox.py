@@ -3,27 +3,303 @@ Sandbox environment for SuperNova AI to safely execute code and commands.
 """
 
 import os
+import re
 import sys
+import select
+import shlex
+import queue
+import atexit
+import shutil
+import threading
 import subprocess
 import tempfile
-import uuid
+import itertools
 import time
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Tuple
 import traceback
 
 from ..config.env import ToolConfig, DEBUG
-from .sandbox_fs import SandboxFileSystem
+from .sandbox_fs import SandboxFileSystem, walk_files
+from ._repl_worker import WorkerProcess
+
+# Warm interpreters kept ready for execute_python; small to bound memory
+SANDBOX_WORKERS = 2
+
+# Maximum bytes of stdout and stderr kept per execution; the child is killed beyond it
+MAX_OUTPUT_BYTES = 10 * 1024 * 1024
+
+# Bytes read from a child's pipe at a time
+_READ_CHUNK = 64 * 1024
+
+# RAM-backed filesystem used for the workspace when available
+SHM_DIR = "/dev/shm"
+
+# Files up to this size are also kept in memory so reading them back needs no file I/O
+MEMORY_FILE_LIMIT = 64 * 1024
+
+# Time limit in seconds for code and command execution
+EXECUTION_TIMEOUT = 30
+
+# Worker script, started by path so it doesn't import the tools package
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_sandbox_worker.py")
+
+# Commands using these shell features still run through /bin/sh; everything
+# else is split into argv and started directly without a shell
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`*?\[\]{}~#!\n\\]|^\s*[A-Za-z_][A-Za-z0-9_]*=")
+_SHELL_BUILTINS = frozenset({
+    "cd", "export", "source", ".", "alias", "unset", "set", "exit", "exec", "eval", "ulimit", "umask",
+    "type", "command", "time", "read", "wait", "hash", "jobs", "trap", "shift", "getopts", "builtin",
+})
+
+# Quoted strings whose contents the shell takes literally
+_LITERAL_QUOTED_RE = re.compile(r"'[^']*'|\"[^\"$`\\]*\"")
+
+def _command_argv(command: str) -> Optional[List[str]]:
+    """Split a command into argv, or return None if it needs a shell."""
+    if _SHELL_SYNTAX_RE.search(_LITERAL_QUOTED_RE.sub("''", command)):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    # Anything not found on PATH may be a builtin or function the shell knows
+    if os.sep not in argv[0] and shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+class _OutputLimitExceeded(Exception):
+    """Raised when a command writes more than MAX_OUTPUT_BYTES; carries the output captured so far."""
+
+    def __init__(self, stdout: bytearray, stderr: bytearray):
+        super().__init__(f"Output exceeded {MAX_OUTPUT_BYTES} bytes")
+        self.stdout = stdout
+        self.stderr = stderr
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured output once, with text-mode newline handling."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+def _run_captured(args, shell: bool, cwd: str, timeout: float) -> Tuple[int, bytearray, bytearray]:
+    """
+    Run a command, streaming its stdout and stderr into byte buffers.
+
+    Args:
+        args: Command argv, or a command string when shell is True
+        shell: Run the command through the shell
+        cwd: Working directory for the command
+        timeout: Time limit in seconds
+
+    Returns:
+        A tuple of (return code, stdout bytes, stderr bytes)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the time limit
+        _OutputLimitExceeded: If the command writes more than MAX_OUTPUT_BYTES
+    """
+    proc = subprocess.Popen(args, shell=shell, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = bytearray(), bytearray()
+
+    try:
+        if os.name != "posix":
+            # select() only works on sockets on Windows; collect everything at the end
+            out, err = proc.communicate(timeout=timeout)
+            return proc.returncode, bytearray(out), bytearray(err)
+
+        # Read both pipes as data arrives, so output is held once and can be capped
+        buffers = {proc.stdout.fileno(): stdout, proc.stderr.fileno(): stderr}
+        open_fds = list(buffers)
+        deadline = time.monotonic() + timeout
+        total = 0
+        while open_fds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(args, timeout)
+            ready, _, _ = select.select(open_fds, [], [], remaining)
+            for fd in ready:
+                chunk = os.read(fd, _READ_CHUNK)
+                if not chunk:
+                    open_fds.remove(fd)
+                    continue
+                buffers[fd] += chunk
+                total += len(chunk)
+                if total > MAX_OUTPUT_BYTES:
+                    raise _OutputLimitExceeded(stdout, stderr)
+
+        returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        return returncode, stdout, stderr
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+
+# File IDs are only dictionary keys and file names, so a per-process prefix and
+# a counter are enough; the prefix includes the start time so IDs from earlier
+# runs sharing the workspace don't collide
+_file_id_prefix = ""
+_file_id_counter = itertools.count()
+
+def _reset_file_ids():
+    """Start a new ID sequence; also run in forked children so they don't repeat the parent's IDs."""
+    global _file_id_prefix, _file_id_counter
+    _file_id_prefix = f"{os.getpid():x}-{time.time_ns():x}"
+    _file_id_counter = itertools.count()
+
+_reset_file_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_file_ids)
+
+def _new_file_id() -> str:
+    """Return a file ID unique to this process run."""
+    return f"{_file_id_prefix}-{next(_file_id_counter):x}"
+
+def _error_result(e: Exception, **fields) -> Dict[str, Any]:
+    """
+    Build the result for an unexpected exception.
+
+    Args:
+        e: The exception being handled
+        **fields: Extra fields for the result
+
+    Returns:
+        An error result; the traceback is only formatted in DEBUG mode
+    """
+    result = {"status": "error", "error": str(e), **fields}
+    if DEBUG:
+        result["traceback"] = traceback.format_exc()
+    return result
+
+def _write_text(file_path: str, content: str) -> os.stat_result:
+    """
+    Encode text once and write it to a file through a raw descriptor, bypassing TextIOWrapper.
+
+    Args:
+        file_path: Path of the file to write
+        content: Text to write
+
+    Returns:
+        The stat of the written file
+    """
+    view = memoryview(content.encode("utf-8"))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked; continue from where it stopped
+        while view:
+            view = view[os.write(fd, view):]
+        return os.fstat(fd)
+    finally:
+        os.close(fd)
+
+def _read_text(file_path: str) -> str:
+    """Read a UTF-8 text file, with text-mode newline handling."""
+    with open(file_path, "rb") as f:
+        content = f.read().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+class _WorkerPool:
+    """Pool of warm worker processes that run sandbox Python scripts."""
+
+    def __init__(self, size: int):
+        """
+        Start the pool's workers.
+
+        Args:
+            size: Number of worker processes
+        """
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._spawn())
+        atexit.register(self.shutdown)
+
+    def _spawn(self) -> WorkerProcess:
+        """Start a new worker process."""
+        return WorkerProcess(_WORKER_SCRIPT, "sandbox")
+
+    def run(self, code: str, filename: str, directory: str, timeout: float) -> Dict[str, Any]:
+        """
+        Run a script on an idle worker, replacing the worker if it times out or dies.
+
+        Args:
+            code: Python source to run
+            filename: Name to run the source under; its path if it was saved
+            directory: Directory put first on the script's sys.path
+            timeout: Time limit in seconds
+
+        Returns:
+            A dictionary with the return code, stdout and stderr
+
+        Raises:
+            TimeoutError: If the script exceeds the time limit
+            EOFError: If the worker exited while running the script
+        """
+        worker = self._idle.get()
+        try:
+            if not worker.alive():
+                worker.kill()
+                worker = self._spawn()
+            return worker.request({
+                "code": code,
+                "filename": filename,
+                "directory": directory,
+                "max_output": MAX_OUTPUT_BYTES,
+            }, timeout)
+        except BaseException:
+            # A stuck or dead worker is killed and replaced so the pool stays full
+            worker.kill()
+            worker = self._spawn()
+            raise
+        finally:
+            self._idle.put(worker)
+
+    def shutdown(self):
+        """Kill every idle worker."""
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+_WORKER_POOL = None
+_worker_pool_lock = threading.Lock()
+
+def _get_worker_pool() -> _WorkerPool:
+    """Start the worker pool on first use and return it."""
+    global _WORKER_POOL
+    if _WORKER_POOL is None:
+        with _worker_pool_lock:
+            if _WORKER_POOL is None:
+                _WORKER_POOL = _WorkerPool(SANDBOX_WORKERS)
+    return _WORKER_POOL
 
 class Sandbox:
     """Sandbox environment for executing code and commands."""
 
     def __init__(self):
         """Initialize the sandbox environment."""
-        self.workspace_dir = os.path.join(tempfile.gettempdir(), "supernova_sandbox")
+        self.workspace_dir = self._workspace_location()
         os.makedirs(self.workspace_dir, exist_ok=True)
 
-        # Track created files
+        # Workspace path with one trailing separator, for building and stripping
+        # paths on hot paths without os.path.join/relpath
+        self._ws_prefix = self.workspace_dir.rstrip(os.sep) + os.sep
+
+        # Track created files, with a reverse index from path to file ID
         self.files = {}
+        self._path_to_id = {}
+
+        # Contents of small files by path, with the (mtime_ns, size) they were read
+        # or written at; files on disk stay authoritative since commands and code
+        # running in the sandbox can change them
+        self._memory_files = {}
 
         # Initialize file system
         self.fs = SandboxFileSystem(self.workspace_dir)
@@ -31,65 +307,80 @@ class Sandbox:
         if DEBUG:
             print(f"Sandbox initialized at {self.workspace_dir}")
 
-    def execute_python(self, code: str) -> Dict[str, Any]:
+    def _workspace_location(self) -> str:
+        """
+        Choose the workspace directory.
+
+        Returns:
+            SUPERNOVA_SANDBOX_DIR if set, else a per-process directory on /dev/shm
+            when it is writable, else a directory in the system temp dir
+        """
+        override = os.getenv("SUPERNOVA_SANDBOX_DIR")
+        if override:
+            return override
+
+        # Throwaway scripts and files live in RAM on tmpfs instead of on disk
+        if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+            workspace_dir = os.path.join(SHM_DIR, f"supernova_sandbox_{os.getpid()}")
+
+            # tmpfs is memory; don't leave per-process workspaces behind
+            atexit.register(shutil.rmtree, workspace_dir, ignore_errors=True)
+            return workspace_dir
+
+        return os.path.join(tempfile.gettempdir(), "supernova_sandbox")
+
+    def execute_python(self, code: str, persist: bool = False) -> Dict[str, Any]:
         """
         Execute Python code in a sandbox environment.
 
         Args:
             code: Python code to execute
+            persist: Save the code to a file in the workspace and run it from there
 
         Returns:
             A dictionary containing the execution result
         """
-        # Create a temporary file for the code
-        file_id = str(uuid.uuid4())
-        file_path = os.path.join(self.workspace_dir, f"{file_id}.py")
+        # The code is sent to the worker directly; a file is only written on request
+        file_info = {}
+        filename = "<sandbox>"
 
         try:
-            # Write the code to the file
-            with open(file_path, "w") as f:
-                f.write(code)
-
-            # Track the file
-            self.files[file_id] = {
-                "path": file_path,
-                "type": "python",
-                "content": code,
-                "created_at": time.time()
-            }
-
-            # Execute the code in a subprocess
-            result = subprocess.run(
-                [sys.executable, file_path],
-                capture_output=True,
-                text=True,
-                timeout=30  # 30 second timeout
-            )
+            if persist:
+                file_id = _new_file_id()
+                file_path = f"{self._ws_prefix}{file_id}.py"
+                file_info = {"file_id": file_id, "file_path": file_path}
+                filename = file_path
+
+                # Write the code to the file
+                file_stat = _write_text(file_path, code)
+
+                # Track the file; its content stays on disk, read_file returns it
+                self._track_file(file_id, {
+                    "path": file_path,
+                    "type": "python",
+                    "size": file_stat.st_size,
+                    "created_at": time.time()
+                })
+
+            # Execute the code in a child forked from a warm worker instead of a new interpreter
+            result = _get_worker_pool().run(code, filename, self.workspace_dir, EXECUTION_TIMEOUT)
 
             # Process the result
             return {
-                "status": "success" if result.returncode == 0 else "error",
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "file_id": file_id,
-                "file_path": file_path
+                "status": "success" if result["returncode"] == 0 else "error",
+                "stdout": result["stdout"],
+                "stderr": result["stderr"],
+                **file_info
             }
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return {
                 "status": "error",
-                "error": "Execution timed out after 30 seconds",
-                "file_id": file_id,
-                "file_path": file_path
+                "error": f"Execution timed out after {EXECUTION_TIMEOUT} seconds",
+                **file_info
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc(),
-                "file_id": file_id,
-                "file_path": file_path
-            }
+            return _error_result(e, **file_info)
 
     def execute_command(self, command: str) -> Dict[str, Any]:
         """
@@ -102,37 +393,46 @@ class Sandbox:
             A dictionary containing the execution result
         """
         try:
-            # Execute the command in a subprocess
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30,  # 30 second timeout
-                cwd=self.workspace_dir
-            )
-
-            # Process the result
+            # Plain commands are spawned directly; skipping /bin/sh saves a process
+            # and lets subprocess use posix_spawn
+            argv = _command_argv(command)
+            try:
+                returncode, stdout, stderr = _run_captured(
+                    argv if argv is not None else command,
+                    argv is None,
+                    self.workspace_dir,
+                    EXECUTION_TIMEOUT
+                )
+            except FileNotFoundError:
+                if argv is None:
+                    raise
+                # Let the shell resolve the command and report its own errors
+                returncode, stdout, stderr = _run_captured(command, True, self.workspace_dir, EXECUTION_TIMEOUT)
+
+            # Process the result, decoding the output once
             return {
-                "status": "success" if result.returncode == 0 else "error",
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "status": "success" if returncode == 0 else "error",
+                "stdout": _decode_output(stdout),
+                "stderr": _decode_output(stderr),
                 "command": command
             }
 
-        except subprocess.TimeoutExpired:
+        except _OutputLimitExceeded as e:
             return {
                 "status": "error",
-                "error": "Execution timed out after 30 seconds",
+                "error": f"{e}; the command was stopped",
+                "stdout": _decode_output(e.stdout),
+                "stderr": _decode_output(e.stderr),
                 "command": command
             }
-        except Exception as e:
+        except subprocess.TimeoutExpired:
             return {
                 "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc(),
+                "error": f"Execution timed out after {EXECUTION_TIMEOUT} seconds",
                 "command": command
             }
+        except Exception as e:
+            return _error_result(e, command=command)
 
     def create_file(self, filename: str, content: str) -> Dict[str, Any]:
         """
@@ -152,18 +452,18 @@ class Sandbox:
             # Create directories if needed
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-            # Write the content to the file
-            with open(file_path, "w") as f:
-                f.write(content)
+            # Write the content to the file, keeping small files in memory too
+            file_stat = _write_text(file_path, content)
+            self._remember(file_path, file_stat, content)
 
-            # Track the file
-            file_id = str(uuid.uuid4())
-            self.files[file_id] = {
+            # Track the file; its content stays on disk, read_file returns it
+            file_id = _new_file_id()
+            self._track_file(file_id, {
                 "path": file_path,
                 "type": "file",
-                "content": content,
+                "size": file_stat.st_size,
                 "created_at": time.time()
-            }
+            })
 
             return {
                 "status": "success",
@@ -173,12 +473,7 @@ class Sandbox:
             }
 
         except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc(),
-                "filename": filename
-            }
+            return _error_result(e, filename=filename)
 
     def read_file(self, filename: str) -> Dict[str, Any]:
         """
@@ -194,8 +489,10 @@ class Sandbox:
             # Read a file from the sandbox
             file_path = os.path.join(self.workspace_dir, filename)
 
-            # Check if the file exists
-            if not os.path.exists(file_path):
+            # Check if the file exists; the stat also tells whether the copy in memory is current
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
                 return {
                     "status": "error",
                     "error": f"File {filename} does not exist",
@@ -203,8 +500,12 @@ class Sandbox:
                 }
 
             # Read the file content
-            with open(file_path, "r") as f:
-                content = f.read()
+            cached = self._memory_files.get(file_path)
+            if cached is not None and cached[0] == (file_stat.st_mtime_ns, file_stat.st_size):
+                content = cached[1]
+            else:
+                content = _read_text(file_path)
+                self._remember(file_path, file_stat, content)
 
             return {
                 "status": "success",
@@ -214,12 +515,7 @@ class Sandbox:
             }
 
         except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc(),
-                "filename": filename
-            }
+            return _error_result(e, filename=filename)
 
     def list_files(self) -> Dict[str, Any]:
         """
@@ -229,18 +525,18 @@ class Sandbox:
             A dictionary containing the list of files
         """
         try:
-            # List all files in the sandbox
+            # List all files in the sandbox, one stat per file; every entry path
+            # starts with the workspace prefix, so slicing it off gives the relative path
             files = []
-            for root, dirs, filenames in os.walk(self.workspace_dir):
-                for filename in filenames:
-                    file_path = os.path.join(root, filename)
-                    rel_path = os.path.relpath(file_path, self.workspace_dir)
-                    files.append({
-                        "filename": rel_path,
-                        "path": file_path,
-                        "size": os.path.getsize(file_path),
-                        "modified_at": os.path.getmtime(file_path)
-                    })
+            prefix_len = len(self._ws_prefix)
+            for entry in walk_files(self.workspace_dir):
+                file_stat = entry.stat()
+                files.append({
+                    "filename": entry.path[prefix_len:],
+                    "path": entry.path,
+                    "size": file_stat.st_size,
+                    "modified_at": file_stat.st_mtime
+                })
 
             return {
                 "status": "success",
@@ -248,11 +544,7 @@ class Sandbox:
             }
 
         except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
+            return _error_result(e)
 
     def delete_file(self, filename: str) -> Dict[str, Any]:
         """
@@ -268,21 +560,19 @@ class Sandbox:
             # Delete a file from the sandbox
             file_path = os.path.join(self.workspace_dir, filename)
 
-            # Check if the file exists
-            if not os.path.exists(file_path):
+            # Delete the file; a missing file is reported by the remove itself
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
                 return {
                     "status": "error",
                     "error": f"File {filename} does not exist",
                     "filename": filename
                 }
 
-            # Delete the file
-            os.remove(file_path)
-
             # Remove from tracked files
-            for file_id, file_info in list(self.files.items()):
-                if file_info["path"] == file_path:
-                    del self.files[file_id]
+            self.files.pop(self._path_to_id.pop(file_path, None), None)
+            self._memory_files.pop(file_path, None)
 
             return {
                 "status": "success",
@@ -290,12 +580,7 @@ class Sandbox:
             }
 
         except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc(),
-                "filename": filename
-            }
+            return _error_result(e, filename=filename)
 
     def clean(self) -> Dict[str, Any]:
         """
@@ -305,14 +590,19 @@ class Sandbox:
             A dictionary containing the result
         """
         try:
-            # Remove all files in the sandbox
-            for root, dirs, filenames in os.walk(self.workspace_dir):
-                for filename in filenames:
-                    file_path = os.path.join(root, filename)
-                    os.remove(file_path)
+            # Remove everything in the sandbox; rmtree deletes whole subdirectories
+            # without a Python-level walk, and the workspace itself is kept
+            with os.scandir(self.workspace_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
 
             # Clear tracked files
             self.files = {}
+            self._path_to_id = {}
+            self._memory_files = {}
 
             return {
                 "status": "success",
@@ -320,11 +610,37 @@ class Sandbox:
             }
 
         except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
+            return _error_result(e)
+
+    def _remember(self, file_path: str, file_stat: os.stat_result, content: str):
+        """
+        Keep a small file's content in memory, keyed by the stat it matches.
+
+        Args:
+            file_path: Path of the file
+            file_stat: Stat of the file when content was written or read
+            content: Text content of the file, as read_file returns it
+        """
+        if file_stat.st_size > MEMORY_FILE_LIMIT:
+            self._memory_files.pop(file_path, None)
+            return
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        self._memory_files[file_path] = ((file_stat.st_mtime_ns, file_stat.st_size), content)
+
+    def _track_file(self, file_id: str, file_info: Dict[str, Any]):
+        """
+        Track a created file, replacing any earlier entry for the same path.
+
+        Args:
+            file_id: ID of the new entry
+            file_info: File information, including its path
+        """
+        previous_id = self._path_to_id.get(file_info["path"])
+        if previous_id is not None:
+            self.files.pop(previous_id, None)
+        self._path_to_id[file_info["path"]] = file_id
+        self.files[file_id] = file_info
 
     def list_directory(self, path: str = "") -> Dict[str, Any]:
         """
@@ -350,18 +666,19 @@ class Sandbox:
         """
         return self.fs.create_directory(path)
 
-    def copy_file(self, source: str, destination: str) -> Dict[str, Any]:
+    def copy_file(self, source: str, destination: str, preserve_metadata: bool = True) -> Dict[str, Any]:
         """
         Copy a file within the sandbox.
 
         Args:
             source: Source path relative to sandbox
             destination: Destination path relative to sandbox
+            preserve_metadata: Whether to copy permissions and timestamps too
 
         Returns:
             Dictionary with operation result
         """
-        return self.fs.copy_file(source, destination)
+        return self.fs.copy_file(source, destination, preserve_metadata)
 
     def move_file(self, source: str, destination: str) -> Dict[str, Any]:
         """
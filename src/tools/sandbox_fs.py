@@ -3,11 +3,146 @@ Enhanced file system operations for the SuperNova AI sandbox.
 """
 
 import os
+import re
+import stat
 import shutil
-import glob
+import fnmatch
+import functools
 import time
 import uuid
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterator, Tuple, Callable
+
+# Characters that make a path component a glob pattern rather than a literal name
+_MAGIC_RE = re.compile(r"[*?[]")
+
+def walk_files(directory: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the DirEntry of every file under a directory, recursively.
+
+    DirEntry caches what the directory read returned, so callers can use
+    is_dir() and stat() without extra syscalls per file.
+
+    Args:
+        directory: Directory to walk
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Like os.walk, symlinked directories are neither listed nor followed
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    yield from walk_files(entry.path)
+            else:
+                yield entry
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a path, for callers that only need to know whether it exists and what it is.
+
+    One stat answers what separate exists/isdir/isfile calls would each stat for.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        The stat result, or None if the path does not exist
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+# Component list of a pattern ending in a separator, which matches directories only
+_TRAILING_SEP = (("", None),)
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Tuple[Optional[str], Tuple[Tuple[str, Optional[Callable]], ...]]:
+    """
+    Split a glob pattern into its literal base directory and compiled components.
+
+    Args:
+        pattern: Glob pattern
+
+    Returns:
+        A tuple of (base directory, or None if the pattern has no wildcards,
+        components as (name, regex match function or None for a literal name))
+    """
+    parts = pattern.split(os.sep)
+
+    # Start from the longest leading run of literal components
+    literal = 0
+    while literal < len(parts) and not _MAGIC_RE.search(parts[literal]):
+        literal += 1
+    if literal == len(parts):
+        return None, ()
+
+    # An empty base means the current directory, with matches yielded as relative paths
+    base = os.sep.join(parts[:literal]) or (os.sep if literal else "")
+    components = tuple(
+        (part, re.compile(fnmatch.translate(part)).match if _MAGIC_RE.search(part) else None)
+        for part in parts[literal:]
+    )
+    return base, components
+
+def iglob_entries(pattern: str) -> Iterator[Tuple[str, Optional[os.DirEntry]]]:
+    """
+    Yield paths matching a glob pattern, with glob.glob's non-recursive semantics.
+
+    Each path comes with the DirEntry it was found as, or None when it was
+    reached through literal names only, so callers can reuse its cached stat results.
+
+    Args:
+        pattern: Glob pattern with an absolute or relative directory part
+    """
+    base, components = _compile_glob(pattern)
+    if base is None:
+        if os.path.lexists(pattern):
+            yield pattern, None
+        return
+
+    yield from _match_components(base, components)
+
+def _match_components(directory: str, components: Tuple[Tuple[str, Optional[Callable]], ...]) -> Iterator[Tuple[str, Optional[os.DirEntry]]]:
+    """Yield entries of directory matching the first component, descending for the rest."""
+    (part, match), rest = components[0], components[1:]
+
+    # Prefix for child paths, built once rather than joined per entry
+    prefix = os.path.join(directory, "") if directory else ""
+
+    # A literal name needs a lookup, not a directory listing
+    if match is None:
+        path = prefix + part
+        if not rest:
+            if os.path.lexists(path):
+                yield path, None
+        elif os.path.isdir(path):
+            if rest == _TRAILING_SEP:
+                yield path + os.sep, None
+            else:
+                yield from _match_components(path, rest)
+        return
+
+    try:
+        entries = os.scandir(directory or os.curdir)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            # Like glob, wildcards don't match hidden names unless the pattern starts with a dot
+            if entry.name.startswith(".") and not part.startswith("."):
+                continue
+            if not match(entry.name):
+                continue
+
+            path = prefix + entry.name
+            if not rest:
+                yield path, entry
+            elif entry.is_dir():
+                if rest == _TRAILING_SEP:
+                    # A trailing separator matches directories only
+                    yield path + os.sep, entry
+                else:
+                    yield from _match_components(path, rest)
 
 class SandboxFileSystem:
     """Enhanced file system operations for the sandbox environment."""
@@ -21,6 +156,9 @@ class SandboxFileSystem:
         """
         self.workspace_dir = workspace_dir
         
+        # Workspace path with one trailing separator, for stripping it off matches
+        self._ws_prefix = workspace_dir.rstrip(os.sep) + os.sep
+        
     def list_directory(self, path: str = "") -> Dict[str, Any]:
         """
         List contents of a directory in the sandbox.
@@ -35,36 +173,38 @@ class SandboxFileSystem:
             # Normalize the path
             full_path = os.path.join(self.workspace_dir, path)
             
-            # Check if the path exists
-            if not os.path.exists(full_path):
+            # Open the directory; a missing path or a file is reported by the open itself
+            try:
+                entries = os.scandir(full_path)
+            except FileNotFoundError:
                 return {
                     "status": "error",
                     "error": f"Path {path} does not exist",
                     "path": path
                 }
-            
-            # Check if it's a directory
-            if not os.path.isdir(full_path):
+            except NotADirectoryError:
                 return {
                     "status": "error",
                     "error": f"Path {path} is not a directory",
                     "path": path
                 }
             
-            # List the directory contents
+            # List the directory contents; DirEntry caches type info from the directory read
             items = []
-            for item in os.listdir(full_path):
-                item_path = os.path.join(full_path, item)
-                rel_path = os.path.join(path, item) if path else item
-                
-                items.append({
-                    "name": item,
-                    "path": rel_path,
-                    "full_path": item_path,
-                    "is_dir": os.path.isdir(item_path),
-                    "size": os.path.getsize(item_path) if os.path.isfile(item_path) else 0,
-                    "modified": os.path.getmtime(item_path)
-                })
+            rel_prefix = os.path.join(path, "") if path else ""
+            with entries:
+                for entry in entries:
+                    rel_path = rel_prefix + entry.name
+                    item_stat = entry.stat()
+                    
+                    items.append({
+                        "name": entry.name,
+                        "path": rel_path,
+                        "full_path": entry.path,
+                        "is_dir": entry.is_dir(),
+                        "size": item_stat.st_size if entry.is_file() else 0,
+                        "modified": item_stat.st_mtime
+                    })
             
             return {
                 "status": "success",
@@ -95,8 +235,9 @@ class SandboxFileSystem:
             full_path = os.path.join(self.workspace_dir, path)
             
             # Check if the path already exists
-            if os.path.exists(full_path):
-                if os.path.isdir(full_path):
+            path_stat = _stat_or_none(full_path)
+            if path_stat is not None:
+                if stat.S_ISDIR(path_stat.st_mode):
                     return {
                         "status": "success",
                         "message": f"Directory {path} already exists",
@@ -127,13 +268,14 @@ class SandboxFileSystem:
                 "path": path
             }
     
-    def copy_file(self, source: str, destination: str) -> Dict[str, Any]:
+    def copy_file(self, source: str, destination: str, preserve_metadata: bool = True) -> Dict[str, Any]:
         """
         Copy a file within the sandbox.
         
         Args:
             source: Source path relative to sandbox
             destination: Destination path relative to sandbox
+            preserve_metadata: Whether to copy permissions and timestamps too
             
         Returns:
             Dictionary with operation result
@@ -143,8 +285,9 @@ class SandboxFileSystem:
             source_path = os.path.join(self.workspace_dir, source)
             dest_path = os.path.join(self.workspace_dir, destination)
             
-            # Check if the source exists
-            if not os.path.exists(source_path):
+            # Check the source with a single stat
+            source_stat = _stat_or_none(source_path)
+            if source_stat is None:
                 return {
                     "status": "error",
                     "error": f"Source {source} does not exist",
@@ -152,8 +295,7 @@ class SandboxFileSystem:
                     "destination": destination
                 }
             
-            # Check if the source is a file
-            if not os.path.isfile(source_path):
+            if not stat.S_ISREG(source_stat.st_mode):
                 return {
                     "status": "error",
                     "error": f"Source {source} is not a file",
@@ -161,11 +303,18 @@ class SandboxFileSystem:
                     "destination": destination
                 }
             
-            # Create destination directory if it doesn't exist
-            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            # Like shutil.copy2, copying onto a directory copies into it
+            if os.path.isdir(dest_path):
+                dest_path = os.path.join(dest_path, os.path.basename(source_path))
+            else:
+                # Create destination directory if it doesn't exist
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
             
-            # Copy the file
-            shutil.copy2(source_path, dest_path)
+            # Copy the file; copyfile moves the data in the kernel (copy_file_range or
+            # sendfile) where the platform allows, and copystat is only paid for when asked
+            shutil.copyfile(source_path, dest_path)
+            if preserve_metadata:
+                shutil.copystat(source_path, dest_path)
             
             return {
                 "status": "success",
@@ -201,7 +350,7 @@ class SandboxFileSystem:
             dest_path = os.path.join(self.workspace_dir, destination)
             
             # Check if the source exists
-            if not os.path.exists(source_path):
+            if _stat_or_none(source_path) is None:
                 return {
                     "status": "error",
                     "error": f"Source {source} does not exist",
@@ -246,19 +395,25 @@ class SandboxFileSystem:
             # Normalize the pattern
             full_pattern = os.path.join(self.workspace_dir, pattern)
             
-            # Find matching files
-            matches = glob.glob(full_pattern)
-            
-            # Convert to relative paths
+            # Find matching files, reusing each DirEntry's cached stat
             rel_matches = []
-            for match in matches:
-                rel_path = os.path.relpath(match, self.workspace_dir)
+            prefix_len = len(self._ws_prefix)
+            for match, entry in iglob_entries(full_pattern):
+                if entry is None:
+                    match_stat = os.stat(match)
+                    is_dir = stat.S_ISDIR(match_stat.st_mode)
+                    is_file = stat.S_ISREG(match_stat.st_mode)
+                else:
+                    match_stat = entry.stat()
+                    is_dir = entry.is_dir()
+                    is_file = entry.is_file()
+                
                 rel_matches.append({
-                    "path": rel_path,
+                    "path": match[prefix_len:] if match.startswith(self._ws_prefix) else os.path.relpath(match, self.workspace_dir),
                     "full_path": match,
-                    "is_dir": os.path.isdir(match),
-                    "size": os.path.getsize(match) if os.path.isfile(match) else 0,
-                    "modified": os.path.getmtime(match)
+                    "is_dir": is_dir,
+                    "size": match_stat.st_size if is_file else 0,
+                    "modified": match_stat.st_mtime
                 })
             
             return {
@@ -289,8 +444,10 @@ class SandboxFileSystem:
             # Normalize the path
             full_path = os.path.join(self.workspace_dir, path)
             
-            # Check if the path exists
-            if not os.path.exists(full_path):
+            # Stat once; the existence check and every field come from the same result
+            try:
+                file_stat = os.stat(full_path)
+            except FileNotFoundError:
                 return {
                     "status": "error",
                     "error": f"Path {path} does not exist",
@@ -298,7 +455,7 @@ class SandboxFileSystem:
                 }
             
             # Get file information
-            is_dir = os.path.isdir(full_path)
+            is_dir = stat.S_ISDIR(file_stat.st_mode)
             
             info = {
                 "status": "success",
@@ -306,11 +463,11 @@ class SandboxFileSystem:
                 "full_path": full_path,
                 "exists": True,
                 "is_dir": is_dir,
-                "is_file": os.path.isfile(full_path),
-                "size": os.path.getsize(full_path) if not is_dir else 0,
-                "created": os.path.getctime(full_path),
-                "modified": os.path.getmtime(full_path),
-                "accessed": os.path.getatime(full_path)
+                "is_file": stat.S_ISREG(file_stat.st_mode),
+                "size": file_stat.st_size if not is_dir else 0,
+                "created": file_stat.st_ctime,
+                "modified": file_stat.st_mtime,
+                "accessed": file_stat.st_atime
             }
             
             return info
@@ -22,18 +22,19 @@
         """
         return self.fs.create_directory(path)
     
-    def copy_file(self, source: str, destination: str) -> Dict[str, Any]:
+    def copy_file(self, source: str, destination: str, preserve_metadata: bool = True) -> Dict[str, Any]:
         """
         Copy a file within the sandbox.
         
         Args:
             source: Source path relative to sandbox
             destination: Destination path relative to sandbox
+            preserve_metadata: Whether to copy permissions and timestamps too
             
         Returns:
             Dictionary with operation result
         """
-        return self.fs.copy_file(source, destination)
+        return self.fs.copy_file(source, destination, preserve_metadata)
     
     def move_file(self, source: str, destination: str) -> Dict[str, Any]:
         """
@@ -2,6 +2,12 @@
 Web search tools for SuperNova AI.
 """
 
+import time
+import queue
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from ..config.env import DEBUG
 from ..config.tools import SEARCH_CONFIG
@@ -13,6 +19,65 @@ try:
 except ImportError:
     DDGS_AVAILABLE = False
 
+# Maximum number of searches search_many runs at once, to stay clear of rate limits
+SEARCH_CONCURRENCY = 5
+
+def _run_sync(coro):
+    """Run a coroutine to completion, even when called from inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; least recently used entries are evicted
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store a value for key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Drop the entry for key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
 class WebSearch:
     """Web search tool using available search APIs."""
 
@@ -21,6 +86,19 @@ class WebSearch:
         self.max_results = SEARCH_CONFIG["max_results"]
         self.search_depth = SEARCH_CONFIG["search_depth"]
 
+        # Recent results by (query, max_results), so repeated searches skip the network
+        self.cache_ttl = SEARCH_CONFIG.get("cache_ttl", 300)
+        self._cache = TTLCache(SEARCH_CONFIG.get("cache_size", 256), self.cache_ttl)
+
+        # Idle DuckDuckGo clients, reused across searches so their HTTP connections
+        # stay alive; a client serves one search at a time. Each DDGS owns a pooled
+        # keep-alive HTTP client (httpx.Client in duckduckgo-search 4.x, primp.Client
+        # from 5.x on) that it builds itself and no version accepts from the caller,
+        # so reusing the DDGS instance is what keeps sockets and TLS sessions warm
+        self._ddgs_pool = queue.LifoQueue()
+        if DDGS_AVAILABLE:
+            self._ddgs_pool.put(DDGS())
+
     def search(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Search the web for information.
@@ -41,6 +119,14 @@ class WebSearch:
             print(f"Max results: {max_results}")
             print(f"DuckDuckGo package available: {DDGS_AVAILABLE}")
 
+        # Identical recent searches are answered from memory
+        if self.cache_ttl > 0:
+            cached = self._cache.get((query, max_results))
+            if cached is not None:
+                if DEBUG:
+                    print("Using cached search results")
+                return list(cached)
+
         # Always use DuckDuckGo if available
         if DDGS_AVAILABLE:
             # If DuckDuckGo package is available, use DuckDuckGo
@@ -53,6 +139,29 @@ class WebSearch:
                 print("Using simulated search")
             return self._simulated_search(query, max_results)
 
+    def search_many(self, queries: List[str], max_results: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Search the web for several queries concurrently.
+
+        Args:
+            queries: The search queries
+            max_results: Maximum number of results to return per query (overrides config)
+
+        Returns:
+            A list of search result lists, in the same order as queries
+        """
+        return _run_sync(self._search_many(queries, max_results))
+
+    async def _search_many(self, queries: List[str], max_results: Optional[int]) -> List[List[Dict[str, Any]]]:
+        """Run search for each query on worker threads, at most SEARCH_CONCURRENCY at once."""
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+
+        async def search_one(query: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self.search, query, max_results)
+
+        return await asyncio.gather(*(search_one(query) for query in queries))
+
     def _tavily_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """
         Search using Tavily API (deprecated, always falls back to DuckDuckGo).
@@ -84,22 +193,37 @@ class WebSearch:
 
         try:
             results = []
-            with DDGS() as ddgs:
+            try:
+                ddgs = self._ddgs_pool.get_nowait()
+            except queue.Empty:
+                # Every client is busy with a concurrent search; add one to the pool
+                ddgs = DDGS()
+
+            try:
                 ddgs_results = list(ddgs.text(query, max_results=max_results))
+            except Exception:
+                # The client may be left in a bad state; replace it for the next search
+                ddgs = DDGS()
+                raise
+            finally:
+                self._ddgs_pool.put(ddgs)
 
-                for result in ddgs_results:
-                    results.append({
-                        "title": result.get("title", ""),
-                        "url": result.get("href", ""),
-                        "content": result.get("body", ""),
-                        "score": 0.9,  # DuckDuckGo doesn't provide scores
-                    })
+            for result in ddgs_results:
+                results.append({
+                    "title": result.get("title", ""),
+                    "url": result.get("href", ""),
+                    "content": result.get("body", ""),
+                    "score": 0.9,  # DuckDuckGo doesn't provide scores
+                })
 
             if not results:
                 print("No results from DuckDuckGo. Using simulated search.")
                 return self._simulated_search(query, max_results)
 
-            return results
+            # Only real results are cached; a failed search is retried next time
+            if self.cache_ttl > 0:
+                self._cache.put((query, max_results), results)
+            return list(results)
 
         except Exception as e:
             print(f"Error using DuckDuckGo Search: {e}")
@@ -7,32 +7,161 @@ import os
 import time
 import json
 import re
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 from typing import Dict, Any, List, Optional, Union
-from urllib.parse import urlparse, urljoin, quote_plus
+from urllib.parse import urlparse, urljoin, quote_plus, urlsplit, urlunsplit
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Tag
 import html2text
 
 from ..config.env import ToolConfig, DEBUG
 from ..config.tools import BROWSER_CONFIG
-from .search import web_search
+from .search import web_search, TTLCache
+
+# Try to import optional dependencies
+try:
+    import lxml
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from markdownify import MarkdownConverter
+    MARKDOWNIFY_AVAILABLE = True
+except ImportError:
+    MARKDOWNIFY_AVAILABLE = False
+
+if MARKDOWNIFY_AVAILABLE:
+    class _MarkdownConverter(MarkdownConverter):
+        """Markdown converter that drops script and style contents."""
+
+        def convert_script(self, *args, **kwargs):
+            return ""
+
+        convert_style = convert_script
+
+# HTML parser for BeautifulSoup; lxml parses in C, html.parser in pure Python
+SOUP_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Connection pool settings for the browser's HTTP session
+SESSION_POOL_CONNECTIONS = 16  # Hosts kept in the pool
+SESSION_POOL_MAXSIZE = 64  # Connections kept per host
+
+# Seconds to wait for a connection; reads use BROWSER_CONFIG["timeout"]
+CONNECT_TIMEOUT = 5
+
+# Content types parsed as pages; anything else is rejected before its body is read
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Maximum bytes of a page read; longer pages without a Content-Length are truncated
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Size of each read from the response stream
+_READ_CHUNK = 64 * 1024
+
+# Maximum number of prefetched pages kept for later browse calls
+PREFETCH_CACHE_SIZE = 32
+
+# Threads fetching search results in the background
+PREFETCH_WORKERS = 3
+
+# Word tokenizer and question words ignored when picking keywords from an information request
+_WORD_RE = re.compile(r"\b\w+\b")
+_STOPWORDS = frozenset({"what", "when", "where", "which", "about", "information"})
+
+# Main-content candidates in order of preference: <main>, then these ids, then
+# these classes, then <article>; lower rank wins
+_MAIN_ID_RANKS = {"main": 1, "content": 2, "main-content": 3}
+_MAIN_CLASS_RANKS = {"main": 4, "content": 5, "main-content": 6}
+_ARTICLE_RANK = 7
+
+def _find_main_tag(soup: BeautifulSoup) -> Optional[Tag]:
+    """
+    Find the main content tag in a single walk of the tree.
+
+    Returns the same tag as trying each candidate with its own soup.find in
+    order of preference: the first tag in document order with the best rank.
+
+    Args:
+        soup: BeautifulSoup object
+
+    Returns:
+        The main content tag, or None if there is no candidate
+    """
+    best, best_rank = None, _ARTICLE_RANK + 1
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        if tag.name == "main":
+            # Nothing outranks <main>
+            return tag
+
+        rank = _MAIN_ID_RANKS.get(tag.get("id"), best_rank)
+        for class_name in tag.get("class") or ():
+            rank = min(rank, _MAIN_CLASS_RANKS.get(class_name, rank))
+        if tag.name == "article":
+            rank = min(rank, _ARTICLE_RANK)
+
+        if rank < best_rank:
+            best, best_rank = tag, rank
+    return best
 
 class StreamlitBrowser:
     """Streamlit-compatible browser tool for SuperNova AI."""
 
     def __init__(self):
         """Initialize the Streamlit-compatible browser tool."""
-        # Initialize HTML to text converter
-        self.html_converter = html2text.HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.ignore_images = True
-        self.html_converter.ignore_tables = False
-        self.html_converter.body_width = 0  # No wrapping
+        # Initialize HTML to markdown converter; markdownify works on the parsed
+        # tree, html2text has to parse the HTML again
+        if MARKDOWNIFY_AVAILABLE:
+            self.markdown_converter = _MarkdownConverter(heading_style="ATX", strip=["img"])
+        else:
+            self.html_converter = html2text.HTML2Text()
+            self.html_converter.ignore_links = False
+            self.html_converter.ignore_images = True
+            self.html_converter.ignore_tables = False
+            self.html_converter.body_width = 0  # No wrapping
+
+        # HTTP session so repeat browses reuse keep-alive connections, with
+        # retries for transient gateway errors
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=SESSION_POOL_CONNECTIONS, pool_maxsize=SESSION_POOL_MAXSIZE, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Request headers, built once
+        self._default_headers = {
+            "User-Agent": BROWSER_CONFIG.get("user_agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Referer": "https://www.google.com/",
+            "DNT": "1",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+        }
+        self._timeout = (CONNECT_TIMEOUT, BROWSER_CONFIG.get("timeout", 30))
 
         # Initialize session history
         self.session_history = []
         self.current_page_info = None
 
+        # Recently browsed pages by normalized URL, so repeat browses skip the network
+        self.page_cache_ttl = BROWSER_CONFIG.get("page_cache_ttl", 900)
+        self._page_cache = TTLCache(BROWSER_CONFIG.get("page_cache_size", 256), self.page_cache_ttl)
+
+        # Pages fetched ahead by search and search_and_browse_topk, by URL, handed
+        # out once by browse; fetches still in flight are kept as futures
+        self.prefetch_results = BROWSER_CONFIG.get("prefetch_results", 3)
+        self._prefetch_cache = {}
+        self._prefetch_futures = {}
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="streamlit-prefetch")
+
         if DEBUG:
             print(f"SuperNova Streamlit browser tool initialized")
 
@@ -61,6 +190,10 @@ class StreamlitBrowser:
                     "source": "search",
                 })
 
+            # Start loading the top results, which are likely to be browsed next
+            if self.prefetch_results > 0:
+                self._prefetch([result["url"] for result in processed_results[:self.prefetch_results] if result["url"]])
+
             return {
                 "status": "success",
                 "query": query,
@@ -87,57 +220,88 @@ class StreamlitBrowser:
             A dictionary containing the page content and metadata
         """
         # Validate URL
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+        url = self._absolute_url(url)
+
+        result = self._load(url)
+        if result["status"] == "success":
+            self._record_visit(result)
+        return result
+
+    def _load(self, url: str) -> Dict[str, Any]:
+        """
+        Get a page from the caches or a prefetch in flight, fetching it if neither has it.
 
+        Args:
+            url: Absolute URL to load
+
+        Returns:
+            A dictionary containing the page content and metadata
+        """
+        # Use a recently browsed page, or one prefetched in the background
+        result = self._page_cache.get(self._cache_key(url)) if self.page_cache_ttl > 0 else None
+        if result is not None:
+            if DEBUG:
+                print(f"Using cached page for {url}")
+            result = dict(result)
+        else:
+            with self._prefetch_lock:
+                result = self._prefetch_cache.pop(url, None)
+                future = self._prefetch_futures.pop(url, None)
+            if result is None and future is not None:
+                # The page is already loading; waiting for it beats starting over
+                result = future.result()
+                if result["status"] != "success":
+                    result = None
+            if result is None:
+                result = self._fetch(url)
+            elif DEBUG:
+                print(f"Using prefetched page for {url}")
+        return result
+
+    def _fetch(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch a webpage and extract its content, without recording it in the session history.
+
+        Args:
+            url: Absolute URL to fetch
+
+        Returns:
+            A dictionary containing the page content and metadata
+        """
         print(f"Browsing URL: {url}")
 
         try:
-            # Set up headers
-            headers = {
-                "User-Agent": BROWSER_CONFIG.get("user_agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Referer": "https://www.google.com/",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
+            # Make the request over the pooled session, reading the body only once the headers check out
+            with self.session.get(url, headers=self._default_headers, timeout=self._timeout, stream=True) as response:
+                response.raise_for_status()  # Raise an exception for 4XX/5XX responses
+                body = self._read_page(response)
 
-            # Make the request
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()  # Raise an exception for 4XX/5XX responses
+                # Get the final URL (after redirects)
+                final_url = response.url
 
-            # Get the final URL (after redirects)
-            final_url = response.url
+                # Only a charset named in the headers overrides what the parser detects from the page
+                content_type = response.headers.get("Content-Type", "")
+                encoding = response.encoding if "charset" in content_type.lower() else None
 
             # Parse the HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(body, SOUP_PARSER, from_encoding=encoding)
 
             # Get the title
             title = soup.title.string if soup.title else url
 
             # Extract main content
-            main_content = self._extract_main_content(soup)
+            main_tag = self._extract_main_content(soup)
+            main_content = str(main_tag)
 
             # Convert HTML to markdown
-            markdown_content = self.html_converter.handle(main_content)
+            markdown_content = self._to_markdown(main_tag)
 
             # Extract links
             links = self._extract_links(soup, final_url)
             print(f"Extracted {len(links)} links from the page")
 
-            # Add to session history
-            page_info = {
-                "url": final_url,
-                "title": title,
-                "timestamp": time.time(),
-            }
-            self.session_history.append(page_info)
-            self.current_page_info = page_info
-
             print("Browsing complete. Returning page content.")
-            return {
+            result = {
                 "status": "success",
                 "url": final_url,
                 "title": title,
@@ -147,6 +311,9 @@ class StreamlitBrowser:
                 "screenshot": None,  # No screenshot in this version
                 "method": "requests",
             }
+            if self.page_cache_ttl > 0:
+                self._page_cache.put(self._cache_key(url), result)
+            return dict(result)
 
         except Exception as e:
             error_msg = f"Error browsing {url}: {str(e)}"
@@ -158,7 +325,122 @@ class StreamlitBrowser:
                 "url": url,
             }
 
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
+    def _read_page(self, response: requests.Response) -> bytes:
+        """
+        Read an HTML response body, refusing other content types and oversized pages.
+
+        Args:
+            response: Streamed response whose body has not been read
+
+        Returns:
+            Up to MAX_PAGE_BYTES of the decompressed body
+
+        Raises:
+            ValueError: If the response is not HTML or declares a length over MAX_PAGE_BYTES
+        """
+        # A missing Content-Type is given the benefit of the doubt
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            raise ValueError(f"Unsupported content type {content_type}")
+
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > MAX_PAGE_BYTES:
+            raise ValueError(f"Page is {int(content_length)} bytes, over the {MAX_PAGE_BYTES} byte limit")
+
+        body = bytearray()
+        for chunk in response.iter_content(_READ_CHUNK):
+            body += chunk
+            if len(body) >= MAX_PAGE_BYTES:
+                if DEBUG:
+                    print(f"Truncating {response.url} at {MAX_PAGE_BYTES} bytes")
+                del body[MAX_PAGE_BYTES:]
+                break
+        return bytes(body)
+
+    def invalidate(self, url: str):
+        """
+        Drop a URL from the page cache, so the next browse fetches it again.
+
+        Args:
+            url: URL to drop
+        """
+        url = self._absolute_url(url)
+        self._page_cache.invalidate(self._cache_key(url))
+        with self._prefetch_lock:
+            self._prefetch_cache.pop(url, None)
+            self._prefetch_futures.pop(url, None)
+
+    def clear_cache(self):
+        """Drop all cached and prefetched pages."""
+        self._page_cache.clear()
+        with self._prefetch_lock:
+            self._prefetch_cache.clear()
+            self._prefetch_futures.clear()
+
+    @staticmethod
+    def _absolute_url(url: str) -> str:
+        """Default a URL without a scheme to https."""
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+        return url
+
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """Normalize a URL for the page cache: lowercase scheme and host, no trailing slash or fragment."""
+        parts = urlsplit(url)
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, ""))
+
+    def _record_visit(self, result: Dict[str, Any]):
+        """
+        Add a browsed page to the session history.
+
+        Args:
+            result: Successful browse result
+        """
+        page_info = {
+            "url": result["url"],
+            "title": result["title"],
+            "timestamp": time.time(),
+        }
+        self.session_history.append(page_info)
+        self.current_page_info = page_info
+
+    def _prefetch(self, urls: List[str]):
+        """
+        Fetch pages in the background for later browse calls.
+
+        Args:
+            urls: URLs to fetch; ones already cached or loading are skipped
+        """
+        for url in map(self._absolute_url, urls):
+            if self.page_cache_ttl > 0 and self._page_cache.get(self._cache_key(url)) is not None:
+                continue
+            with self._prefetch_lock:
+                if url in self._prefetch_cache or url in self._prefetch_futures:
+                    continue
+                future = self._prefetch_pool.submit(self._fetch, url)
+                self._prefetch_futures[url] = future
+            # Outside the lock: a future that is already done runs its callback right away
+            future.add_done_callback(lambda f, url=url: self._finish_prefetch(url, f))
+
+    def _finish_prefetch(self, url: str, future: Future):
+        """Keep a successfully prefetched page for a later browse call, evicting the oldest."""
+        result = None
+        if not future.cancelled() and future.exception() is None:
+            result = future.result()
+
+        with self._prefetch_lock:
+            # A browse call may already have taken the future and its result
+            if self._prefetch_futures.get(url) is not future:
+                return
+            del self._prefetch_futures[url]
+            if result is None or result["status"] != "success":
+                return
+            self._prefetch_cache[url] = result
+            while len(self._prefetch_cache) > PREFETCH_CACHE_SIZE:
+                self._prefetch_cache.pop(next(iter(self._prefetch_cache)))
+
+    def _extract_main_content(self, soup: BeautifulSoup) -> Tag:
         """
         Extract the main content from a webpage.
 
@@ -166,24 +448,12 @@ class StreamlitBrowser:
             soup: BeautifulSoup object
 
         Returns:
-            HTML string of the main content
+            Element holding the main content
         """
         # Try to find the main content
-        main_tags = [
-            soup.find("main"),
-            soup.find(id="main"),
-            soup.find(id="content"),
-            soup.find(id="main-content"),
-            soup.find(class_="main"),
-            soup.find(class_="content"),
-            soup.find(class_="main-content"),
-            soup.find("article"),
-        ]
-
-        # Use the first valid main tag found
-        for tag in main_tags:
-            if tag:
-                return str(tag)
+        main_tag = _find_main_tag(soup)
+        if main_tag is not None:
+            return main_tag
 
         # If no main content found, use the body
         body = soup.find("body")
@@ -191,10 +461,24 @@ class StreamlitBrowser:
             # Remove script and style tags
             for script in body(["script", "style", "nav", "footer", "header"]):
                 script.decompose()
-            return str(body)
+            return body
 
         # If no body found, use the whole HTML
-        return str(soup)
+        return soup
+
+    def _to_markdown(self, tag: Tag) -> str:
+        """
+        Convert a parsed element to markdown.
+
+        Args:
+            tag: Element to convert
+
+        Returns:
+            Markdown text
+        """
+        if MARKDOWNIFY_AVAILABLE:
+            return self.markdown_converter.convert_soup(tag).strip()
+        return self.html_converter.handle(str(tag))
 
     def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
         """
@@ -273,6 +557,67 @@ class StreamlitBrowser:
             "screenshot": None,  # No screenshot in this version
         }
 
+    def search_and_browse_topk(self, query: str, k: int = 3) -> Dict[str, Any]:
+        """
+        Search for a query and fetch the top k results concurrently.
+
+        Returns the highest-ranked result that loads; the other pages keep
+        loading in the background and are handed to later browse calls for
+        their URLs without another request.
+
+        Args:
+            query: Search query
+            k: Number of top results to fetch
+
+        Returns:
+            A dictionary containing the search and browse results
+        """
+        # Search for the query
+        search_result = self.search(query)
+
+        if search_result["status"] != "success" or not search_result["results"]:
+            return {
+                "status": "error",
+                "error": "No search results found",
+                "query": query,
+            }
+
+        # Fetch the top results at once, so the wait is the slowest page rather than their sum
+        candidates = search_result["results"][:max(k, 1)]
+        urls = [self._absolute_url(result["url"]) for result in candidates]
+        executor = ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix="streamlit-prefetch")
+        futures = [executor.submit(self._load, url) for url in urls]
+        executor.shutdown(wait=False)
+
+        # Take the first result in rank order that loaded; later ones are kept as prefetched pages
+        chosen = len(futures) - 1
+        for i, future in enumerate(futures):
+            if future.result()["status"] == "success":
+                chosen = i
+                break
+        for url, future in zip(urls[chosen + 1:], futures[chosen + 1:]):
+            with self._prefetch_lock:
+                self._prefetch_futures[url] = future
+            future.add_done_callback(lambda f, url=url: self._finish_prefetch(url, f))
+
+        top_result = candidates[chosen]
+        browse_result = futures[chosen].result()
+        if browse_result["status"] == "success":
+            self._record_visit(browse_result)
+
+        return {
+            "status": browse_result["status"],
+            "query": query,
+            "search_results": search_result["results"],
+            "top_result": top_result,
+            "browse_result": browse_result,
+            "url": browse_result.get("url", top_result["url"]),
+            "title": browse_result.get("title", top_result["title"]),
+            "content": browse_result.get("content", ""),
+            "links": browse_result.get("links", []),
+            "screenshot": None,  # No screenshot in this version
+        }
+
     def extract_information(self, url: str, information_request: str) -> Dict[str, Any]:
         """
         Extract specific information from a webpage.
@@ -324,27 +669,29 @@ class StreamlitBrowser:
             Extracted information as a string
         """
         # Extract keywords from the information request
-        keywords = re.findall(r'\b\w+\b', information_request.lower())
-        keywords = [k for k in keywords if len(k) > 3 and k not in ["what", "when", "where", "which", "about", "information"]]
+        keywords = frozenset(k for k in _WORD_RE.findall(information_request.lower()) if len(k) > 3 and k not in _STOPWORDS)
+
+        if not keywords:
+            return "Could not find specific information related to your request."
+
+        # One alternation finds every keyword in a paragraph in a single regex scan
+        keyword_re = re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b", re.IGNORECASE)
 
         # Split content into paragraphs
         paragraphs = content.split("\n\n")
 
-        # Score each paragraph based on keyword matches
+        # Score each paragraph by the number of distinct keywords it contains
         scored_paragraphs = []
         for p in paragraphs:
             if len(p.strip()) < 10:  # Skip very short paragraphs
                 continue
 
-            score = sum(1 for k in keywords if k in p.lower())
+            score = len({match.lower() for match in keyword_re.findall(p)})
             if score > 0:
                 scored_paragraphs.append((score, p))
 
-        # Sort by score (highest first)
-        scored_paragraphs.sort(reverse=True)
-
-        # Take the top 5 paragraphs
-        top_paragraphs = [p for _, p in scored_paragraphs[:5]]
+        # Take the top 5 paragraphs (highest score first)
+        top_paragraphs = [p for _, p in heapq.nlargest(5, scored_paragraphs)]
 
         if not top_paragraphs:
             return "Could not find specific information related to your request."
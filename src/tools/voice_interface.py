@@ -2,10 +2,14 @@
 Voice interface tools for SuperNova AI.
 """
 
+import io
 import os
 import base64
+import hashlib
 import tempfile
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, Any, List
 from ..config.env import DEBUG
 
 # Check for speech recognition library
@@ -22,6 +26,13 @@ try:
 except ImportError:
     PYTTSX3_AVAILABLE = False
 
+# Seconds to wait for Google before settling for the offline Sphinx result
+GOOGLE_RECOGNITION_TIMEOUT = 8
+
+# Limits for synthesized speech kept in memory, by number of phrases and total base64 size
+TTS_CACHE_SIZE = 64
+TTS_CACHE_MAX_BYTES = 10 * 1024 * 1024
+
 class VoiceInterface:
     """Voice interface for speech recognition and text-to-speech."""
 
@@ -29,7 +40,14 @@ class VoiceInterface:
         """Initialize the voice interface."""
         # Initialize speech recognition if available
         self.recognizer = sr.Recognizer() if SPEECH_RECOGNITION_AVAILABLE else None
+
+        # Threads running the online and offline recognizers side by side
+        self._recognizer_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="speech") if SPEECH_RECOGNITION_AVAILABLE else None
         
+        # Synthesized speech as base64, by hash of voice and text; least recently used first
+        self._tts_cache = OrderedDict()
+        self._tts_cache_bytes = 0
+
         # Initialize text-to-speech engine if available
         self.tts_engine = None
         if PYTTSX3_AVAILABLE:
@@ -71,27 +89,28 @@ class VoiceInterface:
             }
         
         try:
-            # Save audio data to a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_file_path = temp_file.name
-            
-            # Recognize speech from the temporary file
-            with sr.AudioFile(temp_file_path) as source:
+            # Recognize speech straight from memory; AudioFile reads file-like objects
+            with sr.AudioFile(io.BytesIO(audio_data)) as source:
                 audio = self.recognizer.record(source)
                 
-                # Try to recognize with Google (requires internet)
+                # Start Google (requires internet) and Sphinx (offline) together, so the
+                # fallback result is ready, or nearly, by the time Google fails
+                google = self._recognizer_pool.submit(self.recognizer.recognize_google, audio)
+                sphinx = self._recognizer_pool.submit(self.recognizer.recognize_sphinx, audio)
+                
+                # Try to recognize with Google
                 try:
-                    text = self.recognizer.recognize_google(audio)
+                    text = google.result(timeout=GOOGLE_RECOGNITION_TIMEOUT)
+                    sphinx.cancel()
                     return {
                         "success": True,
                         "text": text,
                         "engine": "google"
                     }
-                except sr.RequestError:
-                    # If Google fails, try with Sphinx (offline)
+                except (sr.RequestError, FutureTimeoutError):
+                    # If Google fails or is too slow, use Sphinx
                     try:
-                        text = self.recognizer.recognize_sphinx(audio)
+                        text = sphinx.result()
                         return {
                             "success": True,
                             "text": text,
@@ -103,6 +122,7 @@ class VoiceInterface:
                             "error": f"Could not recognize speech: {str(e)}"
                         }
                 except Exception as e:
+                    sphinx.cancel()
                     return {
                         "success": False,
                         "error": f"Could not recognize speech: {str(e)}"
@@ -115,12 +135,6 @@ class VoiceInterface:
                 "success": False,
                 "error": f"Error in speech recognition: {str(e)}"
             }
-        finally:
-            # Clean up the temporary file
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
 
     def text_to_speech(self, text: str, voice: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -141,11 +155,19 @@ class VoiceInterface:
         
         try:
             # Set voice if specified and available
-            if voice:
-                voices = self.tts_engine.getProperty('voices')
-                matching_voices = [v for v in voices if voice.lower() in v.name.lower()]
-                if matching_voices:
-                    self.tts_engine.setProperty('voice', matching_voices[0].id)
+            self._select_voice(voice)
+            
+            # Repeated phrases in the same voice are answered from memory
+            cache_key = self._tts_cache_key(text)
+            audio_base64 = self._tts_cache.get(cache_key)
+            if audio_base64 is not None:
+                self._tts_cache.move_to_end(cache_key)
+                return {
+                    "success": True,
+                    "audio_path": None,
+                    "audio_base64": audio_base64,
+                    "text": text
+                }
             
             # Create a temporary file for the audio
             with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
@@ -159,6 +181,7 @@ class VoiceInterface:
             with open(temp_file_path, "rb") as audio_file:
                 audio_data = audio_file.read()
                 audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+            self._cache_speech(cache_key, audio_base64)
             
             return {
                 "success": True,
@@ -181,5 +204,128 @@ class VoiceInterface:
             except:
                 pass
 
+    def text_to_speech_batch(self, texts: List[str], voice: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Convert several texts to speech with a single run of the speech engine.
+        
+        Each runAndWait call pays the engine's startup and teardown, so phrases
+        synthesized together pay it once instead of once per phrase.
+        
+        Args:
+            texts: Texts to convert to speech
+            voice: Voice to use (if available)
+            
+        Returns:
+            List of dictionaries containing speech synthesis results, one per text
+        """
+        if not PYTTSX3_AVAILABLE or not self.tts_engine:
+            return [{
+                "success": False,
+                "error": "Text-to-speech is not available. Please install the pyttsx3 package."
+            } for _ in texts]
+        
+        results = [None] * len(texts)
+        pending = []
+        try:
+            # Set voice if specified and available
+            self._select_voice(voice)
+            
+            # Answer repeated phrases from memory and queue the rest into their own files
+            for i, text in enumerate(texts):
+                cache_key = self._tts_cache_key(text)
+                audio_base64 = self._tts_cache.get(cache_key)
+                if audio_base64 is not None:
+                    self._tts_cache.move_to_end(cache_key)
+                    results[i] = {
+                        "success": True,
+                        "audio_path": None,
+                        "audio_base64": audio_base64,
+                        "text": text
+                    }
+                    continue
+                
+                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
+                    pending.append((i, cache_key, temp_file.name))
+                self.tts_engine.save_to_file(text, temp_file.name)
+            
+            # Generate all queued speech in one engine run
+            if pending:
+                self.tts_engine.runAndWait()
+            
+            # Read the audio files
+            for i, cache_key, temp_file_path in pending:
+                with open(temp_file_path, "rb") as audio_file:
+                    audio_base64 = base64.b64encode(audio_file.read()).decode("utf-8")
+                self._cache_speech(cache_key, audio_base64)
+                results[i] = {
+                    "success": True,
+                    "audio_path": temp_file_path,
+                    "audio_base64": audio_base64,
+                    "text": texts[i]
+                }
+            
+            return results
+            
+        except Exception as e:
+            if DEBUG:
+                print(f"Error in text-to-speech: {e}")
+            error = {
+                "success": False,
+                "error": f"Error in text-to-speech: {str(e)}"
+            }
+            return [result if result is not None else dict(error) for result in results]
+        finally:
+            # Clean up the temporary files
+            for _, _, temp_file_path in pending:
+                try:
+                    os.unlink(temp_file_path)
+                except OSError:
+                    pass
+
+    def _select_voice(self, voice: Optional[str]):
+        """
+        Switch the engine to the first voice whose name contains the given name.
+        
+        Args:
+            voice: Voice name to look for, or None to keep the current voice
+        """
+        if voice:
+            voices = self.tts_engine.getProperty('voices')
+            matching_voices = [v for v in voices if voice.lower() in v.name.lower()]
+            if matching_voices:
+                self.tts_engine.setProperty('voice', matching_voices[0].id)
+
+    def _tts_cache_key(self, text: str) -> bytes:
+        """
+        Build the speech cache key for text in the engine's current voice.
+        
+        Args:
+            text: Text to be spoken
+            
+        Returns:
+            A 16-byte digest of the voice ID and text
+        """
+        voice_id = self.tts_engine.getProperty('voice') or ""
+        return hashlib.blake2b(f"{voice_id}\0{text}".encode("utf-8"), digest_size=16).digest()
+    
+    def _cache_speech(self, key: bytes, audio_base64: str):
+        """
+        Keep synthesized speech, evicting the least recently used phrases over the limits.
+        
+        Args:
+            key: Cache key from _tts_cache_key
+            audio_base64: Base64-encoded audio
+        """
+        if len(audio_base64) > TTS_CACHE_MAX_BYTES:
+            return
+        previous = self._tts_cache.pop(key, None)
+        if previous is not None:
+            self._tts_cache_bytes -= len(previous)
+        self._tts_cache[key] = audio_base64
+        self._tts_cache_bytes += len(audio_base64)
+        while len(self._tts_cache) > TTS_CACHE_SIZE or self._tts_cache_bytes > TTS_CACHE_MAX_BYTES:
+            _, evicted = self._tts_cache.popitem(last=False)
+            self._tts_cache_bytes -= len(evicted)
+
 # Create a singleton instance
 voice_interface = VoiceInterface()
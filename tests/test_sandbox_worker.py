@@ -0,0 +1,42 @@
+"""
+Tests for the sandbox's warm Python worker.
+"""
+
+import os
+import sys
+
+import pytest
+
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "tools")
+sys.path.insert(0, TOOLS_DIR)
+
+from _repl_worker import WorkerProcess
+
+@pytest.fixture
+def worker():
+    """Start a sandbox worker and kill it after the test."""
+    process = WorkerProcess(os.path.join(TOOLS_DIR, "_sandbox_worker.py"), "test-sandbox")
+    yield process
+    process.kill()
+
+def run(worker, code):
+    """Run code on the worker the way the sandbox does."""
+    return worker.request({
+        "code": code,
+        "filename": "<sandbox>",
+        "directory": os.getcwd(),
+        "max_output": 10000,
+    }, 30)
+
+def test_child_process_output_is_captured(worker):
+    result = run(worker, 'import os\nprint("hi")\nos.system("echo from-child")\nos.write(2, b"raw\\n")')
+    assert result["returncode"] == 0
+    assert result["stdout"] == "hi\nfrom-child\n"
+    assert result["stderr"] == "raw\n"
+
+def test_script_state_does_not_leak_between_runs(worker):
+    patched = run(worker, 'import json, os\njson.dumps = lambda *a: "HACK"\nos.environ["SANDBOX_LEAK"] = "1"')
+    assert patched["returncode"] == 0
+
+    result = run(worker, 'import json, os\nprint(json.dumps([1]), os.environ.get("SANDBOX_LEAK"))')
+    assert result["stdout"] == "[1] None\n"